@@ -0,0 +1,39 @@
+import os
+from urllib.parse import unquote
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from core.database import BASE_DIR, get_meeting_db
+from services.json_codec import FastJSONResponse
+from services.artifacts import artifact_path
+from services.conversation_analytics import analyze_arrays, load_segment_arrays, HISTOGRAM_BUCKET_MS, SILENCE_MIN_MS
+from services.rollups import query_rollups
+from services.meeting_repository import resolve_meeting_directory
+
+# 대화 분석 라우터
+router = APIRouter(default_response_class=FastJSONResponse)
+
+# GET: 기간별(일/주) 회의 수와 화자별 발언 시간 (미리 집계된 값만 읽음)
+@router.get("/rollups")
+def get_rollups(
+    grain: Literal["day", "week"] = "week",
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    group_id: Optional[int] = None,
+    db: Session = Depends(get_meeting_db),
+):
+    return query_rollups(db, grain, date_from, date_to, group_id)
+
+# GET: 화자별 분당 단어 수, 끼어들기/겹침, 최장 발언, 침묵 구간, 구간별 발언 시간
+@router.get("/analytics/{directory}")
+def get_conversation_analytics(
+    directory: str,
+    bucket_ms: int = Query(HISTOGRAM_BUCKET_MS, ge=1000),
+    min_gap_ms: int = Query(SILENCE_MIN_MS, ge=0),
+):
+    decoded_dir = resolve_meeting_directory(unquote(directory))
+    result_path = artifact_path(os.path.join(BASE_DIR, "uploaded_files", decoded_dir), "result.json")
+    if result_path is None:
+        raise HTTPException(status_code=404, detail="result.json not found")
+
+    return analyze_arrays(load_segment_arrays(result_path), bucket_ms=bucket_ms, min_gap=min_gap_ms)
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from core.database import get_meeting_db
+from services.json_codec import FastJSONResponse
+from services.job_queue import job_workers, get_job
+
+# 백그라운드 작업(전사/요약) 상태 조회 라우터
+router = APIRouter(default_response_class=FastJSONResponse)
+
+# GET: 작업 대기열 상태 (상태별 개수, 이 프로세스의 워커)
+@router.get("/jobs")
+def get_job_stats():
+    return job_workers.stats()
+
+# GET: 작업 하나의 상태 (/upload, /uploads/{id}/finalize 응답의 job_id)
+@router.get("/jobs/{job_id}")
+def get_job_status(job_id: int, db: Session = Depends(get_meeting_db)):
+    job = get_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job
@@ -1,85 +1,139 @@
 import os
-import json
-import uuid
 import shutil
-from services.transcription_service import transcribe_and_save_to_json
-from datetime import datetime
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Form, UploadFile, File
-from fastapi.responses import JSONResponse
+import services.transcription_service  # "transcribe" 작업 핸들러 등록
+from typing import Optional, Literal
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from urllib.parse import unquote
 from models.meeting_schemas import Meeting
-from fastapi import FastAPI, Body
+from fastapi import Body
 from fastapi.responses import FileResponse
-from pydantic import BaseModel
-import uuid
-from models.meeting_schemas import MeetingData
-
-
-
-# FastApi 라우터 생성
-router = APIRouter()
+from models.meeting_schemas import MeetingData, MeetingInterestedUpdate, MeetingBulkUpdate, MeetingBulkDelete, ReprocessRequest
+from sqlalchemy.orm import Session
+from core.database import get_meeting_db
+from services.meeting_repository import (
+    get_meeting_by_directory,
+    list_meetings_page,
+    list_changes_since,
+    current_seq,
+    insert_meeting,
+    update_meeting,
+    bulk_update_meetings,
+    new_meeting_directory,
+    resolve_meeting_directory,
+)
+from services.meeting_writer import meeting_writer
+from services.meeting_index import meeting_index
+from services.reaper import reaper, delete_meetings
+from services.speaker_stats import load_speaker_stats
+from services.segment_store import open_segment_store
+from services.artifacts import artifact_path, artifact_response
+from services.json_codec import FastJSONResponse
+from services.storage import run_io, makedirs_async
+from services.upload_ingest import ingest_multipart, UploadError, UploadTooLarge
+from services.content_store import store_audio, has_cached_transcript
+from services.job_queue import submit_job_async
+from services.checkpoints import load_checkpoints, plan_stages
+
+
+# /result 세그먼트 페이지 크기와 스트리밍 때 한 번에 읽을 세그먼트 수
+RESULT_PAGE_DEFAULT = 200
+RESULT_PAGE_MAX = 5000
+RESULT_STREAM_CHUNK = 500
+
+
+# FastApi 라우터 생성 (기본 응답은 빠른 JSON 직렬화 사용)
+router = APIRouter(default_response_class=FastJSONResponse)
 
 # 프로젝트 기준 폴더 경로
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-#회의 정보를 저장할 JSON 파일 경로
-MEETINGS_JSON_PATH = os.path.join(BASE_DIR, "meetings.json")
-
 # GET: 회의 조회
 # 그룹별로 데이터 조회 구분
 @router.get("/meetings")
-def get_meetings():
+def get_meetings(
+    group_id: Optional[int] = None,
+    date_from: Optional[str] = Query(None, alias="from"),
+    date_to: Optional[str] = Query(None, alias="to"),
+    is_interested: Optional[bool] = None,
+    is_ended: Optional[bool] = None,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_meeting_db),
+):
+    is_paged = any(v is not None for v in (date_from, date_to, is_interested, is_ended, limit, cursor))
     try:
-        with open(MEETINGS_JSON_PATH, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return JSONResponse(content=data, media_type="application/json; charset=utf-8")
-    except FileNotFoundError:
-        #파일이 없으면 빈 딕셔너리 반환
-        return JSONResponse(content={}, media_type="application/json; charset=utf-8")
+        if not is_paged:
+            # 메모리에 직렬화해 둔 응답을 그대로 보냅니다. (저장소가 바뀌었을 때만 다시 만듦)
+            payload = meeting_index.get_payload(group_id)
+            return Response(content=payload, media_type="application/json; charset=utf-8")
+
+        # 조건/페이지가 지정되면 (date, id) 인덱스로 필요한 만큼만 읽습니다.
+        meetings, next_cursor = list_meetings_page(
+            db,
+            date_from=date_from,
+            date_to=date_to,
+            is_interested=is_interested,
+            is_ended=is_ended,
+            group_id=group_id,
+            limit=limit or 100,
+            cursor=cursor,
+        )
+        return FastJSONResponse(content={"meetings": meetings, "next_cursor": next_cursor})
+    except ValueError:
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다.")
     except Exception as e:
-        print(f"Error reading meetings.json: {e}")
-        raise HTTPException(status_code=500, detail="서버에서 파일을 읽는 중 오류가 발생했습니다.")
-    
+        print(f"Error reading meetings: {e}")
+        raise HTTPException(status_code=500, detail="서버에서 회의 목록을 읽는 중 오류가 발생했습니다.")
+
+# GET: 변경 동기화 (since 이후의 추가/수정/삭제만 반환)
+@router.get("/meetings/changes")
+def get_meeting_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=5000),
+    db: Session = Depends(get_meeting_db),
+):
+    # 한 세션(읽기 트랜잭션) 안에서 읽으므로 latest와 변경 목록은 같은 시점 기준입니다.
+    latest = current_seq(db)
+    changes, has_more = list_changes_since(db, since, limit)
+    if has_more:
+        # 남은 변경은 클라이언트가 마지막 seq부터 다시 요청합니다.
+        latest = changes[-1]["seq"]
+    return FastJSONResponse(content={"seq": max(latest, since), "changes": changes, "has_more": has_more})
+
+# GET: 회의 목록 캐시 상태 (hit/miss 카운터)
+@router.get("/meetings/cache_stats")
+def get_meetings_cache_stats():
+    return {"index": meeting_index.stats(), "writer": meeting_writer.stats()}
+
+# GET: 폴더 삭제 대기열 상태 (대기/완료/실패 수, 되찾은 용량)
+@router.get("/meetings/reaper")
+def get_reaper_stats():
+    return reaper.stats()
+
 # POST: 회의 추가
 # 이 코드가 create_new_meetings의 기존 코드인 듯
 @router.post("/meetings")
 def add_meeting(meeting: Meeting):
     try:
-        #기존 meetings.json 읽기
-        if os.path.exists(MEETINGS_JSON_PATH):
-            with open(MEETINGS_JSON_PATH, "r", encoding="utf-8") as f:
-                meetings = json.load(f)
-        else:
-            meetings = {}
-
-        # 새 회의 폴더 이름 생성 : timestamp_이름_uuid
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")    # 폴더 이름
-        safe_name = meeting.name.replace(" ", "_")[:15]         # 랜덤 6자리
-        unique_id = uuid.uuid4().hex[:6]
-        directory = f"{timestamp}_{safe_name}_{unique_id}"
+        # 새 회의 ID(= 폴더 이름) 생성 : timestamp_uuid (이름은 메타데이터로만 저장)
+        directory = new_meeting_directory()
 
         # 폴더 생성
         folder_path = os.path.join(BASE_DIR, "uploaded_files", directory)
         os.makedirs(folder_path, exist_ok=True)
 
-        # JSON에 들어갈 회의 객체 생성
-        meeting_obj = {
-            "name": meeting.name,
-            "description": meeting.description,
-            "is_interested": meeting.is_interested,
-            "is_ended": meeting.is_ended,
-            "directory": directory
-        }
-
-        # 날짜별로 회의 리스트 관리
-        if meeting.date not in meetings:
-            meetings[meeting.date] = []
-
-        meetings[meeting.date].append(meeting_obj)
-
-        # meetings.json에 저장
-        with open(MEETINGS_JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump(meetings, f, ensure_ascii=False, indent=2)
+        # 회의 저장소에 한 행 추가 (쓰기 스레드가 커밋할 때까지 대기)
+        meeting_writer.run(
+            insert_meeting,
+            date=meeting.date,
+            name=meeting.name,
+            description=meeting.description,
+            directory=directory,
+            is_interested=meeting.is_interested,
+            is_ended=meeting.is_ended,
+            group_id=meeting.group_id,
+        )
 
         return {"message": "회의가 성공적으로 추가되었습니다!", "directory": directory}
 
@@ -88,71 +142,133 @@ def add_meeting(meeting: Meeting):
         raise HTTPException(status_code=500, detail="회의 추가 중 서버 오류가 발생했습니다.")
     
 # POST: mp3 업로드 & 회의 추가
+# 폼 필드: name, description, date, file, summary_mode, custom_prompt(선택), group_id(선택)
+# 본문을 임시 파일에 받아 두지 않고 읽는 대로 회의 폴더에 씁니다. (services/upload_ingest.py)
 @router.post("/upload")
-async def upload_meeting_with_file(
-    background_tasks: BackgroundTasks,
-    name: str = Form(...),
-    description: str = Form(...),
-    date: str = Form(...),
-    file: UploadFile = File(...),
-    summary_mode: str = Form(...),
-    custom_prompt: str = Form(None),
-):
-    try:
-        upload_root = os.path.join(BASE_DIR, "uploaded_files")
+async def upload_meeting_with_file(request: Request):
+    upload_root = os.path.join(BASE_DIR, "uploaded_files")
 
-        # 고유 폴더 생성
-        safe_name = name.replace(" ", "_")[:15]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = uuid.uuid4().hex[:6]
-        folder_name = f"{timestamp}_{safe_name}_{unique_id}"
-        folder_path = os.path.join(upload_root, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
+    # 고유 폴더 생성 (폴더 이름은 회의 이름과 상관없으므로 본문을 읽기 전에 만듭니다)
+    folder_name = new_meeting_directory()
+    folder_path = os.path.join(upload_root, folder_name)
+    await makedirs_async(folder_path)
 
-        # mp3 저장
-        extension = os.path.splitext(file.filename)[1]
-        mp3_path = os.path.join(folder_path, f"audio{extension}")
-        with open(mp3_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-
-        # meetings.json 업데이트
-        if os.path.exists(MEETINGS_JSON_PATH):
-            with open(MEETINGS_JSON_PATH, "r", encoding="utf-8") as f:
-                meetings = json.load(f)
-        else:
-            meetings = {}
-
-        meeting_obj = {
-            "name": name,
-            "description": description,
-            "is_interested": False,
-            "is_ended": True,
-            "directory": folder_name
-        }
-
-        if date not in meetings:
-            meetings[date] = []
-        meetings[date].append(meeting_obj)
+    try:
+        fields, upload = await ingest_multipart(request, folder_path)
+        missing = [key for key in ("name", "description", "date", "summary_mode") if not fields.get(key)]
+        if upload is None:
+            missing.append("file")
+        if missing:
+            raise UploadError(f"필수 항목이 누락되었습니다: {', '.join(missing)}")
+        group_id = int(fields["group_id"]) if fields.get("group_id") else None
+    except UploadTooLarge as e:
+        await run_io(shutil.rmtree, folder_path, ignore_errors=True)
+        raise HTTPException(status_code=413, detail=str(e))
+    except (UploadError, ValueError) as e:
+        await run_io(shutil.rmtree, folder_path, ignore_errors=True)
+        raise HTTPException(status_code=400, detail=str(e))
+    except BaseException:
+        # 클라이언트 연결 끊김 등
+        await run_io(shutil.rmtree, folder_path, ignore_errors=True)
+        raise
 
-        with open(MEETINGS_JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump(meetings, f, ensure_ascii=False, indent=2)
-        
-        # 백그라운드 작업: mp3 -> 텍스트 변환 + summary 생성
-        background_tasks.add_task(
-            transcribe_and_save_to_json,
-            mp3_path,
-            folder_path,
-            summary_mode,
-            custom_prompt
+    try:
+        print(f"✅ 업로드 저장 완료: {upload.filename} ({upload.size} bytes, sha256 {upload.sha256[:12]})")
+        name, description, date = fields["name"], fields["description"], fields["date"]
+        summary_mode, custom_prompt = fields["summary_mode"], fields.get("custom_prompt") or None
+        mp3_path = upload.path
+        # 녹음을 해시 저장소에 넣습니다. 같은 녹음이 전에 올라왔으면 파일을 공유하고 전사 결과도 재사용합니다.
+        await run_io(store_audio, mp3_path, upload.sha256)
+        cached = await run_io(has_cached_transcript, upload.sha256)
+
+        # 회의 저장소에 한 행 추가
+        await meeting_writer.run_async(
+            insert_meeting,
+            date=date,
+            name=name,
+            description=description,
+            directory=folder_name,
+            is_interested=False,
+            is_ended=True,
+            group_id=group_id,
         )
-
-        return {"message": "회의 정보와 파일이 성공적으로 저장되었습니다!", "directory": folder_name}
+        
+        # 백그라운드 작업: mp3 -> 텍스트 변환 + summary 생성 (작업 대기열에 넣어 재시작해도 이어서 처리)
+        job_id = await submit_job_async("transcribe", {
+            "audio_path": mp3_path,
+            "output_dir": folder_path,
+            "summary_mode": summary_mode,
+            "custom_prompt": custom_prompt,
+            "audio_sha256": upload.sha256,
+        })
+
+        return {
+            "message": "회의 정보와 파일이 성공적으로 저장되었습니다!",
+            "directory": folder_name,
+            "size": upload.size,
+            "sha256": upload.sha256,
+            "cached": cached,
+            "job_id": job_id,
+        }
 
     except Exception as e:
         print(f"Error uploading file: {e}")
         raise HTTPException(status_code=500, detail="파일 업로드 중 서버 오류가 발생했습니다.")
  
 
+
+
+def _find_audio_file(folder_path: str) -> Optional[str]:
+    """회의 폴더의 녹음 파일(audio.<확장자>) 경로. 없으면 None"""
+    for name in os.listdir(folder_path):
+        if name.startswith("audio."):
+            return os.path.join(folder_path, name)
+    return None
+
+
+# POST: 오래됐거나 실패한 처리 단계(전사 -> 요약 -> PDF)만 다시 실행
+# 본문(선택): summary_mode, custom_prompt, force. 요약 모드만 바꾸면 STT는 다시 하지 않습니다.
+@router.post("/reprocess/{directory}")
+async def reprocess_meeting(directory: str, request: Optional[ReprocessRequest] = Body(None)):
+    request = request or ReprocessRequest()
+    decoded_dir = await run_io(resolve_meeting_directory, unquote(directory))
+    folder_path = os.path.join(BASE_DIR, "uploaded_files", decoded_dir)
+    if not await run_io(os.path.isdir, folder_path):
+        raise HTTPException(status_code=404, detail="회의 폴더를 찾을 수 없습니다.")
+
+    checkpoints = await run_io(load_checkpoints, decoded_dir)
+    if request.summary_mode:
+        summary_mode, custom_prompt = request.summary_mode, request.custom_prompt
+    else:
+        last = checkpoints.get("summary", {}).get("params", {})
+        summary_mode, custom_prompt = last.get("summary_mode", "기본"), last.get("custom_prompt")
+
+    # 회의 폴더는 바뀌지 않으므로 기록된 녹음 해시를 그대로 씁니다. (큰 파일을 다시 해시하지 않음)
+    stages = await run_io(plan_stages, checkpoints, folder_path, None, summary_mode, custom_prompt, tuple(request.force))
+    if not stages:
+        return {"message": "모든 단계가 최신입니다.", "directory": decoded_dir, "stages": [], "job_id": None}
+
+    audio_path = await run_io(_find_audio_file, folder_path)
+    if "transcript" in stages and audio_path is None:
+        raise HTTPException(status_code=409, detail="녹음 파일이 없어 전사를 다시 할 수 없습니다.")
+
+    transcript = checkpoints.get("transcript")
+    job_id = await submit_job_async("transcribe", {
+        "audio_path": audio_path or "",
+        "output_dir": folder_path,
+        "summary_mode": summary_mode,
+        "custom_prompt": custom_prompt,
+        "audio_sha256": transcript["input_hash"] if transcript else None,
+        "force": list(request.force),
+    })
+    return {
+        "message": f"{', '.join(stages)} 단계를 다시 실행합니다.",
+        "directory": decoded_dir,
+        "stages": stages,
+        "summary_mode": summary_mode,
+        "job_id": job_id,
+    }
+
     
 # 새로운 회의
 @router.post("/create_new_meeting")
@@ -161,48 +277,28 @@ async def create_new_meeting(meeting_data: MeetingData):
         print("📥 [create_new_meeting] POST 요청 수신됨")
         print(f"📌 회의명: {meeting_data.name}, 날짜: {meeting_data.date}, 설명: {meeting_data.description}")
 
-        # 회의 데이터를 저장할 meetings.json 파일 경로를 설정합니다.
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        meetings_path = os.path.join(base_dir, "meetings.json")
-
-        # 기존 meetings.json 파일이 있으면 불러오고, 없으면 빈 딕셔너리를 만듭니다.
-        if os.path.exists(meetings_path):
-            with open(meetings_path, "r", encoding="utf-8") as f:
-                meetings = json.load(f)
-        else:
-            meetings = {}
-
         # 업로드 파일의 루트 디렉토리를 설정합니다.
-        upload_root = os.path.join(base_dir, "uploaded_files")
+        upload_root = os.path.join(BASE_DIR, "uploaded_files")
 
-        # 회의명으로 안전한 폴더 이름 생성
-        safe_name = meeting_data.name.replace(" ", "_")[:15]
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = uuid.uuid4().hex[:6]
-        folder_name = f"{timestamp}_{safe_name}_{unique_id}"
+        # 고유 폴더 이름(회의 ID) 생성
+        folder_name = new_meeting_directory()
         folder_path = os.path.join(upload_root, folder_name)
 
         # 실제로 폴더를 생성합니다.
-        os.makedirs(folder_path, exist_ok=True)
+        await makedirs_async(folder_path)
         print(f"✅ 고유 폴더 생성 완료: {folder_path}")
 
-        # 회의 정보를 담을 객체를 만듭니다.
-        meeting_obj = {
-            "name": meeting_data.name,
-            "description": meeting_data.description,
-            "is_interested": meeting_data.is_interested,
-            "is_ended": meeting_data.is_ended,
-            "directory": folder_name
-        }
-
-        # 날짜별로 회의 목록을 그룹화하여 저장합니다.
-        if meeting_data.date not in meetings:
-            meetings[meeting_data.date] = []
-        meetings[meeting_data.date].append(meeting_obj)
-
-        # 수정된 내용을 meetings.json 파일에 저장합니다.
-        with open(meetings_path, "w", encoding="utf-8") as f:
-            json.dump(meetings, f, ensure_ascii=False, indent=2)
+        # 회의 정보를 저장소에 한 행으로 추가합니다.
+        await meeting_writer.run_async(
+            insert_meeting,
+            date=meeting_data.date,
+            name=meeting_data.name,
+            description=meeting_data.description,
+            directory=folder_name,
+            is_interested=meeting_data.is_interested,
+            is_ended=meeting_data.is_ended,
+            group_id=meeting_data.group_id,
+        )
 
         print("✅ 회의 정보 저장 완료")
         
@@ -217,119 +313,14 @@ async def create_new_meeting(meeting_data: MeetingData):
         return {"error": str(e)}
 
 
-# @router.post("/create_new_meetings")
-# async def upload_meeting_aac(
-#     background_tasks: BackgroundTasks,
-#     meetingName: str = Form(...),
-#     meetingDescription: str = Form(...),
-#     meetingDate: str = Form(...),
-#     # file: UploadFile = File(...)
-# ):
-#     try:
-#         # ✅ 요청 수신 로그 추가
-#         print("📥 [upload_meeting_aac] POST 요청 수신됨")
-#         print(f"📌 회의명: {meetingName}, 날짜: {meetingDate}, 설명: {meetingDescription}")
-#         print(f"📁 업로드된 파일명: {file.filename}, 콘텐츠 타입: {file.content_type}")
-
-#         # 기본 디렉토리 설정
-#         base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-#         upload_root = os.path.join(base_dir, "uploaded_files")
-
-#         # 폴더 생성
-#         safe_name = meetingName.replace(" ", "_")[:15]
-#         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-#         unique_id = uuid.uuid4().hex[:6]
-#         folder_name = f"{timestamp}_{safe_name}_{unique_id}"
-#         folder_path = os.path.join(upload_root, folder_name)
-#         os.makedirs(folder_path, exist_ok=True)
-
-#         # AAC 저장
-#         aac_path = os.path.join(folder_path, "audio.aac")
-#         try:
-#             with open(aac_path, "wb") as buffer:
-#                 shutil.copyfileobj(file.file, buffer)
-#             print(f"✅ AAC 파일 저장 완료: {aac_path}")
-#         except Exception as e:
-#             print(f"❌ AAC 저장 중 오류: {repr(e)}")
-
-#         # meetings.json 기록 추가
-#         print("📝 meetings.json 기록 준비 중")
-#         meetings_path = os.path.join(base_dir, "meetings.json")
-#         if os.path.exists(meetings_path):
-#             with open(meetings_path, "r", encoding="utf-8") as f:
-#                 meetings = json.load(f)
-#         else:
-#             meetings = {}
-
-#         meeting_obj = {
-#             "name": meetingName,
-#             "description": meetingDescription,
-#             "is_interested": False,
-#             "is_ended": True,
-#             "directory": folder_name
-#         }
-
-#         if meetingDate not in meetings:
-#             meetings[meetingDate] = []
-#         meetings[meetingDate].append(meeting_obj)
-
-#         with open(meetings_path, "w", encoding="utf-8") as f:
-#             json.dump(meetings, f, ensure_ascii=False, indent=2)
-
-#         # 백그라운드 작업 등록
-#         summary_mode = "기본"
-#         custom_prompt = None
-
-#         print(f"🟡 백그라운드 작업 등록 시작: {aac_path}")
-#         background_tasks.add_task(
-#             transcribe_and_save_to_json,
-#             aac_path,
-#             folder_path,
-#             summary_mode,
-#             custom_prompt
-#         )
-
-#         return {"message": "✅ AAC 파일 업로드 및 처리 시작", "directory": folder_name}
-
-#     except Exception as e:
-#         print("🔴 에러 발생:", e)
-#         return JSONResponse(status_code=500, content={"error": str(e)})
-
-
 # DELETE: 회의 삭제
 @router.delete("/delete/{directory}")
 def delete_meeting(directory: str):
     try:
-        # base_dir = os.path.dirname(__file__)
-        base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        folder_path = os.path.join(base_dir, "uploaded_files", directory)
-        meetings_path = os.path.join(base_dir, "meetings.json")
-
-        # uploaded_files에서 폴더 삭제
-        if os.path.exists(folder_path):
-            shutil.rmtree(folder_path)
-        else:
-            print("❗ 폴더가 존재하지 않음:", folder_path)
-
-        # meetings.json에서 해당 directory를 가진 회의 제거
-        if os.path.exists(meetings_path):
-            with open(meetings_path, "r", encoding="utf-8") as f:
-                meetings = json.load(f)
-
-            modified = False
-            for date in list(meetings.keys()):
-                original_len = len(meetings[date])
-                meetings[date] = [m for m in meetings[date] if m.get("directory") != directory]
-                if len(meetings[date]) < original_len:
-                    modified = True
-                if not meetings[date]:
-                    del meetings[date]  # 빈 날짜 제거
-
-            if modified:
-                with open(meetings_path, "w", encoding="utf-8") as f:
-                    json.dump(meetings, f, ensure_ascii=False, indent=2)
-            else:
-                print("❗ meetings.json에서 해당 데이터 못 찾음")
+        # 저장소에서는 바로 tombstone 처리하고, 폴더는 .trash로 옮겨 두면 reaper가 나중에 지웁니다.
+        result = delete_meetings([resolve_meeting_directory(directory)], remove_orphan_folders=True)[0]
+        if not result["ok"]:
+            print("❗ 저장소에서 해당 데이터 못 찾음")
 
         return {"message": f"{directory} 삭제 완료"}
 
@@ -338,36 +329,36 @@ def delete_meeting(directory: str):
         raise HTTPException(status_code=500, detail=str(e))
     
 # 회의 관심 등록
+# (is_interested가 빠지거나 bool이 아니면 NOT NULL 열에 None을 쓰지 않도록 422로 거절합니다)
 @router.patch("/meetings/interested")
-def update_is_interested(data: dict = Body(...)):
-    directory = data.get("directory")
-    new_status = data.get("is_interested")
-
-    meetings_path = os.path.join(os.path.dirname(__file__), "../meetings.json")
-    if not os.path.exists(meetings_path):
-        raise HTTPException(status_code=404, detail="meetings.json 파일 없음")
-
-    with open(meetings_path, "r", encoding="utf-8") as f:
-        meetings = json.load(f)
+def update_is_interested(data: MeetingInterestedUpdate):
+    directory = resolve_meeting_directory(data.directory)
 
-    found = False
-    for date in meetings:
-        for meeting in meetings[date]:
-            if meeting.get("directory") == directory:
-                meeting["is_interested"] = new_status
-                found = True
-
-    if not found:
+    if not meeting_writer.run(update_meeting, directory, is_interested=data.is_interested):
         raise HTTPException(status_code=404, detail="해당 회의 찾을 수 없음")
 
-    with open(meetings_path, "w", encoding="utf-8") as f:
-        json.dump(meetings, f, ensure_ascii=False, indent=2)
-
     return {"message": "관심 상태가 업데이트되었습니다!"}
 
+# 여러 회의 일괄 수정 (한 번의 커밋)
+@router.patch("/meetings/bulk")
+def bulk_update(payload: MeetingBulkUpdate):
+    items = [item.model_dump() for item in payload.items]
+    for item in items:
+        item["directory"] = resolve_meeting_directory(item["directory"])
+        if item["date"]:
+            item["date"] = item["date"].split('T')[0]  # editContent와 같이 ISO 날짜에서 날짜만 사용
+    results = meeting_writer.run(bulk_update_meetings, items)
+    return {"results": results, "updated": sum(1 for r in results if r["ok"])}
+
+# 여러 회의 일괄 삭제 (저장소는 한 번에 커밋하고, 폴더는 reaper가 백그라운드에서 삭제)
+@router.delete("/meetings/bulk")
+def bulk_delete(payload: MeetingBulkDelete):
+    results = delete_meetings([resolve_meeting_directory(d) for d in payload.directories])
+    return {"results": results, "deleted": sum(1 for r in results if r["ok"])}
+
 # 회의 내용 수정
 @router.patch("/meetings/editContent")
-async def edit_meeting_content(payload: dict):
+async def edit_meeting_content(payload: dict, db: Session = Depends(get_meeting_db)):
     directory = payload.get("directory")
     new_name = payload.get("name")
     new_description = payload.get("description")
@@ -376,75 +367,19 @@ async def edit_meeting_content(payload: dict):
     if not directory or not new_name or not new_description:
         raise HTTPException(status_code=400, detail="필수 정보가 누락되었습니다.")
 
-    # 1. uploaded_files 폴더 내 폴더 이름 변경
-    old_folder_path = os.path.join(BASE_DIR, "uploaded_files", directory)
-    
-    # 새 폴더 이름 생성 (다른 POST 함수와 동일한 로직 적용)
-    # 기존 directory에서 timestamp와 uuid를 추출하여 재사용
-    parts = directory.split('_')
-    timestamp = parts[0]
-    unique_id = parts[-1]
-    safe_new_name = new_name.replace(" ", "_")[:15]
-    new_folder_name = f"{timestamp}_{safe_new_name}_{unique_id}"
-    
-    new_folder_path = os.path.join(BASE_DIR, "uploaded_files", new_folder_name)
-
-    try:
-        os.rename(old_folder_path, new_folder_path)
-    except FileNotFoundError:
-        raise HTTPException(status_code=404, detail="폴더를 찾을 수 없습니다.")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"폴더 이름 변경 실패: {e}")
-
-    # 2. meetings.json 파일 내용 변경
-    meetings_file_path = MEETINGS_JSON_PATH  # 전역 변수 MEETINGS_JSON_PATH 사용
-    
-    with open(meetings_file_path, 'r', encoding='utf-8') as f:
-        meetings_data = json.load(f)
-
-    # 기존 날짜에 해당하는 회의 데이터 찾기
-    original_date_str = ""
-    found_meeting = None
-    for date_str, meetings_list in meetings_data.items():
-        for meeting in meetings_list:
-            if meeting.get("directory") == directory:
-                original_date_str = date_str
-                found_meeting = meeting
-                break
-        if found_meeting:
-            break
-
-    if not found_meeting:
+    directory = await run_io(resolve_meeting_directory, directory)
+    if not await run_io(get_meeting_by_directory, db, directory):
         raise HTTPException(status_code=404, detail="해당 회의 데이터를 찾을 수 없습니다.")
-    
-    # 날짜가 변경되었는지 확인
-    new_date_str = new_date.split('T')[0]
-    is_date_changed = (original_date_str != new_date_str)
-
-    if is_date_changed:
-        # 기존 목록에서 삭제
-        meetings_data[original_date_str].remove(found_meeting)
-        if not meetings_data[original_date_str]:
-            del meetings_data[original_date_str]
-
-        # 새 날짜 목록에 추가
-        if new_date_str not in meetings_data:
-            meetings_data[new_date_str] = []
-        
-        found_meeting["name"] = new_name
-        found_meeting["description"] = new_description
-        found_meeting["directory"] = new_folder_name
-        
-        meetings_data[new_date_str].append(found_meeting)
-
-    else:
-        # 날짜가 변경되지 않았다면, 현재 위치에서 수정
-        found_meeting["name"] = new_name
-        found_meeting["description"] = new_description
-        found_meeting["directory"] = new_folder_name
 
-    with open(meetings_file_path, 'w', encoding='utf-8') as f:
-        json.dump(meetings_data, f, indent=4, ensure_ascii=False)
+    # 이름은 메타데이터일 뿐이라 폴더는 그대로 두고 저장소의 행 하나만 수정합니다.
+    # (폴더 경로는 회의 ID(directory)에서 정해지므로 진행 중인 전사/요약 작업도 영향을 받지 않습니다)
+    await meeting_writer.run_async(
+        update_meeting,
+        directory,
+        name=new_name,
+        description=new_description,
+        date=new_date.split('T')[0],
+    )
 
     return {"message": "회의 정보가 성공적으로 수정되었습니다."}
     
@@ -452,18 +387,19 @@ async def edit_meeting_content(payload: dict):
 # GET: summary.json 출력
 # 그룹별 데이터 조회
 @router.get("/summary/{directory}") 
-def get_summary_json(directory: str):
+def get_summary_json(directory: str, request: Request):
     try:
-        decoded_dir = unquote(directory)    #URL 디코딩
-        summary_path = os.path.join(BASE_DIR, "uploaded_files", decoded_dir, "summary.json")
+        decoded_dir = resolve_meeting_directory(unquote(directory))    #URL 디코딩
+        summary_path = artifact_path(os.path.join(BASE_DIR, "uploaded_files", decoded_dir), "summary.json")
 
-        if os.path.exists(summary_path):
-            with open(summary_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return JSONResponse(content=data, media_type="application/json; charset=utf-8")
+        if summary_path is not None:
+            # 저장된 (압축) 바이트를 그대로 보냅니다.
+            return artifact_response(summary_path, request)
         else:
             raise HTTPException(status_code=404, detail="summary.json not found")
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error reading summary.json for {directory}: {e}")
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다.")
@@ -473,60 +409,86 @@ def get_summary_json(directory: str):
 @router.get("/ratio/{directory}")
 def get_speaker_ratio_for_directory(directory: str):
     try:
-        decoded_dir = unquote(directory)
-        result_path = os.path.join(BASE_DIR, "uploaded_files", decoded_dir, "result.json")
-
-        if not os.path.exists(result_path):
+        decoded_dir = resolve_meeting_directory(unquote(directory))
+        stats = load_speaker_stats(os.path.join(BASE_DIR, "uploaded_files", decoded_dir))
+        if stats is None:
             raise HTTPException(status_code=404, detail="result.json not found")
 
-        with open(result_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        # 발언 시간 계산
-        durations = {}
-        for seg in data.get("segments", []):
-            sp = seg.get("speaker")
-            start_time = seg.get("start", 0) or 0
-            end_time = seg.get("end", 0) or 0
-            dur = end_time - start_time
-            
-            durations[sp] = durations.get(sp, 0) + dur
-
-        total = sum(durations.values())
-        if total == 0:
-            return JSONResponse(content={sp: 0 for sp in durations}, media_type="application/json; charset=utf-8")
-
-        # 비율 계산
-        ratios = {sp: round((dur / total) * 100, 1) for sp, dur in durations.items()}
-        return JSONResponse(content=ratios, media_type="application/json; charset=utf-8")
+        # 전사 시점에 계산해 둔 stats.json의 비율을 그대로 돌려줍니다.
+        return FastJSONResponse(content=stats["ratios"])
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error calculating ratio for {directory}: {e}")
         raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다.")
 
+# 화자별 발언 시간/횟수/비율
+@router.get("/stats/{directory}")
+def get_speaker_stats_for_directory(directory: str):
+    decoded_dir = resolve_meeting_directory(unquote(directory))
+    stats = load_speaker_stats(os.path.join(BASE_DIR, "uploaded_files", decoded_dir))
+    if stats is None:
+        raise HTTPException(status_code=404, detail="result.json not found")
+    return FastJSONResponse(content=stats)
+
 #result.json 파일 출력
+# 파라미터가 없으면 파일 전체, offset/limit 또는 from_ms/to_ms가 있으면 해당 세그먼트만 반환합니다.
+# format=ndjson이면 세그먼트를 한 줄에 하나씩 읽는 대로 스트리밍합니다.
 @router.get("/result/{directory}")
-def get_result_json(directory: str):
+def get_result_json(
+    directory: str,
+    request: Request,
+    offset: Optional[int] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=RESULT_PAGE_MAX),
+    from_ms: Optional[int] = Query(None, ge=0),
+    to_ms: Optional[int] = Query(None, ge=0),
+    format: Literal["json", "ndjson"] = "json",
+):
     try:
-        decoded_dir = unquote(directory)
+        decoded_dir = resolve_meeting_directory(unquote(directory))
         # base_dir = os.path.dirname(__file__)
         # base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        result_path = os.path.join(BASE_DIR, "uploaded_files", decoded_dir, "result.json")
-
-        if os.path.exists(result_path):
-            with open(result_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return JSONResponse(content=data, media_type="application/json; charset=utf-8")
-        else:
-            return JSONResponse(content={"error": "result.json not found"}, status_code=404)
+        result_path = artifact_path(os.path.join(BASE_DIR, "uploaded_files", decoded_dir), "result.json")
+
+        if result_path is None:
+            return FastJSONResponse(content={"error": "result.json not found"}, status_code=404)
+
+        paged = any(v is not None for v in (offset, limit, from_ms, to_ms))
+        if format == "json" and not paged:
+            # 다시 파싱하지 않고 저장된 (압축) 바이트를 그대로 보냅니다.
+            return artifact_response(result_path, request)
+
+        # 열 단위 사본(segments.col)으로 필요한 부분만 읽습니다. (파일 전체를 파싱하지 않음)
+        store = open_segment_store(result_path)
+        selected = store.select(from_ms, to_ms)
+        total = len(selected)
+        start = offset or 0
+        if format == "ndjson":
+            end = total if limit is None else start + limit
+            return StreamingResponse(_stream_segments(store, selected[start:end]), media_type="application/x-ndjson")
+
+        end = start + (limit or RESULT_PAGE_DEFAULT)
+        page = selected[start:end]
+        return FastJSONResponse(content={
+            "segments": store.read(page),
+            "total": total,
+            "offset": start,
+            "next_offset": end if end < total else None,
+        })
     except Exception as e:
-        return JSONResponse(content={"error": str(e)}, status_code=500)
-    
+        return FastJSONResponse(content={"error": str(e)}, status_code=500)
+
+
+def _stream_segments(store, selected):
+    for i in range(0, len(selected), RESULT_STREAM_CHUNK):
+        yield store.read_ndjson(selected[i:i + RESULT_STREAM_CHUNK])
+
 @router.get("/pdf/{directory}")
 def get_summary_pdf(directory: str):
     try:
         # URL에서 인코딩된 디렉토리 이름을 디코딩
-        decoded_dir = unquote(directory)
+        decoded_dir = resolve_meeting_directory(unquote(directory))
         
         # PDF 파일의 전체 경로를 만듭니다.
         pdf_path = os.path.join(BASE_DIR, "uploaded_files", decoded_dir, "summary.pdf")
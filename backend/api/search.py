@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from core.database import get_meeting_db
+from services.json_codec import FastJSONResponse
+from services.search_index import search
+
+# 전문 검색 라우터
+router = APIRouter(default_response_class=FastJSONResponse)
+
+# GET: 전사/요약 전문 검색 (한국어 bigram 색인)
+# truncated: 너무 흔한 검색어라 후보 문서 일부만 보고 순위를 매겼으면 true
+@router.get("/search")
+def search_meetings(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_meeting_db),
+):
+    hits, truncated = search(db, q, limit)
+    return {"query": q, "hits": hits, "truncated": truncated}
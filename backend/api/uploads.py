@@ -0,0 +1,195 @@
+import os
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+from core.database import get_meeting_db
+from models.meeting_schemas import UploadCreate
+from models.meeting_tables import UploadSession
+from services.json_codec import FastJSONResponse
+from services.meeting_repository import new_meeting_directory
+from services.meeting_writer import meeting_writer
+from services.reaper import delete_meetings
+from services.storage import run_io, makedirs_async
+from services.job_queue import submit_job_async
+import services.transcription_service  # "transcribe" 작업 핸들러 등록
+from services.upload_ingest import UPLOAD_MAX_BYTES, UPLOAD_WRITE_CHUNK
+from services.content_store import file_sha256, store_audio, has_cached_transcript
+from services.upload_sessions import (
+    UPLOAD_ROOT,
+    audio_path,
+    part_path,
+    current_offset,
+    session_info,
+    open_part_for_append,
+    create_upload_session,
+    claim_upload_session,
+    release_upload_session,
+    finalize_upload_session,
+    abort_upload_session,
+    stale_upload_sessions,
+    ACTIVE_STATUSES,
+)
+
+# 이어 올리기 업로드 라우터
+# 1) POST /uploads 로 세션을 만들고  2) PUT /uploads/{id}?offset=N 으로 조각을 차례로 올리고
+# 3) 끊기면 GET /uploads/{id} 로 offset을 확인해 거기서부터 다시 올리고  4) POST /uploads/{id}/finalize
+# 같은 세션에 조각/finalize가 동시에 들어오지 않도록, 세션 상태를 DB에서 조건부로 바꿔 잠금으로 씁니다.
+router = APIRouter(default_response_class=FastJSONResponse)
+
+
+def _get_session(db: Session, upload_id: str) -> UploadSession:
+    session = db.get(UploadSession, upload_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    return session
+
+
+def _offset_conflict(offset: int, detail: str):
+    return HTTPException(status_code=409, detail={"message": detail, "offset": offset})
+
+
+async def _abort(upload_id: str, directory: str, statuses: tuple = ("uploading",)):
+    if await meeting_writer.run_async(abort_upload_session, upload_id, statuses):
+        # 회의 행이 없으므로 폴더만 .trash로 옮겨 reaper가 지우게 합니다.
+        await run_io(delete_meetings, [directory], remove_orphan_folders=True)
+
+
+async def _expire_stale_sessions(db: Session):
+    for upload_id in await run_io(stale_upload_sessions, db):
+        session = db.get(UploadSession, upload_id)
+        print(f"🧹 오래된 업로드 세션 정리: {upload_id}")
+        await _abort(upload_id, session.directory, ACTIVE_STATUSES)
+
+
+# POST: 업로드 세션 만들기 (회의 폴더만 만들고, 회의 행은 finalize 때 추가)
+@router.post("/uploads")
+async def create_upload(payload: UploadCreate, db: Session = Depends(get_meeting_db)):
+    if payload.size is not None and payload.size > UPLOAD_MAX_BYTES:
+        raise HTTPException(status_code=413, detail=f"파일이 너무 큽니다. (최대 {UPLOAD_MAX_BYTES} bytes)")
+    await _expire_stale_sessions(db)
+
+    upload_id = uuid.uuid4().hex
+    directory = new_meeting_directory()
+    await makedirs_async(os.path.join(UPLOAD_ROOT, directory))
+    fields = payload.model_dump()
+    await meeting_writer.run_async(create_upload_session, upload_id, directory, **fields)
+    return session_info(UploadSession(id=upload_id, directory=directory, status="uploading", **fields))
+
+
+# GET: 지금까지 받은 offset 확인 (끊긴 뒤 이어 올릴 위치)
+@router.get("/uploads/{upload_id}")
+async def get_upload(upload_id: str, db: Session = Depends(get_meeting_db)):
+    session = _get_session(db, upload_id)
+    return await run_io(session_info, session)
+
+
+def _write(f, data: bytes):
+    f.write(data)
+
+
+def _close(f):
+    f.flush()
+    f.close()
+
+
+# PUT: offset 위치부터 조각 하나 이어 쓰기 (본문은 그대로 파일 바이트)
+@router.put("/uploads/{upload_id}")
+async def put_upload_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0),
+    db: Session = Depends(get_meeting_db),
+):
+    session = _get_session(db, upload_id)
+    if session.status not in ("uploading", "receiving"):
+        raise HTTPException(status_code=409, detail=f"이미 {session.status} 상태인 업로드입니다.")
+    if not await meeting_writer.run_async(claim_upload_session, upload_id, "receiving"):
+        raise _offset_conflict(await run_io(current_offset, session), "같은 업로드의 다른 조각을 받는 중입니다.")
+
+    try:
+        current = await run_io(current_offset, session)
+        if offset != current:
+            raise _offset_conflict(current, "offset이 맞지 않습니다. 응답의 offset부터 다시 올려 주세요.")
+        limit = session.size if session.size is not None else UPLOAD_MAX_BYTES
+
+        f = await run_io(open_part_for_append, part_path(session), offset)
+        written = offset
+        pending = bytearray()
+        try:
+            async for chunk in request.stream():
+                if written + len(pending) + len(chunk) > limit:
+                    raise HTTPException(status_code=413, detail=f"선언한 크기({limit} bytes)를 넘었습니다.")
+                pending += chunk
+                if len(pending) >= UPLOAD_WRITE_CHUNK:
+                    await run_io(_write, f, bytes(pending))
+                    written += len(pending)
+                    pending.clear()
+        finally:
+            # 중간에 끊겨도 받은 데까지는 남겨 두어 다음 조각을 그 뒤부터 받을 수 있게 합니다.
+            if pending:
+                await run_io(_write, f, bytes(pending))
+                written += len(pending)
+            await run_io(_close, f)
+    finally:
+        await meeting_writer.run_async(release_upload_session, upload_id, "receiving")
+
+    return {"upload_id": upload_id, "offset": written, "size": session.size}
+
+
+# POST: 업로드 마무리 -> 회의 추가 + 전사/요약 백그라운드 작업 (/upload와 같음)
+@router.post("/uploads/{upload_id}/finalize")
+async def finalize_upload(upload_id: str, db: Session = Depends(get_meeting_db)):
+    session = _get_session(db, upload_id)
+    if session.status != "uploading":
+        raise HTTPException(status_code=409, detail=f"이미 {session.status} 상태인 업로드입니다.")
+    # 파일 이름을 바꾸기 전에 DB에서 먼저 세션을 가져갑니다. (다른 프로세스의 PUT/finalize와 겹치지 않게)
+    if not await meeting_writer.run_async(claim_upload_session, upload_id, "finalizing"):
+        raise HTTPException(status_code=409, detail="아직 조각을 받는 중이거나 이미 마무리 중인 업로드입니다.")
+    tmp_path, mp3_path = part_path(session), audio_path(session)
+    renamed = False
+    try:
+        received = await run_io(current_offset, session)
+        if received == 0 or (session.size is not None and received != session.size):
+            raise _offset_conflict(received, "아직 모든 조각을 받지 못했습니다.")
+
+        sha256 = await run_io(file_sha256, tmp_path)
+        await run_io(os.replace, tmp_path, mp3_path)
+        renamed = True
+        if not await meeting_writer.run_async(finalize_upload_session, upload_id, sha256):
+            raise HTTPException(status_code=409, detail="이미 마무리된 업로드입니다.")
+    except BaseException:
+        # 마무리하지 못했으면 받은 조각을 되돌려 다시 finalize할 수 있게 합니다.
+        if renamed:
+            await run_io(os.replace, mp3_path, tmp_path)
+        await meeting_writer.run_async(release_upload_session, upload_id, "finalizing")
+        raise
+    print(f"✅ 이어 올리기 완료: {session.filename} ({received} bytes, sha256 {sha256[:12]})")
+    await run_io(store_audio, mp3_path, sha256)
+    cached = await run_io(has_cached_transcript, sha256)
+
+    # 백그라운드 작업: mp3 -> 텍스트 변환 + summary 생성 (/upload와 같은 작업 대기열)
+    job_id = await submit_job_async("transcribe", {
+        "audio_path": mp3_path,
+        "output_dir": os.path.join(UPLOAD_ROOT, session.directory),
+        "summary_mode": session.summary_mode,
+        "custom_prompt": session.custom_prompt,
+        "audio_sha256": sha256,
+    })
+    return {
+        "message": "회의 정보와 파일이 성공적으로 저장되었습니다!",
+        "directory": session.directory,
+        "size": received,
+        "sha256": sha256,
+        "cached": cached,
+        "job_id": job_id,
+    }
+
+
+# DELETE: 업로드 취소 (받은 조각과 폴더는 reaper가 지움)
+@router.delete("/uploads/{upload_id}")
+async def cancel_upload(upload_id: str, db: Session = Depends(get_meeting_db)):
+    session = _get_session(db, upload_id)
+    if session.status != "uploading":
+        raise HTTPException(status_code=409, detail=f"이미 {session.status} 상태인 업로드입니다.")
+    await _abort(upload_id, session.directory)
+    return {"message": "업로드가 취소되었습니다.", "upload_id": upload_id}
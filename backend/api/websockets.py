@@ -5,11 +5,19 @@ import asyncio
 import azure.cognitiveservices.speech as speechsdk
 from dotenv import load_dotenv
 import json
-import sys
 from pydantic import BaseModel
 import warnings
 from fpdf import FPDF
 from unidecode import unidecode
+from services.storage import atomic_output_path, run_io
+from services.artifacts import write_json_artifact, read_json_artifact
+from services.search_index import index_meeting_async
+from services.speaker_stats import write_speaker_stats
+from services.segment_store import build_segment_store
+from services.meeting_repository import resolve_meeting_directory
+from services.meeting_writer import meeting_writer
+from services.summarize_text import summarize_text, SummaryError
+from services.checkpoints import record_checkpoint, summary_input_hash, transcript_hash, text_hash
 
 # 환경 변수 불러오기
 load_dotenv()
@@ -73,7 +81,10 @@ def save_summary_as_pdf(summary_text: str, output_path: str):
     effective_width = pdf.w - pdf.l_margin - pdf.r_margin
     pdf.multi_cell(effective_width, 8, summary_text)
 
-    pdf.output(output_path)
+    # 다 만든 뒤에 교체해서 읽는 쪽이 반쯤 쓰인 PDF를 보지 않도록 합니다.
+    tmp_path = atomic_output_path(output_path)
+    pdf.output(tmp_path)
+    os.replace(tmp_path, output_path)
     print(f"✅ PDF 생성 완료: {output_path}")
 
 # --- (STT 웹소켓 코드) ---
@@ -141,10 +152,11 @@ def save_transcription_to_json(directory: str):
     # 최종 JSON 파일로 저장
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     upload_root = os.path.join(base_dir, "uploaded_files")
-    save_path = os.path.join(upload_root, directory, "result.json")
+    folder = os.path.join(upload_root, directory)
     
-    with open(save_path, "w", encoding="utf-8") as f:
-        json.dump({"segments": recordings}, f, ensure_ascii=False, indent=2)
+    save_path = write_json_artifact(folder, "result.json", {"segments": recordings})
+    write_speaker_stats(folder, recordings)
+    build_segment_store(save_path)
     
     print(f"✅ 최종 JSON 파일이 '{save_path}'에 저장되었습니다.")
         
@@ -152,45 +164,56 @@ def save_transcription_to_json(directory: str):
 @router.post("/summarize/{directory}")
 async def summarize_meeting(directory: str, request: SummaryRequest):
     # ⭐️ 요약 요청이 들어오면 먼저 transcription 파일부터 저장합니다.
-    save_transcription_to_json(directory)
+    # (파일/JSON 작업은 모두 저장소 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다)
+    directory = await run_io(resolve_meeting_directory, directory)
+    await run_io(save_transcription_to_json, directory)
     
     # 1. 파일 경로 설정
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    file_path = os.path.join(base_dir, "uploaded_files", directory, "result.json")
+    folder = os.path.join(base_dir, "uploaded_files", directory)
     
-    # 2. 파일이 있는지 확인
-    if not os.path.exists(file_path):
-        return {"error": "파일을 찾을 수 없습니다."}
-    
-    # 3. JSON 파일 읽기
+    # 2~3. JSON 파일 읽기 (압축본/예전 평문 모두)
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            # 모든 텍스트를 하나로 합치기
-            full_text = " ".join(item['text'] for item in data['segments'])
+        data = await run_io(read_json_artifact, folder, "result.json")
+        if data is None:
+            return {"error": "파일을 찾을 수 없습니다."}
+        # 모든 텍스트를 하나로 합치기
+        full_text = " ".join(item['text'] for item in data['segments'])
     except Exception as e:
         return {"error": f"파일 읽기 실패: {e}"}
 
-    # 4. summarize_text.py 모듈 불러오기
-    sys.path.append(os.path.join(base_dir, "services"))
-    from summarize_text import summarize_text
-    
-    # 5. 요약 함수 실행
-    if request.mode == "기본":
-        summary = summarize_text(full_text, mode="기본")
-    else: # 사용자 지정 요약
-        summary = summarize_text(full_text, mode="사용자 지정", custom_prompt=request.custom_prompt)
-        
+    # 체크포인트 기록 (POST /api/reprocess가 같은 전사본/모드로 다시 처리하지 않도록)
+    # 실시간 회의의 전사본은 녹음 파일이 없으므로 입력 해시 없이 기록합니다.
+    transcript_sha = transcript_hash(data['segments'])
+    await meeting_writer.run_async(record_checkpoint, directory, "transcript", "done", None, transcript_sha)
+    mode, custom_prompt = ("기본", None) if request.mode == "기본" else ("사용자 지정", request.custom_prompt)
+    summary_input = summary_input_hash(transcript_sha, mode, custom_prompt)
+    params = {"summary_mode": mode, "custom_prompt": custom_prompt}
+
+    # 4. 요약 함수 실행 (OpenAI 호출은 오래 걸리므로 스레드에서 실행)
+    try:
+        summary = await asyncio.to_thread(summarize_text, full_text, mode=mode, custom_prompt=custom_prompt)
+    except SummaryError as e:
+        # 실패 문구로 summary.json/PDF를 덮어쓰지 않습니다. (응답은 예전처럼 실패 문구를 돌려줌)
+        await meeting_writer.run_async(record_checkpoint, directory, "summary", "failed", summary_input, params=params, error=str(e))
+        return {"summary": str(e)}
+
     # ⭐️ 요약 결과를 summary.json 파일로 저장
     summary_dir = os.path.join(base_dir, "uploaded_files", directory)
-    summary_path = os.path.join(summary_dir, "summary.json")
-    
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump({"summary": summary}, f, ensure_ascii=False, indent=2)
+    summary_path = await run_io(write_json_artifact, summary_dir, "summary.json", {"summary": summary})
     print(f"✅ 요약 JSON 파일이 '{summary_path}'에 저장되었습니다.")
 
     # ⭐️ 요약 결과를 summary.pdf 파일로 저장
     pdf_path = os.path.join(summary_dir, "summary.pdf")
-    save_summary_as_pdf(summary, pdf_path)
+    await run_io(save_summary_as_pdf, summary, pdf_path)
+    await meeting_writer.run_async(record_checkpoint, directory, "summary", "done", summary_input, text_hash(summary), params=params)
+    if await run_io(os.path.exists, pdf_path):
+        await meeting_writer.run_async(record_checkpoint, directory, "pdf", "done", text_hash(summary))
+
+    # 전문 검색 색인 갱신
+    try:
+        await index_meeting_async(directory, data['segments'], summary)
+    except Exception as e:
+        print(f"❌ 검색 색인 실패: {e}")
         
     return {"summary": summary}
\ No newline at end of file
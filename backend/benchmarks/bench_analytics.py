@@ -0,0 +1,115 @@
+"""대화 분석 지표: 파이썬 반복문 vs NumPy 배열 연산 (합성 전사 데이터)
+
+사용법 (backend 폴더에서): python -m benchmarks.bench_analytics [세그먼트 수]
+"""
+import sys
+import time
+import random
+from services.conversation_analytics import SegmentArrays, analyze_arrays, analyze_segments, HISTOGRAM_BUCKET_MS, SILENCE_MIN_MS
+
+WORDS = ["다음", "주", "배포", "일정은", "목요일로", "확정하겠습니다", "네", "그", "부분은", "제가", "정리해서", "공유드릴게요"]
+
+
+def make_segments(n: int) -> list:
+    random.seed(11)
+    segments = []
+    t = 0
+    for _ in range(n):
+        dur = random.randint(100, 600)
+        # 가끔 앞 발언과 겹치게(끼어들기) 시작하고, 가끔 긴 침묵을 둡니다.
+        gap = random.choice([-150, 0, 0, 50, 100, 2500])
+        start = max(0, t + gap)
+        segments.append({
+            "start": start,
+            "end": start + dur,
+            "speaker": str(random.choice([1, 1, 2, 2, 3, 4])),
+            "text": " ".join(random.choices(WORDS, k=random.randint(1, 15))),
+        })
+        t = start + dur
+    return segments
+
+
+def analyze_loop(segments: list, bucket_ms: float = HISTOGRAM_BUCKET_MS, min_gap: float = SILENCE_MIN_MS) -> dict:
+    """비교용: 같은 지표를 세그먼트 반복문으로 계산합니다."""
+    segs = sorted(segments, key=lambda s: s.get("start") or 0)
+    stats = {}
+    histogram = {}
+    duration = max((s.get("end") or 0) for s in segs)
+    n_buckets = max(1, -(-int(duration) // int(bucket_ms)))
+    prev_end = None
+    prev_speaker = object()
+    turn_start = turn_end = None
+    silences = []
+    for seg in segs:
+        sp = seg.get("speaker")
+        start = seg.get("start") or 0
+        end = max(seg.get("end") or 0, start)
+        st = stats.setdefault(sp, {"talk": 0, "words": 0, "turns": 0, "longest": 0, "interruptions": 0, "overlap": 0})
+        st["talk"] += end - start
+        st["words"] += len((seg.get("text") or "").split())
+        if prev_end is not None:
+            if start < prev_end:
+                st["overlap"] += max(0, min(prev_end, end) - start)
+                if sp != prev_speaker:
+                    st["interruptions"] += 1
+            elif start - prev_end >= min_gap:
+                silences.append(start - prev_end)
+        if sp != prev_speaker:
+            if prev_speaker in stats:
+                stats[prev_speaker]["longest"] = max(stats[prev_speaker]["longest"], turn_end - turn_start)
+            st["turns"] += 1
+            turn_start, turn_end = start, end
+        else:
+            turn_end = max(turn_end, end)
+        bins = histogram.setdefault(sp, [0.0] * n_buckets)
+        b = int(start // bucket_ms)
+        while b < n_buckets and b * bucket_ms < end:
+            bins[b] += min(end, (b + 1) * bucket_ms) - max(start, b * bucket_ms)
+            b += 1
+        prev_end = end if prev_end is None else max(prev_end, end)
+        prev_speaker = sp
+    stats[prev_speaker]["longest"] = max(stats[prev_speaker]["longest"], turn_end - turn_start)
+    return {"speakers": stats, "silences": silences, "histogram": histogram}
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    segments = make_segments(n)
+    print(f"세그먼트 {n}개 (약 {segments[-1]['end'] / 3_600_000:.1f}시간 분량)\n")
+
+    repeat = 5
+    start = time.perf_counter()
+    for _ in range(repeat):
+        expected = analyze_loop(segments)
+    loop_ms = (time.perf_counter() - start) / repeat * 1000
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        actual = analyze_segments(segments)
+    numpy_ms = (time.perf_counter() - start) / repeat * 1000
+
+    # 배열이 이미 만들어져 있을 때 (엔드포인트의 캐시 적중)
+    arrays = SegmentArrays(segments)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        analyze_arrays(arrays)
+    cached_ms = (time.perf_counter() - start) / repeat * 1000
+
+    # 두 방식의 결과가 같은지 확인합니다.
+    for sp, st in expected["speakers"].items():
+        got = actual["speakers"][sp]
+        assert abs(got["talk_time_ms"] - st["talk"]) < 1e-6
+        assert got["words"] == st["words"] and got["turns"] == st["turns"]
+        assert got["interruptions"] == st["interruptions"]
+        assert abs(got["overlap_ms"] - st["overlap"]) < 1e-6
+        assert abs(got["longest_monologue_ms"] - st["longest"]) < 1e-6
+        assert all(abs(a - round(b, 1)) < 0.11 for a, b in zip(actual["histogram"]["speakers"][sp], expected["histogram"][sp]))
+    assert actual["silence"]["count"] == len(expected["silences"])
+
+    print(f"파이썬 반복문   {loop_ms:8.2f} ms")
+    print(f"NumPy 배열 연산 {numpy_ms:8.2f} ms   ({loop_ms / numpy_ms:.1f}배, 배열 변환 포함)")
+    print(f"NumPy 계산만    {cached_ms:8.2f} ms   ({loop_ms / cached_ms:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
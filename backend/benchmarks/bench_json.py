@@ -0,0 +1,73 @@
+"""JSON 인코딩/디코딩 속도와 크기 비교 (한국어 회의 전사 데이터)
+
+사용법 (backend 폴더에서): python -m benchmarks.bench_json [세그먼트 수]
+"""
+import sys
+import json
+import time
+import random
+from services import json_codec
+
+SENTENCES = [
+    "다음 주 배포 일정은 목요일로 확정하겠습니다.",
+    "네, 그 부분은 제가 오늘 중으로 정리해서 공유드릴게요.",
+    "예산이 조금 부족할 것 같은데 추가 요청이 가능할까요?",
+    "고객사 피드백을 반영해서 화면 구성을 다시 잡아야 할 것 같습니다.",
+    "회의록은 팀 채널에 올려 주시면 감사하겠습니다.",
+    "테스트 서버에서 재현이 안 돼서 로그를 더 확인해 봐야 합니다.",
+]
+
+
+def make_transcript(n: int) -> dict:
+    random.seed(7)
+    segments = []
+    t = 0
+    for _ in range(n):
+        dur = random.randint(800, 9000)
+        segments.append({
+            "start": t,
+            "end": t + dur,
+            "speaker": str(random.randint(1, 6)),
+            "text": random.choice(SENTENCES),
+        })
+        t += dur + random.randint(0, 1500)
+    return {"segments": segments, "text": " ".join(s["text"] for s in segments)}
+
+
+def bench(label: str, encode, decode, data, repeat: int = 10):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encoded = encode(data)
+    enc = (time.perf_counter() - start) / repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        decode(encoded)
+    dec = (time.perf_counter() - start) / repeat
+    print(f"{label:<32} encode {enc * 1000:8.2f} ms   decode {dec * 1000:8.2f} ms   {len(encoded) / 1024:9.1f} KiB")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    data = make_transcript(n)
+    print(f"세그먼트 {n}개, json_codec 백엔드: {json_codec.JSON_BACKEND}\n")
+
+    bench(
+        "json indent=2 (기존 저장 방식)",
+        lambda d: json.dumps(d, ensure_ascii=False, indent=2).encode("utf-8"),
+        json.loads, data,
+    )
+    bench(
+        "json compact",
+        lambda d: json.dumps(d, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        json.loads, data,
+    )
+    bench(
+        "json 기본 (ensure_ascii=True)",
+        lambda d: json.dumps(d).encode("utf-8"),
+        json.loads, data,
+    )
+    bench(f"json_codec ({json_codec.JSON_BACKEND})", json_codec.dumps, json_codec.loads, data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""directory로 회의 하나를 찾아 수정하는 비용 비교 (기본 10만 건)
+
+사용법 (backend 폴더에서): python -m benchmarks.bench_meeting_lookup [회의 수]
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+
+# 벤치마크용 임시 저장소를 쓰도록 core.database를 불러오기 전에 설정합니다.
+_tmp_dir = tempfile.mkdtemp(prefix="bench_meetings_")
+os.environ["MEETINGS_DB_URL"] = f"sqlite:///{os.path.join(_tmp_dir, 'meetings.db')}"
+
+from core.database import MeetingBase, MeetingSessionLocal, meeting_engine
+from models.meeting_tables import MeetingRecord
+from services.meeting_repository import update_meeting
+from services.meeting_index import meeting_index
+
+
+def make_meetings(n: int):
+    random.seed(42)
+    rows = []
+    for i in range(n):
+        rows.append({
+            "directory": f"20250101_120000_회의{i}_{i:06x}",
+            "date": f"2025-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
+            "name": f"회의{i}",
+            "description": "주간 회의",
+            "is_interested": False,
+            "is_ended": True,
+            "seq": i + 1,
+            "created_seq": i + 1,
+            "deleted": False,
+        })
+    return rows
+
+
+def legacy_toggle(meetings: dict, directory: str):
+    """기존 코드 방식: 모든 날짜의 모든 회의를 훑고 meetings.json 전체를 다시 직렬화합니다."""
+    for date in meetings:
+        for meeting in meetings[date]:
+            if meeting.get("directory") == directory:
+                meeting["is_interested"] = not meeting["is_interested"]
+    json.dumps(meetings, ensure_ascii=False, indent=2)
+
+
+def timed(label: str, fn, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label:<45} {elapsed * 1000:10.3f} ms")
+    return elapsed
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rows = make_meetings(n)
+    targets = [random.choice(rows)["directory"] for _ in range(50)]
+    print(f"회의 {n}건\n")
+
+    legacy = {}
+    for row in rows:
+        legacy.setdefault(row["date"], []).append({k: row[k] for k in ("name", "description", "is_interested", "is_ended", "directory")})
+    timed("기존: 전체 스캔 + meetings.json 재작성", lambda: legacy_toggle(legacy, random.choice(targets)), 5)
+
+    MeetingBase.metadata.create_all(bind=meeting_engine)
+    with meeting_engine.begin() as conn:
+        conn.execute(MeetingRecord.__table__.insert(), rows)
+
+    def sql_toggle():
+        db = MeetingSessionLocal()
+        try:
+            update_meeting(db, random.choice(targets), is_interested=True)
+            db.commit()
+        finally:
+            db.close()
+
+    timed("저장소: directory 인덱스로 한 행 수정", sql_toggle, 200)
+
+    timed("목록 캐시: 처음 전체 적재 + 직렬화", meeting_index.get_payload, 1)
+    timed("목록 캐시: 변경 없음 (hit)", meeting_index.get_payload, 200)
+
+    def toggle_then_get():
+        sql_toggle()
+        meeting_index.get_payload()
+
+    timed("목록 캐시: 한 행 수정 후 다시 조회", toggle_then_get, 50)
+    print(f"\n{meeting_index.stats()}")
+
+
+if __name__ == "__main__":
+    main()
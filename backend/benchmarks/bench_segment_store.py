@@ -0,0 +1,48 @@
+"""result.json 파싱 vs segments.col(mmap) 열기 비교
+
+사용법 (backend 폴더에서): python -m benchmarks.bench_segment_store [세그먼트 수]
+"""
+import os
+import sys
+import time
+import tempfile
+from services.storage import atomic_write_json, read_json
+from services.segment_store import build_segment_store, open_segment_store, _open_store_file
+from services.speaker_stats import compute_speaker_stats, compute_speaker_stats_from_store
+from services.conversation_analytics import SegmentArrays, analyze_arrays
+from benchmarks.bench_json import make_transcript
+
+
+def timed(label: str, fn, repeat: int = 5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    print(f"{label:<40} {(time.perf_counter() - start) / repeat * 1000:9.2f} ms")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    with tempfile.TemporaryDirectory() as folder:
+        result_path = os.path.join(folder, "result.json")
+        atomic_write_json(result_path, make_transcript(n))
+        timed("segments.col 만들기 (전사 직후 1회)", lambda: build_segment_store(result_path), repeat=1)
+        st = os.stat(result_path)
+        json_size = st.st_size
+        col_size = os.path.getsize(os.path.join(folder, "segments.col"))
+        print(f"result.json {json_size / 1024:.0f} KiB, segments.col {col_size / 1024:.0f} KiB, 세그먼트 {n}개\n")
+
+        timed("result.json 파싱", lambda: read_json(result_path))
+        timed("segments.col mmap 열기", lambda: _open_store_file(result_path, st))
+        print()
+        timed("화자 통계: result.json", lambda: compute_speaker_stats(read_json(result_path)["segments"]))
+        timed("화자 통계: segments.col", lambda: compute_speaker_stats_from_store(_open_store_file(result_path, st)))
+        timed("대화 분석: result.json", lambda: analyze_arrays(SegmentArrays(read_json(result_path)["segments"])))
+        timed("대화 분석: segments.col", lambda: analyze_arrays(SegmentArrays.from_store(_open_store_file(result_path, st))))
+        page = range(n // 2, n // 2 + 100)
+        timed("가운데 100개: result.json", lambda: read_json(result_path)["segments"][n // 2:n // 2 + 100])
+        timed("가운데 100개: segments.col", lambda: _open_store_file(result_path, st).read(page))
+        timed("가운데 100개: segments.col (열린 상태)", lambda: open_segment_store(result_path).read(page))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import os
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker, declarative_base
+
+load_dotenv()
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# --- 회의 메타데이터 저장소 설정 ---
+# 기본값은 backend/meetings.db 내장 SQLite 입니다.
+# MEETINGS_DB_URL에 main.py의 DB_URL과 같은 값을 넣으면 기존 DB에 테이블이 만들어집니다.
+MEETINGS_DB_URL = os.getenv("MEETINGS_DB_URL") or f"sqlite:///{os.path.join(BASE_DIR, 'meetings.db')}"
+IS_SQLITE = MEETINGS_DB_URL.startswith("sqlite")
+
+meeting_engine = create_engine(
+    MEETINGS_DB_URL,
+    connect_args={"check_same_thread": False} if IS_SQLITE else {},
+)
+
+if IS_SQLITE:
+    @event.listens_for(meeting_engine, "connect")
+    def _set_sqlite_pragma(dbapi_connection, connection_record):
+        """WAL 모드로 읽기와 쓰기가 서로 막지 않도록 설정합니다."""
+        # 트랜잭션 시작을 SQLAlchemy가 직접 관리하도록 합니다. (SAVEPOINT 사용을 위해 필요)
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        # 커밋마다 fsync 합니다. 쓰기는 meeting_writer가 묶어서 커밋하므로 fsync 횟수가 적습니다.
+        cursor.execute("PRAGMA synchronous=FULL")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
+    @event.listens_for(meeting_engine, "begin")
+    def _do_begin(connection):
+        # 쓰기 세션은 BEGIN IMMEDIATE로 첫 읽기부터 쓰기 잠금을 잡습니다.
+        # (별도 워커 프로세스가 함께 쓸 때, 읽은 뒤 쓰기로 올리다 SQLITE_BUSY_SNAPSHOT이 나지 않도록)
+        if connection.get_execution_options().get("sqlite_begin") == "IMMEDIATE":
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+        else:
+            connection.exec_driver_sql("BEGIN")
+
+MeetingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=meeting_engine)
+# meeting_writer 전용: 모든 쓰기가 이 세션으로 모입니다.
+MeetingWriteSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=meeting_engine.execution_options(sqlite_begin="IMMEDIATE") if IS_SQLITE else meeting_engine,
+)
+MeetingBase = declarative_base() # 회의 저장소 테이블의 '설계도' 역할을 합니다.
+
+def get_meeting_db():
+    """요청마다 회의 저장소 세션을 열고, 끝나면 자동으로 닫아줍니다."""
+    db = MeetingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -9,6 +9,7 @@ import re
 from urllib.parse import unquote
 from datetime import datetime
 from typing import List, Optional
+from contextlib import asynccontextmanager
 
 # FastAPI 관련 모듈
 from fastapi import (
@@ -52,8 +53,20 @@ from fpdf import FPDF
 
 # 프로젝트 내부 모듈
 from api import meetings
+from api import search as search_api
+from api import analytics as analytics_api
+from api import uploads as uploads_api
+from api import jobs as jobs_api
 from api.websockets import manager as notification_manager
 from api.websockets import router as websockets_router
+from services.meeting_repository import init_meeting_store
+from services.meeting_writer import meeting_writer
+from services.reaper import reaper
+from services.job_queue import job_workers, JOB_EMBEDDED_WORKERS
+from services.loop_monitor import loop_monitor
+from services.http_clients import http_clients
+from services.storage import shutdown_io_executor
+from services.json_codec import FastJSONResponse
 
 # --- 환경 변수 로드 ---
 # .env 파일에서 필요한 값들을 불러옵니다.
@@ -68,11 +81,34 @@ CLOVA_INVOKE_URL = os.getenv("CLOVA_INVOKE_URL")
 DB_URL = os.getenv("DB_URL")
 
 # --- FastAPI 앱 및 라우터 설정 ---
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 회의 저장소와 쓰기 스레드를 준비하고, 종료 시 남은 쓰기를 마무리합니다."""
+    init_meeting_store()
+    meeting_writer.start()
+    http_clients.start()
+    reaper.start()
+    if JOB_EMBEDDED_WORKERS:
+        # 별도 워커 프로세스(worker.py)를 쓰면 JOB_EMBEDDED_WORKERS=0
+        job_workers.start()
+    loop_monitor.start()
+    yield
+    await loop_monitor.stop()
+    job_workers.stop()
+    reaper.stop()
+    http_clients.stop()
+    meeting_writer.stop()
+    shutdown_io_executor()
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 
 router = APIRouter(prefix="/api", tags=["Users API"])
 
 app.include_router(meetings.router, prefix="/api", tags=["Meetings API"])
+app.include_router(search_api.router, prefix="/api", tags=["Search API"])
+app.include_router(analytics_api.router, prefix="/api", tags=["Analytics API"])
+app.include_router(uploads_api.router, prefix="/api", tags=["Uploads API"])
+app.include_router(jobs_api.router, prefix="/api", tags=["Jobs API"])
 app.include_router(websockets_router)
 
 
@@ -286,6 +322,16 @@ async def send_pdf_complete_notification():
     await notification_manager.broadcast(message)
     return {"message": "Notification sent"}
 
+@app.get("/api/health/loop-lag")
+async def get_loop_lag():
+    """이벤트 루프 지연(ms) 통계를 반환합니다. 파일 작업이 루프를 막으면 값이 커집니다."""
+    return loop_monitor.stats()
+
+@app.get("/api/health/http-clients")
+async def get_http_client_stats():
+    """외부 HTTP 호출(Clova, OpenAI, 내부 알림)의 공급자별 요청 수, 새 연결 수, 연결 풀 상태를 반환합니다."""
+    return http_clients.stats()
+
 app.include_router(router)
 
 @app.websocket("/ws/notifications")
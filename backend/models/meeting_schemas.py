@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from typing import List, Literal, Optional
+from pydantic import BaseModel, Field
 
 # 회의 데이터 모델
 class Meeting(BaseModel):
@@ -7,6 +8,7 @@ class Meeting(BaseModel):
     date: str
     is_interested: bool
     is_ended: bool
+    group_id: Optional[int] = None
 
 # 회의 데이터 모델
 class Meeting(BaseModel):
@@ -15,6 +17,7 @@ class Meeting(BaseModel):
     date: str
     is_interested: bool
     is_ended: bool
+    group_id: Optional[int] = None
 
 
 # 새로운 회의 데이터 모델
@@ -23,4 +26,47 @@ class MeetingData(BaseModel):
     description: str
     date: str
     is_interested: bool = False
-    is_ended: bool = False   
\ No newline at end of file
+    is_ended: bool = False
+    group_id: Optional[int] = None   
+
+# 회의 관심 등록 (PATCH /meetings/interested)
+class MeetingInterestedUpdate(BaseModel):
+    directory: str = Field(..., min_length=1)
+    is_interested: bool
+
+
+# 여러 회의 일괄 수정 항목 (이름은 메타데이터일 뿐이라 폴더는 그대로 두고 함께 수정합니다)
+class MeetingBulkUpdateItem(BaseModel):
+    directory: str
+    name: Optional[str] = Field(None, min_length=1)
+    description: Optional[str] = None
+    date: Optional[str] = None
+    is_interested: Optional[bool] = None
+    is_ended: Optional[bool] = None
+
+
+class MeetingBulkUpdate(BaseModel):
+    items: List[MeetingBulkUpdateItem] = Field(..., max_length=1000)
+
+
+class MeetingBulkDelete(BaseModel):
+    directories: List[str] = Field(..., max_length=1000)
+
+
+# 이어 올리기 업로드 시작 (POST /api/uploads)
+class UploadCreate(BaseModel):
+    name: str
+    description: str
+    date: str
+    summary_mode: str
+    custom_prompt: Optional[str] = None
+    group_id: Optional[int] = None
+    filename: str
+    size: Optional[int] = Field(None, ge=0)
+
+
+# 처리 단계 다시 실행 (POST /api/reprocess/{directory})
+class ReprocessRequest(BaseModel):
+    summary_mode: Optional[str] = None      # 없으면 마지막으로 요약한 모드/프롬프트
+    custom_prompt: Optional[str] = None
+    force: List[Literal["transcript", "summary", "pdf"]] = []    # 최신이어도 다시 실행할 단계
@@ -0,0 +1,181 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Index, text
+from core.database import MeetingBase
+
+# --- 회의 저장소 테이블 ---
+class MeetingRecord(MeetingBase):
+    """'meetings' 테이블: meetings.json의 회의 하나가 행 하나에 대응합니다."""
+    __tablename__ = "meetings"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    directory = Column(String(255), unique=True, index=True, nullable=False)
+    date = Column(String(32), index=True, nullable=False)
+    group_id = Column(Integer, index=True, nullable=True)
+    name = Column(String(255), nullable=False)
+    description = Column(Text, default="")
+    is_interested = Column(Boolean, default=False, nullable=False)
+    is_ended = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
+    # 변경 동기화용: 회의가 바뀔 때마다 전역 순번(seq)을 새로 받습니다.
+    seq = Column(Integer, index=True, nullable=False, server_default=text("0"))
+    created_seq = Column(Integer, nullable=False, server_default=text("0"))
+    # 삭제된 회의는 행을 지우지 않고 tombstone으로 남깁니다.
+    deleted = Column(Boolean, nullable=False, server_default=text("0"))
+
+    __table_args__ = (
+        # 그룹별 날짜 조회용 복합 인덱스
+        Index("ix_meetings_group_date", "group_id", "date"),
+        # 날짜순 페이지 조회 (date, id) 커서용 인덱스
+        Index("ix_meetings_date_id", "date", "id"),
+        # '관심 회의만', '종료된 회의만' 보기용 인덱스
+        Index("ix_meetings_interested_date_id", "is_interested", "date", "id"),
+        Index("ix_meetings_ended_date_id", "is_ended", "date", "id"),
+    )
+
+
+class MeetingAlias(MeetingBase):
+    """예전 폴더 이름(이름을 바꿀 때 폴더도 바꾸던 시절의 URL) -> 지금 회의 ID(directory)"""
+    __tablename__ = "meeting_aliases"
+    alias = Column(String(255), primary_key=True)
+    directory = Column(String(255), index=True, nullable=False)
+    created_at = Column(DateTime, default=datetime.now)
+
+
+# --- 전문 검색 색인 테이블 (services/search_index.py) ---
+class SearchDocument(MeetingBase):
+    """검색 단위 문서: result.json의 세그먼트 하나 또는 summary.json 하나"""
+    __tablename__ = "search_documents"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    directory = Column(String(255), index=True, nullable=False)
+    kind = Column(String(16), nullable=False)      # "segment" | "summary"
+    seg_index = Column(Integer, nullable=True)
+    start = Column(Integer, nullable=True)
+    end = Column(Integer, nullable=True)
+    speaker = Column(String(64), nullable=True)
+    text = Column(Text, nullable=False)
+    length = Column(Integer, nullable=False)       # 문서의 bigram 개수 (BM25 길이 보정용)
+
+
+class SearchPosting(MeetingBase):
+    """bigram -> 문서 역색인"""
+    __tablename__ = "search_postings"
+    term = Column(String(8), primary_key=True)
+    doc_id = Column(Integer, primary_key=True, index=True)
+    tf = Column(Integer, nullable=False)
+
+
+class SearchTerm(MeetingBase):
+    """bigram별 문서 빈도(df). 검색 시 드문 bigram부터 후보를 좁히는 데 사용합니다."""
+    __tablename__ = "search_terms"
+    term = Column(String(8), primary_key=True)
+    df = Column(Integer, nullable=False)
+
+
+class SearchStat(MeetingBase):
+    """색인 전체 통계 (문서 수, 전체 길이) - 한 행만 사용합니다."""
+    __tablename__ = "search_stats"
+    id = Column(Integer, primary_key=True)
+    doc_count = Column(Integer, nullable=False, default=0)
+    total_length = Column(Integer, nullable=False, default=0)
+
+
+# --- 회의 통계 집계 테이블 (services/rollups.py) ---
+class RollupContribution(MeetingBase):
+    """회의 하나가 집계에 현재 더해 놓은 값. 회의가 바뀌면 이 값을 빼고 새 값을 더합니다.
+
+    speaker가 ""인 행은 회의 자체(회의 수 1, 전체 발언 시간)를 나타냅니다.
+    """
+    __tablename__ = "rollup_contributions"
+    meeting_id = Column(Integer, primary_key=True)
+    speaker = Column(String(64), primary_key=True)
+    day = Column(String(10), nullable=False)
+    group_key = Column(Integer, nullable=False)
+    talk_time_ms = Column(Integer, nullable=False, default=0)
+    segments = Column(Integer, nullable=False, default=0)
+    turns = Column(Integer, nullable=False, default=0)
+
+
+class Rollup(MeetingBase):
+    """일별(day)/주별(week, 월요일 날짜) 그룹·화자별 합계"""
+    __tablename__ = "rollups"
+    grain = Column(String(8), primary_key=True)     # "day" | "week"
+    group_key = Column(Integer, primary_key=True)   # group_id, 그룹 없음은 0
+    period = Column(String(10), primary_key=True)   # YYYY-MM-DD
+    speaker = Column(String(64), primary_key=True)  # "" = 회의 전체
+    meetings = Column(Integer, nullable=False, default=0)
+    talk_time_ms = Column(Integer, nullable=False, default=0)
+    segments = Column(Integer, nullable=False, default=0)
+    turns = Column(Integer, nullable=False, default=0)
+
+
+# --- 폴더 삭제 대기열 (services/reaper.py) ---
+class ReapJob(MeetingBase):
+    """삭제된 회의 폴더(.trash로 옮겨 둔 것)를 백그라운드에서 지우는 작업. 재시작해도 남아 있습니다."""
+    __tablename__ = "reap_jobs"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    directory = Column(String(255), nullable=False)
+    path = Column(String(1024), nullable=False)         # .trash 안의 실제 경로
+    status = Column(String(16), index=True, nullable=False, default="pending")  # pending | done | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    reclaimed_bytes = Column(Integer, nullable=False, default=0)
+    files = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.now)
+    finished_at = Column(DateTime, nullable=True)
+
+
+# --- 이어 올리기 업로드 세션 (api/uploads.py) ---
+class UploadSession(MeetingBase):
+    """긴 녹음 파일을 조각(chunk)으로 나눠 올리는 업로드 하나. 회의 행은 finalize 때 만듭니다."""
+    __tablename__ = "upload_sessions"
+    id = Column(String(32), primary_key=True)           # uuid hex
+    directory = Column(String(255), nullable=False)     # 조각을 바로 쓰는 회의 폴더 (= 회의 ID)
+    filename = Column(String(255), nullable=False)
+    size = Column(Integer, nullable=True)               # 클라이언트가 알려준 전체 크기
+    status = Column(String(16), index=True, nullable=False, default="uploading")  # uploading | receiving | finalizing | finalized | aborted
+    # 회의 정보 (finalize 때 insert_meeting에 그대로 넘김)
+    name = Column(String(255), nullable=False)
+    description = Column(Text, default="")
+    date = Column(String(32), nullable=False)
+    group_id = Column(Integer, nullable=True)
+    summary_mode = Column(String(32), nullable=False)
+    custom_prompt = Column(Text, nullable=True)
+    sha256 = Column(String(64), nullable=True)
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+
+# --- 백그라운드 작업 대기열 (services/job_queue.py) ---
+class Job(MeetingBase):
+    """전사/요약 같은 오래 걸리는 작업 하나. 재시작해도 남아 있고, 실패하면 간격을 늘려 가며 다시 시도합니다."""
+    __tablename__ = "jobs"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(32), nullable=False)                   # 핸들러 이름 (예: "transcribe")
+    payload = Column(Text, nullable=False, default="{}")        # 핸들러 인자 (JSON)
+    status = Column(String(16), nullable=False, default="queued")  # queued | running | done | failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False, default=datetime.now)  # 재시도 대기(backoff)
+    locked_until = Column(DateTime, nullable=True)              # 이 시각까지 하트비트가 없으면 다른 워커가 가져감
+    worker_id = Column(String(128), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.now)
+    finished_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # 다음 작업 찾기용
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
+
+
+# --- 처리 단계 체크포인트 (services/checkpoints.py) ---
+class StageCheckpoint(MeetingBase):
+    """회의 하나의 처리 단계(transcript -> summary -> pdf) 결과. 입력 해시가 같으면 다시 실행하지 않습니다."""
+    __tablename__ = "stage_checkpoints"
+    directory = Column(String(255), primary_key=True)
+    stage = Column(String(16), primary_key=True)            # transcript | summary | pdf
+    status = Column(String(16), nullable=False)              # done | failed
+    input_hash = Column(String(64), nullable=True)
+    output_hash = Column(String(64), nullable=True)          # 다음 단계의 입력 해시 계산에 씀
+    params = Column(Text, nullable=True)                     # 단계 인자 (JSON, 예: 요약 모드/프롬프트)
+    error = Column(Text, nullable=True)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
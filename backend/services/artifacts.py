@@ -0,0 +1,128 @@
+import os
+import gzip
+import zlib
+from typing import Optional
+from fastapi import Request
+from fastapi.responses import FileResponse, StreamingResponse
+from services import json_codec
+from services.storage import atomic_write_bytes
+
+# 회의 폴더의 JSON 결과물(result.json, summary.json)은 gzip으로 압축해 "<이름>.gz"로 저장합니다.
+# ARTIFACT_COMPRESSION=none 이면 예전처럼 압축하지 않고 저장합니다.
+ARTIFACT_COMPRESSION = os.getenv("ARTIFACT_COMPRESSION", "gzip")
+ARTIFACT_GZIP_LEVEL = int(os.getenv("ARTIFACT_GZIP_LEVEL", "6"))
+_STREAM_CHUNK = 64 * 1024
+JSON_MEDIA_TYPE = "application/json; charset=utf-8"
+
+
+def artifact_path(folder: str, name: str) -> Optional[str]:
+    """압축본(name.gz)이 있으면 그 경로를, 없으면 예전 평문 경로를, 둘 다 없으면 None을 반환합니다."""
+    compressed = os.path.join(folder, name + ".gz")
+    if os.path.exists(compressed):
+        return compressed
+    plain = os.path.join(folder, name)
+    if os.path.exists(plain):
+        return plain
+    return None
+
+
+def write_artifact(folder: str, name: str, content: bytes) -> str:
+    """결과물을 (설정에 따라 압축해서) 원자적으로 저장하고, 다른 형식의 옛 파일은 지웁니다."""
+    plain = os.path.join(folder, name)
+    compressed = plain + ".gz"
+    if ARTIFACT_COMPRESSION == "gzip":
+        # mtime=0: 같은 내용이면 같은 바이트가 나오도록 합니다.
+        path, stale = compressed, plain
+        content = gzip.compress(content, compresslevel=ARTIFACT_GZIP_LEVEL, mtime=0)
+    else:
+        path, stale = plain, compressed
+    atomic_write_bytes(path, content)
+    if os.path.exists(stale):
+        os.remove(stale)
+    return path
+
+
+def write_json_artifact(folder: str, name: str, data) -> str:
+    return write_artifact(folder, name, json_codec.dumps(data))
+
+
+def read_artifact_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        content = f.read()
+    return gzip.decompress(content) if path.endswith(".gz") else content
+
+
+def read_json_artifact(folder: str, name: str):
+    """결과물 JSON을 읽습니다. 파일이 없으면 None"""
+    path = artifact_path(folder, name)
+    if path is None:
+        return None
+    return json_codec.loads(read_artifact_bytes(path))
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """Accept-Encoding에서 gzip의 q 값을 보고, 없으면 *의 q 값을 봅니다. (잘못된 q 값은 0으로 봄)"""
+    qvalues = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues.setdefault(coding, q)
+    q = qvalues.get("gzip", qvalues.get("*", 0.0))
+    return q > 0
+
+
+def _gunzip_chunks(path: str):
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    with open(path, "rb") as f:
+        while chunk := f.read(_STREAM_CHUNK):
+            data = decompressor.decompress(chunk)
+            if data:
+                yield data
+    tail = decompressor.flush()
+    if tail:
+        yield tail
+
+
+def artifact_response(path: str, request: Request, media_type: str = JSON_MEDIA_TYPE):
+    """저장된 바이트를 그대로 보냅니다.
+
+    압축본이고 클라이언트가 gzip을 받으면 Content-Encoding: gzip으로 압축된 파일을 그대로,
+    아니면 읽으면서 풀어 보냅니다. (다시 압축하거나 통째로 풀지 않음)
+    """
+    if not path.endswith(".gz"):
+        return FileResponse(path, media_type=media_type)
+    headers = {"Vary": "Accept-Encoding"}
+    if _accepts_gzip(request):
+        return FileResponse(path, media_type=media_type, headers={**headers, "Content-Encoding": "gzip"})
+    return StreamingResponse(_gunzip_chunks(path), media_type=media_type, headers=headers)
+
+
+if __name__ == "__main__":
+    # 기존 평문 결과물을 압축본으로 옮기기: python -m services.artifacts
+    from core.database import BASE_DIR
+    upload_root = os.path.join(BASE_DIR, "uploaded_files")
+    before = after = 0
+    for directory in sorted(os.listdir(upload_root)):
+        if directory.startswith("."):
+            continue  # .trash 등
+        folder = os.path.join(upload_root, directory)
+        for name in ("result.json", "summary.json"):
+            plain = os.path.join(folder, name)
+            if not os.path.isfile(plain):
+                continue
+            before += os.path.getsize(plain)
+            # 들여쓰기된 예전 파일도 compact JSON으로 다시 씁니다.
+            data = json_codec.loads(read_artifact_bytes(plain))
+            after += os.path.getsize(write_json_artifact(folder, name, data))
+            print(f"✅ {directory}/{name}")
+    print(f"✅ {before / 1024:.0f} KiB -> {after / 1024:.0f} KiB")
@@ -0,0 +1,259 @@
+import os
+import time
+import random
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
+from services.storage import atomic_write_json, read_json
+
+if TYPE_CHECKING:
+    import numpy as np
+# 긴 녹음을 침묵 구간에서 잘라 조각별로 STT를 동시에 요청하고, 결과를 다시 이어 붙입니다.
+#   1) ffmpeg로 8kHz 모노 PCM을 흘려 받아 20ms 프레임 에너지(dB)만 계산 (전체 PCM을 메모리에 올리지 않음)
+#   2) 목표 길이마다 가장 가까운 긴 침묵의 가운데를 자르는 지점으로 선택
+#   3) 앞 조각과 CHUNK_OVERLAP_SEC만큼 겹치게 잘라 FLAC으로 저장하고, 조각별 STT를 병렬로 요청
+#   4) 시간 offset을 더하고, 겹친 구간에서 시간이 겹치는 화자끼리 같은 사람으로 맞춤
+# numpy는 긴 녹음을 나눌 때만 필요하므로 함수 안에서 가져옵니다. (없으면 한 번에 요청)
+FFMPEG_BIN = os.getenv("FFMPEG_BIN", "ffmpeg")
+FFPROBE_BIN = os.getenv("FFPROBE_BIN", "ffprobe")
+CHUNKING_MIN_SEC = float(os.getenv("STT_CHUNKING_MIN_SEC", "1200"))     # 이보다 짧으면 한 번에 요청
+CHUNK_TARGET_SEC = float(os.getenv("STT_CHUNK_SEC", "600"))
+STT_PARALLELISM = int(os.getenv("STT_PARALLELISM", "4"))
+CHUNK_SEARCH_SEC = 90.0         # 목표 지점 앞뒤로 침묵을 찾는 범위
+CHUNK_OVERLAP_SEC = 30.0        # 화자 맞추기용으로 앞 조각과 겹치는 길이
+CHUNK_ATTEMPTS = 2              # 조각 하나의 STT 재시도 횟수
+CHUNK_RETRY_BASE_SEC = float(os.getenv("STT_CHUNK_RETRY_BASE_SEC", "5"))     # 재시도 전 대기 (시도마다 2배)
+MIN_SILENCE_SEC = 0.4
+VAD_SAMPLE_RATE = 8000
+VAD_FRAME_SEC = 0.02
+_READ_BLOCK = VAD_SAMPLE_RATE * 2 * 60      # 1분 분량씩 읽음 (int16)
+
+
+def probe_duration(path: str) -> Optional[float]:
+    """ffprobe로 길이(초)를 구합니다. ffprobe가 없거나 실패하면 None"""
+    try:
+        out = subprocess.run(
+            [FFPROBE_BIN, "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        return float(out)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def frame_energies(path: str) -> "np.ndarray":
+    """녹음 전체의 20ms 프레임별 에너지(dB)를 float32 배열로 반환합니다."""
+    import numpy as np
+    frame = int(VAD_SAMPLE_RATE * VAD_FRAME_SEC)
+    try:
+        proc = subprocess.Popen(
+            [FFMPEG_BIN, "-v", "error", "-i", path, "-ac", "1", "-ar", str(VAD_SAMPLE_RATE), "-f", "s16le", "-"],
+            stdout=subprocess.PIPE,
+        )
+    except OSError as e:
+        raise RuntimeError(f"ffmpeg 실행 실패: {e}") from e
+    blocks = []
+    leftover = np.empty(0, dtype=np.int16)
+    try:
+        while True:
+            raw = proc.stdout.read(_READ_BLOCK)
+            if not raw:
+                break
+            samples = np.concatenate([leftover, np.frombuffer(raw[:len(raw) // 2 * 2], dtype=np.int16)])
+            usable = len(samples) // frame * frame
+            leftover = samples[usable:]
+            frames = samples[:usable].astype(np.float32).reshape(-1, frame)
+            blocks.append(10 * np.log10(np.mean(frames * frames, axis=1) + 1.0))
+    finally:
+        proc.stdout.close()
+        if proc.wait() != 0:
+            raise RuntimeError(f"ffmpeg 디코딩 실패: {path}")
+    return np.concatenate(blocks) if blocks else np.empty(0, dtype=np.float32)
+
+
+def _silent_runs(energy_db: "np.ndarray", min_frames: int):
+    """(시작 프레임, 끝 프레임) 배열: 잡음 바닥 + 6dB 아래가 min_frames 이상 이어지는 구간"""
+    import numpy as np
+    floor = np.percentile(energy_db, 10)
+    silent = (energy_db < floor + 6.0).astype(np.int8)
+    edges = np.diff(np.concatenate([[0], silent, [0]]))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts) >= min_frames
+    return starts[keep], ends[keep]
+
+
+def find_split_points(
+    energy_db: "np.ndarray",
+    frame_sec: float = VAD_FRAME_SEC,
+    target_sec: float = CHUNK_TARGET_SEC,
+    search_sec: float = CHUNK_SEARCH_SEC,
+) -> list:
+    """target_sec마다 근처에서 가장 긴 침묵의 가운데(초)를 고릅니다. 침묵이 없으면 에너지가 가장 낮은 곳"""
+    import numpy as np
+    total = len(energy_db) * frame_sec
+    if total <= target_sec * 1.5:
+        return []
+    starts, ends = _silent_runs(energy_db, int(MIN_SILENCE_SEC / frame_sec))
+    mids = (starts + ends) / 2 * frame_sec
+    lengths = ends - starts
+
+    points = []
+    last = 0.0
+    target = target_sec
+    while total - last > target_sec * 1.5:
+        lo, hi = target - search_sec, target + search_sec
+        near = np.flatnonzero((mids > lo) & (mids < hi) & (mids > last + target_sec / 2))
+        if len(near):
+            # 긴 침묵을 우선하고, 길이가 비슷하면 목표 지점에 가까운 쪽
+            score = lengths[near] - np.abs(mids[near] - target) / search_sec
+            cut = float(mids[near[np.argmax(score)]])
+        else:
+            lo_f, hi_f = int(max(lo, last + 1) / frame_sec), int(min(hi, total) / frame_sec)
+            cut = (lo_f + int(np.argmin(energy_db[lo_f:hi_f]))) * frame_sec if hi_f > lo_f else target
+        points.append(round(cut, 3))
+        last = cut
+        target = cut + target_sec
+    return points
+
+
+def cut_chunk(src: str, start_sec: float, end_sec: Optional[float], out_path: str):
+    """[start, end) 구간을 16kHz 모노 FLAC으로 저장합니다. (다시 인코딩하므로 자르는 위치가 정확함)"""
+    cmd = [FFMPEG_BIN, "-v", "error", "-y", "-ss", f"{start_sec:.3f}", "-i", src]
+    if end_sec is not None:
+        cmd += ["-t", f"{end_sec - start_sec:.3f}"]
+    cmd += ["-ac", "1", "-ar", "16000", "-c:a", "flac", out_path]
+    try:
+        subprocess.run(cmd, check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise RuntimeError(f"녹음 자르기 실패 ({start_sec:.0f}초~): {e}") from e
+
+
+def _label_overlap(prev: list, cur: list, window_start: int, window_end: int) -> dict:
+    """겹친 구간에서 (앞 조각의 전역 화자, 이번 조각 화자)별로 함께 말한 시간(ms)을 구합니다."""
+    import numpy as np
+    def arrays(segments):
+        rows = [(s["start"], s["end"], s["speaker"]) for s in segments if s["end"] > window_start and s["start"] < window_end]
+        if not rows:
+            return None
+        start = np.clip(np.array([r[0] for r in rows], dtype=np.int64), window_start, window_end)
+        end = np.clip(np.array([r[1] for r in rows], dtype=np.int64), window_start, window_end)
+        labels, codes = np.unique([str(r[2]) for r in rows], return_inverse=True)
+        return start, end, labels, codes
+
+    a, b = arrays(prev), arrays(cur)
+    if a is None or b is None:
+        return {}
+    inter = np.minimum(a[1][:, None], b[1][None, :]) - np.maximum(a[0][:, None], b[0][None, :])
+    inter = np.clip(inter, 0, None)
+    matrix = np.zeros((len(a[2]), len(b[2])), dtype=np.int64)
+    np.add.at(matrix, (a[3][:, None], b[3][None, :]), inter)
+    return {(a[2][i], b[2][j]): int(matrix[i, j]) for i, j in zip(*np.nonzero(matrix))}
+
+
+def stitch_chunks(chunks: list) -> list:
+    """chunks: [(offset_ms, keep_from_ms, keep_to_ms 또는 None, segments)] -> 이어 붙인 세그먼트
+
+    segments의 시간은 조각 안의 상대 시간입니다. keep 구간 밖(겹친 부분)의 세그먼트는 화자 맞추기에만 씁니다.
+    화자 이름은 첫 조각의 이름을 그대로 쓰고, 이후 조각의 화자는 겹친 구간에서 가장 오래 함께 말한 화자로 맞춥니다.
+    """
+    result = []
+    next_label = 1
+    used = set()
+    for index, (offset, keep_from, keep_to, segments) in enumerate(chunks):
+        shifted = [{**s, "start": (s.get("start") or 0) + offset, "end": (s.get("end") or 0) + offset} for s in segments]
+        mapping = {}
+        if index == 0:
+            for s in shifted:
+                mapping.setdefault(str(s["speaker"]), str(s["speaker"]))
+        else:
+            votes = _label_overlap(result, shifted, offset, keep_from)
+            for (global_label, local_label), _ in sorted(votes.items(), key=lambda kv: -kv[1]):
+                if local_label not in mapping and global_label not in mapping.values():
+                    mapping[local_label] = global_label
+        for s in shifted:
+            local = str(s["speaker"])
+            if local not in mapping:
+                # 겹친 구간에 없던 새 화자: 아직 안 쓴 번호를 붙입니다.
+                while str(next_label) in used or str(next_label) in mapping.values():
+                    next_label += 1
+                mapping[local] = str(next_label)
+            s["speaker"] = mapping[local]
+        used.update(mapping.values())
+        result.extend(
+            s for s in shifted
+            if s["start"] >= keep_from and (keep_to is None or s["start"] < keep_to)
+        )
+    return result
+
+
+def transcribe_in_chunks(
+    audio_path: str,
+    work_dir: str,
+    transcribe_fn: Callable[[str], dict],
+    parallelism: int = STT_PARALLELISM,
+) -> Optional[dict]:
+    """녹음이 길면 침묵 구간에서 잘라 병렬로 전사한 payload({"segments", "text"})를 반환합니다.
+
+    짧거나 ffprobe/numpy를 쓸 수 없으면 None (호출하는 쪽에서 한 번에 요청), 디코딩/자르기 실패는 RuntimeError
+    STT 요청 실패는 그대로 올라갑니다.
+    조각별 결과는 work_dir에 저장해 두므로, 일부 조각이 실패해 작업을 다시 시도하면 남은 조각만 요청합니다.
+    """
+    duration = probe_duration(audio_path)
+    if duration is None or duration < CHUNKING_MIN_SEC:
+        return None
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("⚠️ numpy가 설치되어 있지 않아 긴 녹음도 한 번에 전사합니다.")
+        return None
+    points = find_split_points(frame_energies(audio_path))
+    if not points:
+        return None
+
+    bounds = [0.0] + points + [None]
+    os.makedirs(work_dir, exist_ok=True)
+    print(f"✂️ {duration / 60:.0f}분 녹음을 {len(bounds) - 1}개 조각으로 나눠 전사합니다.")
+
+    def run_chunk(i: int):
+        keep_from, keep_to = bounds[i], bounds[i + 1]
+        start = max(keep_from - CHUNK_OVERLAP_SEC, 0.0) if i > 0 else 0.0
+        name = f"chunk_{i:03d}_{int(start * 1000)}_{int(keep_to * 1000) if keep_to is not None else 'end'}"
+        result_path = os.path.join(work_dir, name + ".json")
+        if os.path.exists(result_path):
+            try:
+                return start, read_json(result_path)
+            except ValueError:
+                # 예전 버전이 쓰다 만 결과 파일: 버리고 다시 요청합니다.
+                print(f"⚠️ 조각 결과를 읽을 수 없어 다시 전사합니다: {result_path}")
+        chunk_path = os.path.join(work_dir, name + ".flac")
+        cut_chunk(audio_path, start, keep_to, chunk_path)
+        for attempt in range(CHUNK_ATTEMPTS):
+            try:
+                payload = transcribe_fn(chunk_path)
+                break
+            except Exception:
+                if attempt + 1 == CHUNK_ATTEMPTS:
+                    raise
+                time.sleep(CHUNK_RETRY_BASE_SEC * 2 ** attempt * random.uniform(0.8, 1.2))
+        # 쓰는 도중 죽어도 잘린 결과 파일이 남지 않도록 원자적으로 저장합니다.
+        atomic_write_json(result_path, payload)
+        os.remove(chunk_path)
+        return start, payload
+
+    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="stt-chunk") as pool:
+        results = list(pool.map(run_chunk, range(len(bounds) - 1)))
+
+    chunks = []
+    for i, (start, payload) in enumerate(results):
+        keep_to = bounds[i + 1]
+        chunks.append((
+            int(start * 1000),
+            int(bounds[i] * 1000),
+            int(keep_to * 1000) if keep_to is not None else None,
+            payload["segments"],
+        ))
+    segments = stitch_chunks(chunks)
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return {"segments": segments, "text": " ".join(s["text"] for s in segments)}
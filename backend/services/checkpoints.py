@@ -0,0 +1,117 @@
+import os
+import json
+import hashlib
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from core.database import MeetingSessionLocal
+from models.meeting_tables import StageCheckpoint
+from services.artifacts import artifact_path
+
+# 회의별 처리 단계 체크포인트. 입력 해시가 같고 결과 파일이 남아 있는 단계는 다시 실행하지 않습니다.
+#   transcript  입력: 녹음 sha256                       결과: result.json   (output_hash: 전사 텍스트 해시)
+#   summary     입력: 전사 텍스트 해시 + 모드 + 프롬프트      결과: summary.json  (output_hash: 요약 해시)
+#   pdf         입력: 요약 해시                          결과: summary.pdf
+STAGES = ("transcript", "summary", "pdf")
+
+
+def text_hash(*parts: Optional[str]) -> str:
+    return hashlib.sha256("\0".join(part or "" for part in parts).encode("utf-8")).hexdigest()
+
+
+def transcript_hash(segments: list) -> str:
+    return text_hash(" ".join(s.get("text", "") for s in segments))
+
+
+def summary_input_hash(transcript_sha: str, mode: str, custom_prompt: Optional[str]) -> str:
+    return text_hash(transcript_sha, mode, custom_prompt)
+
+
+def stage_output_exists(folder: str, stage: str) -> bool:
+    if stage == "transcript":
+        return artifact_path(folder, "result.json") is not None
+    if stage == "summary":
+        return artifact_path(folder, "summary.json") is not None
+    return os.path.exists(os.path.join(folder, "summary.pdf"))
+
+
+# --- 저장소 작업 (쓰기 스레드에서 실행) ---
+def record_checkpoint(
+    db: Session,
+    directory: str,
+    stage: str,
+    status: str,
+    input_hash: Optional[str],
+    output_hash: Optional[str] = None,
+    params: Optional[dict] = None,
+    error: Optional[str] = None,
+):
+    checkpoint = db.get(StageCheckpoint, (directory, stage))
+    if checkpoint is None:
+        checkpoint = StageCheckpoint(directory=directory, stage=stage)
+        db.add(checkpoint)
+    checkpoint.status = status
+    checkpoint.input_hash = input_hash
+    checkpoint.output_hash = output_hash
+    checkpoint.params = json.dumps(params, ensure_ascii=False) if params is not None else None
+    checkpoint.error = error
+    checkpoint.updated_at = datetime.now()
+
+
+def load_checkpoints(directory: str) -> dict:
+    """stage -> {status, input_hash, output_hash, params, error, updated_at}"""
+    db = MeetingSessionLocal()
+    try:
+        rows = db.query(StageCheckpoint).filter(StageCheckpoint.directory == directory).all()
+        return {
+            row.stage: {
+                "status": row.status,
+                "input_hash": row.input_hash,
+                "output_hash": row.output_hash,
+                "params": json.loads(row.params) if row.params else {},
+                "error": row.error,
+                "updated_at": row.updated_at,
+            }
+            for row in rows
+        }
+    finally:
+        db.close()
+
+
+def stage_is_fresh(checkpoints: dict, stage: str, input_hash: Optional[str], folder: str) -> bool:
+    if not stage_output_exists(folder, stage):
+        return False
+    checkpoint = checkpoints.get(stage)
+    if checkpoint is None:
+        # 체크포인트가 생기기 전 회의: 전사본은 그대로 쓰고, 요약/PDF는 어떤 모드였는지 몰라 다시 만듭니다.
+        return stage == "transcript"
+    return checkpoint["status"] == "done" and checkpoint["input_hash"] == input_hash
+
+
+def plan_stages(
+    checkpoints: dict,
+    folder: str,
+    audio_sha256: Optional[str],
+    summary_mode: str,
+    custom_prompt: Optional[str],
+    force: tuple = (),
+) -> list:
+    """다시 실행해야 하는 단계 목록 (실행 순서대로)
+
+    앞 단계를 다시 실행하면 뒤 단계의 입력이 바뀔 수 있어 함께 넣습니다.
+    (실제 실행 때는 단계마다 새 입력 해시로 다시 판단하므로, 전사 결과가 같으면 요약은 건너뜁니다)
+    """
+    transcript = checkpoints.get("transcript")
+    transcript_input = audio_sha256 or (transcript["input_hash"] if transcript else None)
+    if "transcript" in force or not stage_is_fresh(checkpoints, "transcript", transcript_input, folder):
+        return list(STAGES)
+    transcript_sha = transcript["output_hash"] if transcript else None
+    if (
+        "summary" in force
+        or transcript_sha is None
+        or not stage_is_fresh(checkpoints, "summary", summary_input_hash(transcript_sha, summary_mode, custom_prompt), folder)
+    ):
+        return ["summary", "pdf"]
+    if "pdf" in force or not stage_is_fresh(checkpoints, "pdf", checkpoints["summary"]["output_hash"], folder):
+        return ["pdf"]
+    return []
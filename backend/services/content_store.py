@@ -0,0 +1,220 @@
+import os
+import shutil
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Callable, Optional
+from core.database import BASE_DIR
+from services.artifacts import artifact_path, read_json_artifact, write_json_artifact
+from services.storage import atomic_output_path
+
+# 파일 잠금은 POSIX에서만 쓸 수 있습니다. (Windows 개발 환경에서는 프로세스 안 잠금으로 대신함)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# 내용 주소(content-addressed) 저장소: uploaded_files/.cas/<sha 앞 2자리>/<sha256>/
+#   audio                      업로드된 녹음 (회의 폴더의 audio.*와 하드 링크로 공유)
+#   result.json.gz             이 녹음의 전사 결과 캐시
+#   summary.<키>.json.gz       요약 모드/프롬프트별 요약 캐시
+# 같은 녹음을 다시 올리면 디스크도 한 벌만 쓰고, STT 없이 전사 결과를 재사용합니다.
+# 잠금 파일은 항목 폴더 옆에 둡니다: <sha256>.lock(저장/정리), <sha256>.stt.lock(전사 중복 방지)
+# API 프로세스와 worker.py 프로세스가 함께 쓰므로 flock으로 잠급니다.
+CAS_ROOT = os.path.join(BASE_DIR, "uploaded_files", ".cas")
+_HASH_CHUNK = 4 * 1024 * 1024
+
+# fcntl이 없을 때 쓰는 프로세스 안 잠금: path -> [잠금, 사용 중인 수] (다 쓰면 지움)
+_local_locks = {}
+_local_locks_guard = threading.Lock()
+
+
+def blob_dir(sha256: str) -> str:
+    return os.path.join(CAS_ROOT, sha256[:2], sha256)
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _lock_path(sha256: str, kind: str) -> str:
+    return os.path.join(CAS_ROOT, sha256[:2], f"{sha256}.{kind}")
+
+
+@contextmanager
+def _local_lock(path: str, blocking: bool):
+    with _local_locks_guard:
+        entry = _local_locks.setdefault(path, [threading.Lock(), 0])
+        entry[1] += 1
+    acquired = entry[0].acquire(blocking)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            entry[0].release()
+        with _local_locks_guard:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _local_locks[path]
+
+
+@contextmanager
+def _file_lock(path: str, blocking: bool = True):
+    """path 파일에 배타 잠금을 겁니다. 잡았으면 True (blocking=False면 바로 False가 될 수 있음)
+
+    잠금 파일은 collect_garbage가 잠근 채로 지울 수 있어, 잡은 뒤 경로가 아직 같은 파일인지 확인합니다.
+    """
+    if fcntl is None:
+        with _local_lock(path, blocking) as acquired:
+            yield acquired
+        return
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    while True:
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            yield False
+            return
+        except BaseException:
+            os.close(fd)
+            raise
+        try:
+            same = os.stat(path).st_ino == os.fstat(fd).st_ino
+        except FileNotFoundError:
+            same = False
+        if same:
+            break
+        os.close(fd)
+    try:
+        yield True
+    finally:
+        os.close(fd)    # 닫으면 잠금도 풀립니다.
+
+
+@contextmanager
+def content_lock(sha256: str):
+    """같은 녹음을 동시에 두 번 전사하지 않도록 하는 해시별 잠금 (프로세스 사이에서도 유효)"""
+    with _file_lock(_lock_path(sha256, "stt.lock")):
+        yield
+
+
+def store_audio(path: str, sha256: str) -> bool:
+    """회의 폴더의 오디오 파일을 저장소에 넣습니다. 같은 내용이 이미 있으면 True
+
+    이미 있으면 회의 폴더의 파일을 저장소 파일의 하드 링크로 바꿔 중복 바이트를 없애고,
+    처음이면 회의 폴더의 파일을 저장소에 하드 링크합니다. (복사 없음)
+    """
+    folder = blob_dir(sha256)
+    blob = os.path.join(folder, "audio")
+    # collect_garbage가 같은 항목을 지우는 중에 링크하지 않도록 잠급니다.
+    with _file_lock(_lock_path(sha256, "lock")):
+        os.makedirs(folder, exist_ok=True)
+        if os.path.exists(blob):
+            tmp_path = atomic_output_path(path)
+            try:
+                os.link(blob, tmp_path)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                # 하드 링크를 못 쓰는 파일 시스템이면 회의 폴더의 사본을 그대로 둡니다.
+                print(f"❗ 오디오 하드 링크 실패 (사본 유지): {e}")
+            return True
+        try:
+            os.link(path, blob)
+        except OSError:
+            shutil.copyfile(path, blob)
+        return False
+
+
+def has_cached_transcript(sha256: str) -> bool:
+    return artifact_path(blob_dir(sha256), "result.json") is not None
+
+
+def load_cached_transcript(sha256: str) -> Optional[dict]:
+    return read_json_artifact(blob_dir(sha256), "result.json")
+
+
+def cache_transcript(sha256: str, payload: dict):
+    os.makedirs(blob_dir(sha256), exist_ok=True)
+    write_json_artifact(blob_dir(sha256), "result.json", payload)
+
+
+def _summary_name(mode: str, custom_prompt: Optional[str]) -> str:
+    key = hashlib.sha256(f"{mode}\0{custom_prompt or ''}".encode("utf-8")).hexdigest()[:16]
+    return f"summary.{key}.json"
+
+
+def load_cached_summary(sha256: str, mode: str, custom_prompt: Optional[str]) -> Optional[str]:
+    data = read_json_artifact(blob_dir(sha256), _summary_name(mode, custom_prompt))
+    return data["summary"] if data else None
+
+
+def cache_summary(sha256: str, mode: str, custom_prompt: Optional[str], summary: str):
+    os.makedirs(blob_dir(sha256), exist_ok=True)
+    write_json_artifact(blob_dir(sha256), _summary_name(mode, custom_prompt), {"summary": summary})
+
+
+def _remove_path(path: str) -> int:
+    size = os.lstat(path).st_size
+    os.unlink(path)
+    return size
+
+
+def collect_garbage(inodes: Optional[set] = None, remove_file: Optional[Callable[[str], int]] = None) -> tuple:
+    """어느 회의 폴더에서도 링크하지 않는 녹음(링크 수 1)과 그 캐시를 지웁니다. (지운 항목 수, 해제한 바이트)를 반환합니다.
+
+    녹음 데이터의 주인은 저장소입니다. 회의 폴더의 audio.*는 링크일 뿐이라 reaper는 그 링크만 지우고
+    (.trash에서 삭제를 기다리는 회의도 링크를 가지고 있으므로 지워지기 전까지는 남겨 둡니다),
+    마지막 링크가 사라진 뒤에만 여기서 데이터를 지웁니다. 하드 링크를 못 써서 복사한 항목은 캐시만 잃습니다.
+    inodes: (st_dev, st_ino) 집합을 주면 그 녹음만 확인합니다. (reaper가 방금 링크를 지운 녹음)
+    remove_file: 파일 하나를 지우고 해제한 바이트를 반환하는 함수 (reaper의 속도 제한 삭제)
+    """
+    removed, freed = 0, 0
+    if not os.path.isdir(CAS_ROOT):
+        return removed, freed
+    remove_file = remove_file or _remove_path
+    for prefix in os.listdir(CAS_ROOT):
+        prefix_dir = os.path.join(CAS_ROOT, prefix)
+        if not os.path.isdir(prefix_dir):
+            continue
+        for sha256 in os.listdir(prefix_dir):
+            folder = os.path.join(prefix_dir, sha256)
+            if "." in sha256 or not os.path.isdir(folder):
+                continue    # 잠금 파일
+            blob = os.path.join(folder, "audio")
+            if inodes is not None:
+                try:
+                    st = os.lstat(blob)
+                except FileNotFoundError:
+                    continue
+                if (st.st_dev, st.st_ino) not in inodes:
+                    continue
+            with _file_lock(_lock_path(sha256, "lock")):
+                if os.path.exists(blob) and os.lstat(blob).st_nlink > 1:
+                    continue
+                with _file_lock(_lock_path(sha256, "stt.lock"), blocking=False) as idle:
+                    if not idle:
+                        continue    # 전사 중
+                    for root, _, files in os.walk(folder):
+                        for name in files:
+                            freed += remove_file(os.path.join(root, name))
+                    shutil.rmtree(folder, ignore_errors=True)
+                    # 잠근 채로 지웁니다. 기다리던 쪽은 _file_lock에서 새 파일을 다시 엽니다.
+                    for kind in ("stt.lock", "lock"):
+                        try:
+                            os.unlink(_lock_path(sha256, kind))
+                        except FileNotFoundError:
+                            pass
+            removed += 1
+    return removed, freed
+
+
+if __name__ == "__main__":
+    # 삭제된 회의의 녹음/캐시 정리: python -m services.content_store
+    removed, freed = collect_garbage()
+    print(f"✅ 정리한 녹음 {removed}개 ({freed / 1024 / 1024:.1f} MB)")
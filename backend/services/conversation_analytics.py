@@ -0,0 +1,183 @@
+from typing import TYPE_CHECKING
+from services.segment_store import SegmentColumns, open_segment_store
+
+if TYPE_CHECKING:
+    import numpy as np
+# numpy는 분석을 요청할 때만 필요하므로 segment_store처럼 함수 안에서 가져옵니다.
+# 기본 히스토그램 구간(1분)과 침묵으로 볼 최소 간격(2초), 단위는 전사 시간과 같은 ms
+HISTOGRAM_BUCKET_MS = 60_000
+SILENCE_MIN_MS = 2_000
+SILENCE_TOP = 10
+
+
+class SegmentArrays:
+    """result.json의 segments를 시작 시간순으로 정렬된 NumPy 배열로 들고 있습니다."""
+
+    def __init__(self, segments: list):
+        import numpy as np
+        labels = {}
+        n = len(segments)
+        start = np.fromiter(((seg.get("start") or 0) for seg in segments), dtype=np.float64, count=n)
+        end = np.fromiter(((seg.get("end") or 0) for seg in segments), dtype=np.float64, count=n)
+        codes = np.fromiter(
+            (labels.setdefault(seg.get("speaker"), len(labels)) for seg in segments), dtype=np.int64, count=n
+        )
+        words = np.fromiter((len((seg.get("text") or "").split()) for seg in segments), dtype=np.int64, count=n)
+
+        order = np.argsort(start, kind="stable")
+        self.start = start[order]
+        self.end = np.maximum(end[order], self.start)  # 끝이 시작보다 앞선 구간은 길이 0으로 봅니다.
+        self.codes = codes[order]
+        self.words = words[order]
+        self.speakers = list(labels)
+
+    @classmethod
+    def from_store(cls, store: SegmentColumns) -> "SegmentArrays":
+        import numpy as np
+        seg = cls.__new__(cls)
+        start = store.numpy("start")
+        end = store.numpy("end")
+        codes = store.numpy("speaker_ids")
+        words = store.numpy("words")
+        if not store.sorted:
+            order = np.argsort(start, kind="stable")
+            start, end, codes, words = start[order], end[order], codes[order], words[order]
+        seg.start = start
+        seg.end = end   # segments.col에는 end >= start로 저장되어 있습니다.
+        seg.codes = codes
+        seg.words = words
+        seg.speakers = store.speakers
+        return seg
+
+    def __len__(self):
+        return len(self.start)
+
+
+def load_segment_arrays(result_path: str) -> SegmentArrays:
+    """segments.col의 열을 복사 없이 NumPy 배열로 엽니다. (result.json은 파싱하지 않음)"""
+    return SegmentArrays.from_store(open_segment_store(result_path))
+
+
+def _speaker_totals(seg: SegmentArrays) -> dict:
+    import numpy as np
+    k = len(seg.speakers)
+    dur = seg.end - seg.start
+    talk = np.bincount(seg.codes, weights=dur, minlength=k)
+    count = np.bincount(seg.codes, minlength=k)
+    words = np.bincount(seg.codes, weights=seg.words, minlength=k)
+    minutes = talk / 60_000
+    wpm = np.divide(words, minutes, out=np.zeros(k), where=minutes > 0)
+    return {"talk": talk, "count": count, "words": words, "wpm": wpm}
+
+
+def _turns(seg: SegmentArrays) -> dict:
+    """같은 화자가 연달아 말한 구간을 한 번의 발언(turn)으로 묶습니다."""
+    import numpy as np
+    k = len(seg.speakers)
+    first = np.flatnonzero(np.r_[True, seg.codes[1:] != seg.codes[:-1]])
+    turn_speaker = seg.codes[first]
+    turn_end = np.maximum.reduceat(seg.end, first)
+    turn_len = turn_end - seg.start[first]
+
+    turns = np.bincount(turn_speaker, minlength=k)
+    longest = np.zeros(k)
+    np.maximum.at(longest, turn_speaker, turn_len)
+    return {"turns": turns, "longest": longest}
+
+
+def _overlaps(seg: SegmentArrays) -> dict:
+    """앞선 구간이 끝나기 전에 시작한 구간을 겹침으로, 화자가 바뀐 겹침을 끼어들기로 셉니다."""
+    import numpy as np
+    k = len(seg.speakers)
+    # i번째 구간 직전까지 가장 늦게 끝난 시각
+    prev_end = np.maximum.accumulate(seg.end)[:-1]
+    start = seg.start[1:]
+    overlap = np.clip(np.minimum(prev_end, seg.end[1:]) - start, 0, None)
+    overlapped = start < prev_end
+    interrupt = overlapped & (seg.codes[1:] != seg.codes[:-1])
+
+    codes = seg.codes[1:]
+    return {
+        "interruptions": np.bincount(codes[interrupt], minlength=k),
+        "overlap": np.bincount(codes, weights=overlap, minlength=k),
+        "overlap_count": int(overlapped.sum()),
+        "prev_end": prev_end,
+    }
+
+
+def _silences(seg: SegmentArrays, prev_end: "np.ndarray", min_gap: float) -> dict:
+    import numpy as np
+    gap = seg.start[1:] - prev_end
+    idx = np.flatnonzero(gap >= min_gap)
+    gaps = gap[idx]
+    top = idx[np.argsort(gaps, kind="stable")[::-1][:SILENCE_TOP]]
+    return {
+        "min_gap_ms": min_gap,
+        "count": int(len(idx)),
+        "total_ms": float(gaps.sum()),
+        "longest_ms": float(gaps.max()) if len(gaps) else 0.0,
+        "longest": [{"start": float(prev_end[i]), "end": float(seg.start[i + 1])} for i in top],
+    }
+
+
+def _histogram(seg: SegmentArrays, bucket_ms: float) -> dict:
+    """고정 구간별 화자 발언 시간. 구간 경계에 걸친 발언도 잘라서 정확히 나눕니다.
+
+    t 이전까지의 누적 발언 시간 F(t) = Σ(t - start) - Σ(t - end) (start/end <= t)를
+    구간 경계마다 searchsorted와 누적합으로 계산한 뒤 차분합니다.
+    """
+    import numpy as np
+    duration = float(seg.end.max()) if len(seg) else 0.0
+    n_buckets = max(1, int(np.ceil(duration / bucket_ms)))
+    edges = np.arange(n_buckets + 1, dtype=np.float64) * bucket_ms
+
+    def covered_until(points: "np.ndarray") -> "np.ndarray":
+        points = np.sort(points)
+        csum = np.r_[0.0, np.cumsum(points)]
+        cnt = np.searchsorted(points, edges, side="right")
+        return cnt * edges - csum[cnt]
+
+    result = {}
+    for code, label in enumerate(seg.speakers):
+        mask = seg.codes == code
+        talk_until = covered_until(seg.start[mask]) - covered_until(seg.end[mask])
+        result[label] = np.round(np.diff(talk_until), 1).tolist()
+    return {"bucket_ms": bucket_ms, "buckets": n_buckets, "speakers": result}
+
+
+def analyze_segments(segments: list, bucket_ms: float = HISTOGRAM_BUCKET_MS, min_gap: float = SILENCE_MIN_MS) -> dict:
+    return analyze_arrays(SegmentArrays(segments), bucket_ms, min_gap)
+
+
+def analyze_arrays(seg: SegmentArrays, bucket_ms: float = HISTOGRAM_BUCKET_MS, min_gap: float = SILENCE_MIN_MS) -> dict:
+    """회의 하나의 대화 지표를 계산합니다. (반복문 없이 배열 연산으로)"""
+    if not len(seg):
+        return {"segments": 0, "duration_ms": 0, "speakers": {}, "silence": None, "histogram": None}
+
+    totals = _speaker_totals(seg)
+    turns = _turns(seg)
+    overlaps = _overlaps(seg)
+    total_talk = totals["talk"].sum()
+
+    speakers = {}
+    for code, label in enumerate(seg.speakers):
+        speakers[label] = {
+            "talk_time_ms": float(totals["talk"][code]),
+            "ratio": round(float(totals["talk"][code] / total_talk) * 100, 1) if total_talk else 0,
+            "segments": int(totals["count"][code]),
+            "turns": int(turns["turns"][code]),
+            "words": int(totals["words"][code]),
+            "wpm": round(float(totals["wpm"][code]), 1),
+            "longest_monologue_ms": float(turns["longest"][code]),
+            "interruptions": int(overlaps["interruptions"][code]),
+            "overlap_ms": float(overlaps["overlap"][code]),
+        }
+
+    return {
+        "segments": len(seg),
+        "duration_ms": float(seg.end.max() - seg.start.min()),
+        "overlaps": overlaps["overlap_count"],
+        "speakers": speakers,
+        "silence": _silences(seg, overlaps["prev_end"], min_gap),
+        "histogram": _histogram(seg, bucket_ms),
+    }
@@ -0,0 +1,204 @@
+import os
+import time
+import random
+import asyncio
+import threading
+from contextlib import ExitStack
+from typing import Optional
+import httpx
+
+# 외부 HTTP 호출(Clova, OpenAI, 서버 자기 자신)은 전용 이벤트 루프 스레드 하나에서
+# 공급자별 httpx.AsyncClient로 보냅니다. 연결은 keep-alive 풀에서 재사용됩니다.
+# 호출하는 쪽(작업 워커, to_thread로 돌리는 요약 등)은 모두 동기 코드라 request()로 응답을 기다립니다.
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+HTTP_STOP_TIMEOUT_SEC = 10.0
+
+# 공급자별 타임아웃(초)과 풀 크기, 재시도 횟수
+# retry_read_timeout: 응답을 기다리다 시간이 초과됐을 때 다시 보낼지 (Clova 동기 STT는 다시 보내면 비용이 두 배)
+PROVIDERS = {
+    "clova": {
+        "timeout": httpx.Timeout(connect=10.0, read=float(os.getenv("HTTP_CLOVA_READ_TIMEOUT_SEC", "900")), write=300.0, pool=60.0),
+        "max_connections": 8,
+        "retries": 2,
+        "retry_read_timeout": False,
+    },
+    "openai": {
+        "timeout": httpx.Timeout(connect=10.0, read=float(os.getenv("HTTP_OPENAI_READ_TIMEOUT_SEC", "120")), write=30.0, pool=30.0),
+        "max_connections": 16,
+        "retries": 3,
+        "retry_read_timeout": True,
+    },
+    "internal": {
+        "timeout": httpx.Timeout(5.0),
+        "max_connections": 4,
+        "retries": 1,
+        "retry_read_timeout": True,
+    },
+}
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout, httpx.ReadError, httpx.RemoteProtocolError)
+RETRY_BACKOFF_BASE_SEC = 1.0
+RETRY_BACKOFF_MAX_SEC = 30.0
+
+
+def _backoff(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), RETRY_BACKOFF_MAX_SEC)
+    delay = min(RETRY_BACKOFF_BASE_SEC * 2 ** attempt, RETRY_BACKOFF_MAX_SEC)
+    return delay * random.uniform(0.5, 1.5)
+
+
+class HttpClients:
+    """공급자별 httpx.AsyncClient를 전용 이벤트 루프 스레드에서 관리합니다."""
+
+    def __init__(self, providers: dict = PROVIDERS):
+        self.providers = providers
+        self._clients = {}
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+        self.metrics = {
+            name: {"requests": 0, "in_flight": 0, "retries": 0, "failures": 0, "connects": 0, "total_ms": 0.0}
+            for name in providers
+        }
+
+    def start(self):
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def run():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._thread = threading.Thread(target=run, name="http-clients", daemon=True)
+            self._thread.start()
+            ready.wait()
+            self._loop = loop
+
+    def stop(self):
+        """열린 연결을 닫고 루프 스레드를 멈춥니다."""
+        with self._lock:
+            if self._loop is None:
+                return
+            try:
+                asyncio.run_coroutine_threadsafe(self._close_clients(), self._loop).result(HTTP_STOP_TIMEOUT_SEC)
+            except Exception as e:
+                print(f"❌ HTTP 연결 정리 실패: {e}")
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+    async def _close_clients(self):
+        clients, self._clients = self._clients, {}
+        for client in clients.values():
+            await client.aclose()
+
+    def _client(self, provider: str) -> httpx.AsyncClient:
+        # 루프 스레드 안에서만 부르므로 잠금이 필요 없습니다.
+        client = self._clients.get(provider)
+        if client is None:
+            config = self.providers[provider]
+            client = httpx.AsyncClient(
+                timeout=config["timeout"],
+                limits=httpx.Limits(
+                    max_connections=config["max_connections"],
+                    max_keepalive_connections=config["max_connections"],
+                    keepalive_expiry=60.0,
+                ),
+            )
+            self._clients[provider] = client
+        return client
+
+    async def _send(self, provider: str, method: str, url: str, files_from: Optional[dict], kwargs: dict) -> httpx.Response:
+        config = self.providers[provider]
+        metrics = self.metrics[provider]
+        client = self._client(provider)
+
+        async def trace(event: str, info: dict):
+            # 새 TCP 연결을 맺을 때만 올라갑니다. requests 대비 이 값이 작을수록 연결을 잘 재사용하는 것
+            if event == "connection.connect_tcp.complete":
+                metrics["connects"] += 1
+
+        metrics["requests"] += 1
+        metrics["in_flight"] += 1
+        started = time.perf_counter()
+        try:
+            attempt = 0
+            while True:
+                # 파일은 시도마다 새로 열어 처음부터 조각씩 흘려 보내고, 끝나면 바로 닫습니다.
+                with ExitStack() as stack:
+                    files = dict(kwargs.get("files") or {})
+                    for field, path in (files_from or {}).items():
+                        files[field] = (os.path.basename(path), stack.enter_context(open(path, "rb")))
+                    request_kwargs = {**kwargs, "files": files} if files else kwargs
+                    try:
+                        response = await client.request(method, url, extensions={"trace": trace}, **request_kwargs)
+                    except (RETRY_ERRORS + ((httpx.ReadTimeout,) if config["retry_read_timeout"] else ())) as e:
+                        if attempt >= config["retries"]:
+                            raise
+                        delay, reason = _backoff(attempt), type(e).__name__
+                    else:
+                        if response.status_code not in RETRY_STATUSES or attempt >= config["retries"]:
+                            return response
+                        delay, reason = _backoff(attempt, response), f"HTTP {response.status_code}"
+                attempt += 1
+                metrics["retries"] += 1
+                print(f"🔁 {provider} 요청 재시도 {attempt}/{config['retries']} ({reason}) - {delay:.1f}초 후")
+                await asyncio.sleep(delay)
+        except Exception:
+            metrics["failures"] += 1
+            raise
+        finally:
+            metrics["in_flight"] -= 1
+            metrics["total_ms"] += (time.perf_counter() - started) * 1000
+
+    def request(self, provider: str, method: str, url: str, files_from: Optional[dict] = None, **kwargs) -> httpx.Response:
+        """files_from={필드: 파일 경로}는 파일을 열어 스트리밍으로 보냅니다."""
+        if provider not in self.providers:
+            raise ValueError(f"알 수 없는 HTTP 공급자: {provider}")
+        self.start()
+        return asyncio.run_coroutine_threadsafe(self._send(provider, method, url, files_from, kwargs), self._loop).result()
+
+    def stats(self) -> dict:
+        result = {}
+        for name, metrics in self.metrics.items():
+            client = self._clients.get(name)
+            # httpcore 연결 풀 상태 (내부 속성이라 없으면 0으로 표시)
+            pool = getattr(getattr(client, "_transport", None), "_pool", None)
+            connections = list(getattr(pool, "connections", []))
+            done = metrics["requests"] - metrics["in_flight"]
+            result[name] = {
+                **{k: v for k, v in metrics.items() if k != "total_ms"},
+                "avg_ms": round(metrics["total_ms"] / done, 1) if done else 0.0,
+                "pool_connections": len(connections),
+                "pool_idle": sum(1 for c in connections if c.is_idle()),
+                "max_connections": self.providers[name]["max_connections"],
+            }
+        return result
+
+
+# 앱 전체에서 공유하는 HTTP 클라이언트
+http_clients = HttpClients()
+
+
+def openai_chat_completion(messages: list, model: str = "gpt-4-turbo", temperature: float = 0.3, max_tokens: int = 1500) -> str:
+    """OpenAI Chat Completions API를 풀 연결로 호출하고 답변 내용을 반환합니다.
+
+    API 키는 .env를 읽은 뒤의 값을 쓰도록 호출할 때 가져옵니다.
+    """
+    response = http_clients.request(
+        "openai",
+        "POST",
+        f"{OPENAI_BASE_URL}/chat/completions",
+        headers={"Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}"},
+        json={"model": model, "messages": messages, "temperature": temperature, "max_tokens": max_tokens},
+    )
+    response.raise_for_status()
+    return response.json()["choices"][0]["message"]["content"].strip()
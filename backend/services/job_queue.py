@@ -0,0 +1,317 @@
+import os
+import json
+import uuid
+import random
+import socket
+import threading
+import traceback
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import and_, or_, func, update
+from sqlalchemy.orm import Session
+from core.database import MeetingSessionLocal
+from models.meeting_tables import Job
+from services.meeting_writer import meeting_writer
+
+# 전사/요약처럼 오래 걸리는 작업을 SQLite 대기열(jobs 테이블)로 돌립니다.
+# API 프로세스 안의 워커 스레드(JOB_EMBEDDED_WORKERS=1, 기본값) 또는 별도 프로세스(python worker.py)가 실행합니다.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_EMBEDDED_WORKERS = os.getenv("JOB_EMBEDDED_WORKERS", "1") != "0"
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+# 이 시간 동안 하트비트가 없으면 워커가 죽은 것으로 보고 다른 워커가 작업을 가져갑니다.
+JOB_VISIBILITY_TIMEOUT_SEC = float(os.getenv("JOB_VISIBILITY_TIMEOUT_SEC", "300"))
+JOB_BACKOFF_BASE_SEC = float(os.getenv("JOB_BACKOFF_BASE_SEC", "30"))
+JOB_BACKOFF_MAX_SEC = 3600.0
+JOB_POLL_SEC = 2.0
+JOB_STOP_TIMEOUT_SEC = 5.0
+
+# kind -> 함수(**payload). 각 서비스 모듈이 @job_handler로 등록합니다.
+_handlers = {}
+
+
+def job_handler(kind: str):
+    def register(fn):
+        _handlers[kind] = fn
+        return fn
+    return register
+
+
+def _backoff(attempts: int) -> timedelta:
+    delay = min(JOB_BACKOFF_BASE_SEC * 2 ** max(attempts - 1, 0), JOB_BACKOFF_MAX_SEC)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+
+# --- 저장소 작업 (쓰기 스레드에서 실행) ---
+def enqueue_job(db: Session, kind: str, payload: dict, max_attempts: int = JOB_MAX_ATTEMPTS) -> int:
+    job = Job(kind=kind, payload=json.dumps(payload, ensure_ascii=False), status="queued", max_attempts=max_attempts)
+    db.add(job)
+    db.flush()
+    return job.id
+
+
+def _ready_condition(now: datetime):
+    return or_(
+        and_(Job.status == "queued", Job.run_after <= now),
+        # 하트비트가 끊긴(워커가 죽은) 작업
+        and_(Job.status == "running", Job.locked_until < now, Job.attempts < Job.max_attempts),
+    )
+
+
+def _fail_exhausted_jobs(db: Session, now: datetime):
+    """하트비트가 끊겼는데 재시도 횟수를 다 쓴 작업을 failed로 정리합니다. (그대로 두면 계속 running으로 남습니다)"""
+    db.execute(
+        update(Job)
+        .where(Job.status == "running", Job.locked_until < now, Job.attempts >= Job.max_attempts)
+        .values(
+            status="failed",
+            locked_until=None,
+            last_error="워커가 응답하지 않아 작업이 중단되었습니다. (재시도 횟수 초과)",
+            finished_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _claim_job(db: Session, worker_id: str, kinds: list, visibility_sec: float):
+    """실행할 작업 하나를 running으로 바꾸고 (id, kind, payload, attempts)를 반환합니다. 없으면 None"""
+    now = datetime.now()
+    _fail_exhausted_jobs(db, now)
+    ready = _ready_condition(now)
+    job_id = (
+        db.query(Job.id)
+        .filter(ready, Job.kind.in_(kinds))
+        .order_by(Job.run_after, Job.id)
+        .limit(1)
+        .scalar()
+    )
+    if job_id is None:
+        return None
+    # 다른 워커 프로세스가 먼저 가져가지 않았을 때만 바뀌도록 조건을 다시 겁니다.
+    claimed = db.execute(
+        update(Job)
+        .where(Job.id == job_id, ready)
+        .values(
+            status="running",
+            attempts=Job.attempts + 1,
+            locked_until=now + timedelta(seconds=visibility_sec),
+            worker_id=worker_id,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if claimed.rowcount != 1:
+        return None
+    kind, payload, attempts = db.query(Job.kind, Job.payload, Job.attempts).filter(Job.id == job_id).one()
+    return job_id, kind, json.loads(payload), attempts
+
+
+def _heartbeat(db: Session, job_id: int, worker_id: str, visibility_sec: float) -> bool:
+    result = db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.worker_id == worker_id, Job.status == "running")
+        .values(locked_until=datetime.now() + timedelta(seconds=visibility_sec))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def _complete_job(db: Session, job_id: int, worker_id: str):
+    job = db.get(Job, job_id)
+    if job is None or job.worker_id != worker_id or job.status != "running":
+        return
+    job.status = "done"
+    job.locked_until = None
+    job.finished_at = datetime.now()
+
+
+def _fail_job(db: Session, job_id: int, worker_id: str, error: str):
+    job = db.get(Job, job_id)
+    if job is None or job.worker_id != worker_id or job.status != "running":
+        return
+    job.last_error = error
+    job.locked_until = None
+    if job.attempts >= job.max_attempts:
+        job.status = "failed"
+        job.finished_at = datetime.now()
+    else:
+        job.status = "queued"
+        job.run_after = datetime.now() + _backoff(job.attempts)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _recover_jobs(db: Session, worker_id: str) -> int:
+    """이 호스트에서 죽은 프로세스가 잡고 있던 작업을 바로 다시 대기열에 넣습니다.
+
+    다른 호스트의 작업은 visibility timeout이 지나면 _claim_job이 가져갑니다.
+    """
+    host = worker_id.split(":")[0]
+    recovered = 0
+    for job in db.query(Job).filter(Job.status == "running"):
+        owner = (job.worker_id or "").split(":")
+        if len(owner) != 3 or owner[0] != host:
+            continue
+        pid = int(owner[1])
+        # 컨테이너처럼 재시작해도 pid가 같을 수 있어 인스턴스 토큰까지 비교합니다.
+        if (pid == os.getpid() and job.worker_id != worker_id) or not _pid_alive(pid):
+            job.locked_until = None
+            if job.attempts >= job.max_attempts:
+                job.status = "failed"
+                job.last_error = "워커가 종료되어 작업이 중단되었습니다."
+                job.finished_at = datetime.now()
+            else:
+                job.status = "queued"
+                job.run_after = datetime.now()
+            recovered += 1
+    return recovered
+
+
+class JobWorkerPool:
+    """jobs 테이블에서 작업을 가져와 실행하는 워커 스레드 묶음"""
+
+    def __init__(
+        self,
+        concurrency: int = JOB_WORKERS,
+        visibility_sec: float = JOB_VISIBILITY_TIMEOUT_SEC,
+        poll_sec: float = JOB_POLL_SEC,
+    ):
+        self.concurrency = concurrency
+        self.visibility_sec = visibility_sec
+        self.poll_sec = poll_sec
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+        self.running = {}       # 스레드 이름 -> 실행 중인 작업 id
+        self.completed = 0
+        self.failed = 0
+
+    def start(self):
+        with self._lock:
+            if self._threads:
+                return
+            self._stop.clear()
+            recovered = meeting_writer.run(_recover_jobs, self.worker_id)
+            if recovered:
+                print(f"♻️ 중단된 작업 {recovered}개를 다시 대기열에 넣었습니다.")
+            for i in range(self.concurrency):
+                thread = threading.Thread(target=self._loop, name=f"job-worker-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self):
+        """새 작업은 더 가져가지 않습니다. 실행 중인 작업은 잠시 기다리고, 못 끝나면 다음 시작 때 복구됩니다."""
+        with self._lock:
+            self._stop.set()
+            self._wake.set()
+            for thread in self._threads:
+                thread.join(JOB_STOP_TIMEOUT_SEC)
+            self._threads = []
+
+    def wake(self):
+        self._wake.set()
+
+    def _loop(self):
+        name = threading.current_thread().name
+        while not self._stop.is_set():
+            try:
+                job = meeting_writer.run(_claim_job, self.worker_id, list(_handlers), self.visibility_sec)
+            except Exception as e:
+                print(f"❌ 작업 가져오기 실패: {e}")
+                job = None
+            if job is None:
+                self._wake.wait(self.poll_sec)
+                self._wake.clear()
+                continue
+            self.running[name] = job[0]
+            try:
+                self._run(*job)
+            finally:
+                self.running.pop(name, None)
+
+    def _run(self, job_id: int, kind: str, payload: dict, attempts: int):
+        print(f"🛠️ 작업 #{job_id} ({kind}) 시작 - {attempts}번째 시도")
+        done = threading.Event()
+
+        def heartbeat():
+            while not done.wait(self.visibility_sec / 3):
+                try:
+                    meeting_writer.run(_heartbeat, job_id, self.worker_id, self.visibility_sec)
+                except Exception as e:
+                    print(f"❌ 작업 #{job_id} 하트비트 실패: {e}")
+
+        beat = threading.Thread(target=heartbeat, name=f"job-heartbeat-{job_id}", daemon=True)
+        beat.start()
+        try:
+            _handlers[kind](**payload)
+        except Exception as e:
+            self.failed += 1
+            print(f"❌ 작업 #{job_id} ({kind}) 실패: {e}")
+            meeting_writer.run(_fail_job, job_id, self.worker_id, traceback.format_exc(limit=5))
+        else:
+            self.completed += 1
+            meeting_writer.run(_complete_job, job_id, self.worker_id)
+            print(f"✅ 작업 #{job_id} ({kind}) 완료")
+        finally:
+            done.set()
+            beat.join()
+
+    def stats(self) -> dict:
+        db = MeetingSessionLocal()
+        try:
+            counts = dict(db.query(Job.status, func.count(Job.id)).group_by(Job.status).all())
+        finally:
+            db.close()
+        return {
+            "queued": counts.get("queued", 0),
+            "running": counts.get("running", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "worker_id": self.worker_id,
+            "concurrency": self.concurrency if self._threads else 0,
+            "running_here": list(self.running.values()),
+            "completed_here": self.completed,
+            "failed_here": self.failed,
+        }
+
+
+def get_job(db: Session, job_id: int) -> Optional[dict]:
+    job = db.get(Job, job_id)
+    if job is None:
+        return None
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "run_after": job.run_after,
+        "last_error": job.last_error,
+        "created_at": job.created_at,
+        "finished_at": job.finished_at,
+    }
+
+
+# 앱 전체에서 공유하는 작업 워커
+job_workers = JobWorkerPool()
+
+
+def submit_job(kind: str, payload: dict, max_attempts: int = JOB_MAX_ATTEMPTS) -> int:
+    """작업을 대기열에 넣고(커밋까지 기다림) 이 프로세스의 워커를 깨웁니다."""
+    job_id = meeting_writer.run(enqueue_job, kind, payload, max_attempts)
+    job_workers.wake()
+    return job_id
+
+
+async def submit_job_async(kind: str, payload: dict, max_attempts: int = JOB_MAX_ATTEMPTS) -> int:
+    job_id = await meeting_writer.run_async(enqueue_job, kind, payload, max_attempts)
+    job_workers.wake()
+    return job_id
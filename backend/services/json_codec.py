@@ -0,0 +1,45 @@
+import json
+from uuid import UUID
+from datetime import date, datetime
+from fastapi.responses import JSONResponse
+
+# orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 동작합니다.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def _default(value):
+    # orjson과 같이 날짜/시간은 ISO 8601 문자열, UUID는 하이픈 있는 문자열로 내보냅니다. (get_job의 created_at 등)
+    # 그 밖의 타입은 orjson처럼 TypeError로 알려 백엔드에 따라 결과가 달라지지 않게 합니다.
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data) -> bytes:
+    """UTF-8 바이트로 된 compact JSON을 만듭니다. (한글은 이스케이프하지 않음)"""
+    if orjson is not None:
+        # 화자 라벨처럼 None/숫자가 키가 되는 경우도 표준 json과 같이 문자열로 바꿉니다.
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def loads(data):
+    """bytes 또는 str JSON을 파싱합니다."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """앱 전체의 기본 응답 클래스: 위 dumps로 직렬화합니다."""
+    media_type = "application/json; charset=utf-8"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
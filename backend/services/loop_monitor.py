@@ -0,0 +1,57 @@
+import asyncio
+from collections import deque
+
+# 이벤트 루프 지연 측정 간격(초)과 보관할 최근 측정값 개수
+LOOP_LAG_INTERVAL = 0.1
+LOOP_LAG_SAMPLES = 600
+
+
+class LoopLagMonitor:
+    """일정 간격으로 잠들었다 깨어나며, 예정보다 늦게 깨어난 시간(이벤트 루프 지연)을 기록합니다."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL, samples: int = LOOP_LAG_SAMPLES):
+        self.interval = interval
+        self.samples = deque(maxlen=samples)
+        self.max_lag = 0.0
+        self._task = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - start - self.interval)
+            self.samples.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def stats(self) -> dict:
+        ordered = sorted(self.samples)
+        if not ordered:
+            return {"samples": 0}
+
+        def percentile(p):
+            return ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000
+
+        return {
+            "samples": len(ordered),
+            "p50_ms": round(percentile(0.50), 3),
+            "p99_ms": round(percentile(0.99), 3),
+            "recent_max_ms": round(ordered[-1] * 1000, 3),
+            "max_ms": round(self.max_lag * 1000, 3),
+        }
+
+
+loop_monitor = LoopLagMonitor()
@@ -0,0 +1,189 @@
+import bisect
+import threading
+from typing import Optional
+from core.database import MeetingSessionLocal
+from models.meeting_tables import MeetingRecord
+from services.meeting_repository import to_meeting_obj, current_seq, list_changes_since
+from services.json_codec import dumps as _dumps
+
+
+class _DateBuckets:
+    """날짜별 회의 묶음과, 묶음마다 미리 직렬화한 바이트를 들고 있습니다.
+
+    회의 하나가 바뀌면 그 날짜 묶음만 다시 직렬화하고, 전체 응답은 묶음 바이트를 이어 붙여 만듭니다.
+    """
+
+    def __init__(self):
+        self.buckets = {}       # date -> {id: 회의 객체}
+        self.dates = []         # 정렬된 날짜 목록
+        self.bucket_bytes = {}  # date -> b'"date":[...]'
+        self.payload = None
+
+    def put(self, date: str, record_id: int, meeting: dict):
+        bucket = self.buckets.get(date)
+        if bucket is None:
+            bucket = self.buckets[date] = {}
+            bisect.insort(self.dates, date)
+        bucket[record_id] = meeting
+        self.bucket_bytes.pop(date, None)
+        self.payload = None
+
+    def remove(self, date: str, record_id: int):
+        bucket = self.buckets.get(date)
+        if bucket is None or record_id not in bucket:
+            return
+        del bucket[record_id]
+        self.bucket_bytes.pop(date, None)
+        self.payload = None
+        if not bucket:
+            del self.buckets[date]
+            del self.dates[bisect.bisect_left(self.dates, date)]
+
+    def render(self) -> bytes:
+        if self.payload is None:
+            parts = []
+            for date in self.dates:
+                part = self.bucket_bytes.get(date)
+                if part is None:
+                    bucket = self.buckets[date]
+                    # 저장소와 같은 (date, id) 순서를 유지합니다.
+                    items = [bucket[record_id] for record_id in sorted(bucket)]
+                    part = self.bucket_bytes[date] = _dumps(date) + b":" + _dumps(items)
+                parts.append(part)
+            self.payload = b"{" + b",".join(parts) + b"}"
+        return self.payload
+
+
+class MeetingIndex:
+    """GET /api/meetings 응답을 메모리에 직렬화된 바이트로 보관합니다.
+
+    요청마다 저장소의 최신 seq만 확인하고(인덱스 조회 1번), 바뀐 게 있으면
+    그 이후 변경분만 읽어 해당 회의가 속한 날짜 묶음만 고칩니다.
+    다른 프로세스가 쓴 변경도 저장소 함수를 거쳐 seq를 받았다면 같은 방법으로 따라잡습니다.
+    seq 확인과 만들어 둔 바이트 반환은 잠금 없이 하고, 변경분을 반영할 때만 잠급니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # hits/misses는 잠금 없는 경로에서도 세므로, 반영 작업과 상관없는 작은 잠금으로 셉니다.
+        self._count_lock = threading.Lock()
+        self._views = None     # group_id(None=전체) -> _DateBuckets
+        self._located = {}     # 회의 id -> (group_id, date)
+        self._seq = 0          # 마지막으로 반영한 seq
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+        self.applied_changes = 0
+
+    def invalidate(self):
+        with self._lock:
+            self._views = None
+
+    def _count(self, hit: bool):
+        with self._count_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _view(self, group_id) -> _DateBuckets:
+        view = self._views.get(group_id)
+        if view is None:
+            view = self._views[group_id] = _DateBuckets()
+        return view
+
+    def _put(self, record_id: int, group_id, date: str, meeting: dict):
+        self._remove(record_id)
+        self._view(None).put(date, record_id, meeting)
+        if group_id is not None:
+            self._view(group_id).put(date, record_id, meeting)
+        self._located[record_id] = (group_id, date)
+
+    def _remove(self, record_id: int):
+        located = self._located.pop(record_id, None)
+        if located is None:
+            return
+        group_id, date = located
+        self._views[None].remove(date, record_id)
+        if group_id is not None:
+            self._views[group_id].remove(date, record_id)
+
+    def _reload(self, db):
+        # 다 채울 때까지 seq를 맞추지 않아서, 잠금 없이 읽는 쪽이 반쯤 채운 목록을 내보내지 않습니다.
+        self._seq = -1
+        self._views = {None: _DateBuckets()}
+        self._located = {}
+        seq = current_seq(db)
+        for record in db.query(MeetingRecord).filter(MeetingRecord.deleted == False):
+            self._put(record.id, record.group_id, record.date, to_meeting_obj(record))
+        self._seq = seq
+        self.reloads += 1
+
+    def _catch_up(self, db, latest: int):
+        while self._seq < latest:
+            changes, _ = list_changes_since(db, self._seq, limit=1000)
+            if not changes:
+                break
+            for change in changes:
+                if change["op"] == "delete":
+                    self._remove(change["id"])
+                else:
+                    self._put(change["id"], change["group_id"], change["date"], change["meeting"])
+                self._seq = change["seq"]
+                self.applied_changes += 1
+
+    def _cached_payload(self, group_id, latest: int) -> Optional[bytes]:
+        """latest까지 반영되어 있고 직렬화해 둔 바이트가 있으면 반환합니다. (잠금 없이 호출)"""
+        # _catch_up/_reload는 날짜 묶음을 고친 뒤에 _seq를 올리므로 _seq를 먼저 읽습니다.
+        if self._seq != latest:
+            return None
+        views = self._views
+        if views is None:
+            return None
+        view = views.get(group_id)
+        # 묶음이 없으면 반영 중인지 잠금 없이는 알 수 없으므로 잠그고 다시 확인합니다.
+        return None if view is None else view.payload
+
+    def get_payload(self, group_id: Optional[int] = None) -> bytes:
+        db = MeetingSessionLocal()
+        try:
+            latest = current_seq(db)
+            payload = self._cached_payload(group_id, latest)
+            if payload is not None:
+                self._count(hit=True)
+                return payload
+
+            with self._lock:
+                # 기다리는 동안 다른 요청이 더 앞까지 반영했을 수 있어 새 스냅샷으로 다시 확인합니다.
+                db.rollback()
+                latest = current_seq(db)
+                if self._views is None or latest < self._seq:
+                    self._reload(db)
+                elif latest > self._seq:
+                    self._catch_up(db, latest)
+
+                view = self._views.get(group_id)
+                if view is None:
+                    self._count(hit=True)
+                    return b"{}"
+                self._count(hit=view.payload is not None)
+                return view.render()
+        finally:
+            db.close()
+
+    def stats(self) -> dict:
+        with self._lock, self._count_lock:
+            views = self._views or {}
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "reloads": self.reloads,
+                "applied_changes": self.applied_changes,
+                "seq": self._seq,
+                "meetings": len(self._located),
+                "cached_bytes": sum(len(v.payload) for v in views.values() if v.payload is not None),
+            }
+
+
+# 앱 전체에서 공유하는 회의 목록 캐시
+meeting_index = MeetingIndex()
@@ -0,0 +1,373 @@
+import os
+import re
+import sys
+import json
+import uuid
+import base64
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import and_, or_, func, inspect
+from sqlalchemy.orm import Session
+from core.database import BASE_DIR, MeetingBase, MeetingSessionLocal, meeting_engine
+from models.meeting_tables import MeetingRecord, MeetingAlias, RollupContribution
+from services.rollups import set_meeting_contribution, rebuild_rollups
+from services.speaker_stats import speakers_from_result_files
+from services.meeting_writer import meeting_writer
+
+# 기존 회의 정보 JSON 파일 경로 (일회성 가져오기 대상)
+MEETINGS_JSON_PATH = os.path.join(BASE_DIR, "meetings.json")
+UPLOAD_ROOT = os.path.join(BASE_DIR, "uploaded_files")
+
+# 예전 폴더 이름: timestamp(YYYYmmdd_HHMMSS)_이름_uuid6. 이름을 바꾸면 가운데만 바뀌었습니다.
+_LEGACY_DIRECTORY_RE = re.compile(r"^(\d{8}_\d{6})_.+_([0-9a-f]{6})$")
+
+
+def to_meeting_obj(record: MeetingRecord) -> dict:
+    """테이블 행을 기존 meetings.json과 같은 형태의 회의 객체로 바꿉니다."""
+    return {
+        "name": record.name,
+        "description": record.description,
+        "is_interested": record.is_interested,
+        "is_ended": record.is_ended,
+        "directory": record.directory,
+    }
+
+
+# --- 조회 ---
+def encode_cursor(date: str, record_id: int) -> str:
+    raw = json.dumps([date, record_id], ensure_ascii=False).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """잘못된 커서면 ValueError를 발생시킵니다."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date, record_id = json.loads(base64.urlsafe_b64decode(padded))
+        return str(date), int(record_id)
+    except Exception:
+        raise ValueError("invalid cursor")
+
+
+def list_meetings_page(
+    db: Session,
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    is_interested: Optional[bool] = None,
+    is_ended: Optional[bool] = None,
+    group_id: Optional[int] = None,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+):
+    """(date, id) 순서로 조건에 맞는 회의를 limit개까지 읽습니다.
+
+    반환값: (날짜별로 묶은 회의 dict, 다음 페이지 커서 또는 None)
+    """
+    query = db.query(MeetingRecord).filter(MeetingRecord.deleted == False)
+    if group_id is not None:
+        query = query.filter(MeetingRecord.group_id == group_id)
+    if is_interested is not None:
+        query = query.filter(MeetingRecord.is_interested == is_interested)
+    if is_ended is not None:
+        query = query.filter(MeetingRecord.is_ended == is_ended)
+    if date_from:
+        query = query.filter(MeetingRecord.date >= date_from)
+    if date_to:
+        query = query.filter(MeetingRecord.date <= date_to)
+    if cursor:
+        last_date, last_id = decode_cursor(cursor)
+        query = query.filter(or_(
+            MeetingRecord.date > last_date,
+            and_(MeetingRecord.date == last_date, MeetingRecord.id > last_id),
+        ))
+
+    # 한 개 더 읽어서 다음 페이지가 있는지 확인합니다.
+    records = query.order_by(MeetingRecord.date, MeetingRecord.id).limit(limit + 1).all()
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        next_cursor = encode_cursor(records[-1].date, records[-1].id)
+
+    meetings = {}
+    for record in records:
+        meetings.setdefault(record.date, []).append(to_meeting_obj(record))
+    return meetings, next_cursor
+
+
+def get_meeting_by_directory(db: Session, directory: str) -> Optional[MeetingRecord]:
+    return (
+        db.query(MeetingRecord)
+        .filter(MeetingRecord.directory == directory, MeetingRecord.deleted == False)
+        .first()
+    )
+
+
+# --- 회의 ID / 예전 이름 ---
+def new_meeting_directory() -> str:
+    """새 회의의 ID(= 폴더 이름). 회의 이름을 넣지 않으므로 이름을 바꿔도 바뀌지 않습니다."""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:12]}"
+
+
+def add_meeting_alias(db: Session, alias: str, directory: str):
+    if alias != directory:
+        db.merge(MeetingAlias(alias=alias, directory=directory))
+
+
+def resolve_directory(db: Session, directory: str) -> tuple:
+    """URL의 directory를 지금 회의 ID로 바꿉니다.
+
+    반환값: (회의 ID 또는 None, 별칭 테이블에 새로 기록할 만한지)
+    예전에는 이름을 바꾸면 폴더도 timestamp_새이름_uuid로 바뀌었으므로,
+    별칭 테이블에 없으면 timestamp와 uuid가 같은 회의를 찾아봅니다.
+    """
+    if get_meeting_by_directory(db, directory):
+        return directory, False
+    alias = db.get(MeetingAlias, directory)
+    if alias is not None:
+        return alias.directory, False
+    match = _LEGACY_DIRECTORY_RE.match(directory)
+    if match is None:
+        return None, False
+    timestamp, unique_id = match.groups()
+    candidates = (
+        db.query(MeetingRecord.directory)
+        .filter(
+            MeetingRecord.directory.like(f"{timestamp}\\_%\\_{unique_id}", escape="\\"),
+            MeetingRecord.deleted == False,
+        )
+        .limit(2)
+        .all()
+    )
+    if len(candidates) != 1:
+        return None, False
+    return candidates[0][0], True
+
+
+def resolve_meeting_directory(directory: str) -> str:
+    """폴더가 있으면 그대로, 없으면 별칭/예전 이름으로 회의 ID를 찾습니다. 못 찾으면 입력 그대로 반환합니다."""
+    if os.path.isdir(os.path.join(UPLOAD_ROOT, directory)):
+        return directory
+    db = MeetingSessionLocal()
+    try:
+        resolved, learned = resolve_directory(db, directory)
+    finally:
+        db.close()
+    if resolved is None:
+        return directory
+    if learned:
+        # 다음부터는 별칭 테이블에서 바로 찾도록 기록해 둡니다. (응답은 기다리지 않음)
+        meeting_writer.submit(add_meeting_alias, directory, resolved)
+    return resolved
+
+
+def current_seq(db: Session) -> int:
+    return db.query(func.coalesce(func.max(MeetingRecord.seq), 0)).scalar()
+
+
+def list_changes_since(db: Session, since: int, limit: int = 1000):
+    """seq가 since보다 큰 변경(추가/수정/삭제)을 seq 순서로 반환합니다.
+
+    반환값: (변경 목록, 더 남은 변경이 있는지)
+    """
+    records = (
+        db.query(MeetingRecord)
+        .filter(MeetingRecord.seq > since)
+        .order_by(MeetingRecord.seq)
+        .limit(limit + 1)
+        .all()
+    )
+    has_more = len(records) > limit
+    changes = []
+    for record in records[:limit]:
+        if record.deleted:
+            op = "delete"
+            meeting = {"directory": record.directory}
+        else:
+            op = "insert" if record.created_seq > since else "update"
+            meeting = to_meeting_obj(record)
+        changes.append({
+            "op": op,
+            "seq": record.seq,
+            "id": record.id,
+            "date": record.date,
+            "group_id": record.group_id,
+            "meeting": meeting,
+        })
+    return changes, has_more
+
+
+# --- 추가 / 수정 / 삭제 (행 단위) ---
+# 커밋은 호출하는 쪽(meeting_writer)이 여러 쓰기를 묶어서 한 번에 합니다.
+# 모든 쓰기는 새 seq를 받습니다. (쓰기는 한 스레드에서만 하므로 MAX(seq)+1로 충분합니다)
+def _next_seq(db: Session) -> int:
+    return current_seq(db) + 1
+
+
+def insert_meeting(
+    db: Session,
+    date: str,
+    name: str,
+    description: str,
+    directory: str,
+    is_interested: bool = False,
+    is_ended: bool = False,
+    group_id: Optional[int] = None,
+) -> MeetingRecord:
+    seq = _next_seq(db)
+    record = MeetingRecord(
+        date=date,
+        name=name,
+        description=description,
+        directory=directory,
+        is_interested=is_interested,
+        is_ended=is_ended,
+        group_id=group_id,
+        seq=seq,
+        created_seq=seq,
+    )
+    db.add(record)
+    db.flush()
+    set_meeting_contribution(db, record, {})
+    return record
+
+
+def update_meeting(db: Session, directory: str, /, **fields) -> Optional[MeetingRecord]:
+    """directory로 회의 하나를 찾아 전달된 필드만 수정합니다. 없으면 None을 반환합니다."""
+    record = get_meeting_by_directory(db, directory)
+    if not record:
+        return None
+    for key, value in fields.items():
+        setattr(record, key, value)
+    record.seq = _next_seq(db)
+    db.flush()
+    if "date" in fields or "group_id" in fields:
+        # 날짜/그룹이 바뀌면 집계에서 이 회의의 기여분을 옮깁니다.
+        set_meeting_contribution(db, record)
+    return record
+
+
+def delete_meeting_record(db: Session, directory: str) -> Optional[MeetingRecord]:
+    """행을 지우지 않고 tombstone으로 표시합니다. (변경 동기화에서 삭제를 알려주기 위해)"""
+    record = get_meeting_by_directory(db, directory)
+    if not record:
+        return None
+    record.deleted = True
+    record.seq = _next_seq(db)
+    db.flush()
+    set_meeting_contribution(db, record)
+    return record
+
+
+# --- 일괄 수정 (한 트랜잭션, 일괄 삭제는 services/reaper.py의 delete_meetings) ---
+def bulk_update_meetings(db: Session, items: list) -> list:
+    """items: [{"directory": ..., 수정할 필드...}]. 항목별 결과 목록을 반환합니다."""
+    results = []
+    for item in items:
+        fields = {k: v for k, v in item.items() if k != "directory" and v is not None}
+        directory = item.get("directory")
+        try:
+            # 항목마다 SAVEPOINT를 두어 하나가 실패해도 나머지는 반영됩니다.
+            with db.begin_nested():
+                record = update_meeting(db, directory, **fields)
+            if record:
+                results.append({"directory": directory, "ok": True, "seq": record.seq})
+            else:
+                results.append({"directory": directory, "ok": False, "error": "not_found"})
+        except Exception as e:
+            results.append({"directory": directory, "ok": False, "error": str(e)})
+    return results
+
+
+# --- 초기화 / 가져오기 ---
+def import_meetings_json(path: str = MEETINGS_JSON_PATH, db: Optional[Session] = None) -> int:
+    """기존 meetings.json의 회의들을 테이블로 옮깁니다. 이미 있는 directory는 건너뜁니다."""
+    if not os.path.exists(path):
+        return 0
+
+    with open(path, "r", encoding="utf-8") as f:
+        meetings = json.load(f)
+
+    own_session = db is None
+    db = db or MeetingSessionLocal()
+    try:
+        existing = {d for (d,) in db.query(MeetingRecord.directory)}
+        seq = current_seq(db)
+        imported = []
+        for date, meeting_list in meetings.items():
+            for meeting in meeting_list:
+                directory = meeting.get("directory")
+                if not directory or directory in existing:
+                    continue
+                imported.append(MeetingRecord(
+                    date=date,
+                    name=meeting.get("name", ""),
+                    description=meeting.get("description", ""),
+                    directory=directory,
+                    is_interested=bool(meeting.get("is_interested", False)),
+                    is_ended=bool(meeting.get("is_ended", False)),
+                    group_id=meeting.get("group_id"),
+                    seq=seq + 1,
+                    created_seq=seq + 1,
+                ))
+                seq += 1
+                existing.add(directory)
+        db.add_all(imported)
+        db.flush()
+        for record in imported:
+            set_meeting_contribution(db, record, {})
+        db.commit()
+        return len(imported)
+    finally:
+        if own_session:
+            db.close()
+
+
+def _add_missing_columns(table) -> list:
+    """예전에 만든 테이블에 모델에 새로 생긴 컬럼을 추가합니다. (간단한 마이그레이션)"""
+    existing = {c["name"] for c in inspect(meeting_engine).get_columns(table.name)}
+    added = []
+    with meeting_engine.begin() as conn:
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column.type.compile(dialect=meeting_engine.dialect)}"
+            if column.server_default is not None:
+                ddl += f" DEFAULT {column.server_default.arg}"
+            conn.exec_driver_sql(ddl)
+            added.append(column.name)
+    return added
+
+
+def init_meeting_store():
+    """테이블을 만들고, 저장소가 비어 있으면 meetings.json을 한 번 가져옵니다."""
+    MeetingBase.metadata.create_all(bind=meeting_engine)
+    added = _add_missing_columns(MeetingRecord.__table__)
+    if "seq" in added:
+        # 순번이 없던 기존 행들은 id 순서대로 seq를 채웁니다.
+        with meeting_engine.begin() as conn:
+            conn.exec_driver_sql("UPDATE meetings SET seq = id, created_seq = id")
+    # 이미 있던 테이블에도 새로 추가된 인덱스를 만들어 줍니다.
+    for index in MeetingRecord.__table__.indexes:
+        index.create(bind=meeting_engine, checkfirst=True)
+    db = MeetingSessionLocal()
+    try:
+        if db.query(MeetingRecord.id).first() is None:
+            imported = import_meetings_json(MEETINGS_JSON_PATH, db)
+            if imported:
+                print(f"✅ meetings.json에서 회의 {imported}개를 가져왔습니다.")
+        elif db.query(RollupContribution.meeting_id).first() is None:
+            # 집계 테이블이 새로 생긴 기존 저장소: 한 번만 전체 집계를 만듭니다.
+            directories = [d for (d,) in db.query(MeetingRecord.directory).filter(MeetingRecord.deleted == False)]
+            count = rebuild_rollups(db, speakers_from_result_files(os.path.join(BASE_DIR, "uploaded_files"), directories))
+            db.commit()
+            print(f"✅ 회의 {count}개로 통계 집계를 만들었습니다.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    # 사용법: python -m services.meeting_repository [meetings.json 경로]
+    MeetingBase.metadata.create_all(bind=meeting_engine)
+    json_path = sys.argv[1] if len(sys.argv) > 1 else MEETINGS_JSON_PATH
+    count = import_meetings_json(json_path)
+    print(f"✅ {json_path}에서 회의 {count}개를 가져왔습니다.")
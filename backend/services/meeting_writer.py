@@ -0,0 +1,120 @@
+import os
+import time
+import queue
+import asyncio
+import threading
+from concurrent.futures import Future
+from core.database import MeetingWriteSessionLocal
+
+# 쓰기 요청을 모으는 시간(ms)과 한 번에 커밋할 최대 개수
+WRITE_BATCH_WINDOW_MS = float(os.getenv("MEETING_WRITE_BATCH_MS", "5"))
+WRITE_BATCH_MAX = int(os.getenv("MEETING_WRITE_BATCH_MAX", "256"))
+
+
+class MeetingWriter:
+    """회의 저장소의 모든 쓰기를 전용 스레드 하나에서 순서대로 처리합니다.
+
+    몇 ms 안에 들어온 쓰기들은 한 트랜잭션으로 묶어 커밋(fsync 1회)합니다.
+    각 쓰기는 SAVEPOINT 안에서 실행되므로 하나가 실패해도 나머지는 커밋됩니다.
+    """
+
+    def __init__(self, batch_window_ms: float = WRITE_BATCH_WINDOW_MS, max_batch: int = WRITE_BATCH_MAX):
+        self.batch_window = batch_window_ms / 1000
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.writes = 0
+
+    def start(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._loop, name="meeting-writer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            if not self._thread:
+                return
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """fn(db, *args, **kwargs)를 쓰기 스레드에 맡기고 Future를 반환합니다."""
+        self.start()
+        future = Future()
+        self._queue.put((fn, args, kwargs, future))
+        return future
+
+    def run(self, fn, *args, **kwargs):
+        """동기 코드용: 쓰기가 커밋될 때까지 기다린 뒤 fn의 반환값을 돌려줍니다."""
+        return self.submit(fn, *args, **kwargs).result()
+
+    async def run_async(self, fn, *args, **kwargs):
+        """async 엔드포인트용: 이벤트 루프를 막지 않고 커밋을 기다립니다."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def stats(self) -> dict:
+        return {"batches": self.batches, "writes": self.writes, "pending": self._queue.qsize()}
+
+    def _loop(self):
+        while True:
+            op = self._queue.get()
+            if op is None:
+                return
+
+            # 첫 쓰기 이후 batch_window 동안 들어온 쓰기들을 함께 처리합니다.
+            batch = [op]
+            stop_after_batch = False
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    op = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if op is None:
+                    stop_after_batch = True
+                    break
+                batch.append(op)
+
+            self._commit_batch(batch)
+            if stop_after_batch:
+                return
+
+    def _commit_batch(self, batch):
+        db = MeetingWriteSessionLocal(expire_on_commit=False)
+        outcomes = []
+        try:
+            for fn, args, kwargs, future in batch:
+                try:
+                    with db.begin_nested():
+                        outcomes.append((future, fn(db, *args, **kwargs), None))
+                except Exception as e:
+                    outcomes.append((future, None, e))
+            db.commit()
+        except Exception as e:
+            print(f"❌ 회의 저장소 커밋 실패: {e}")
+            db.rollback()
+            for _, _, _, future in batch:
+                future.set_exception(e)
+            return
+        finally:
+            db.close()
+
+        self.batches += 1
+        self.writes += len(batch)
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+
+# 앱 전체에서 공유하는 단일 쓰기 스레드
+meeting_writer = MeetingWriter()
@@ -0,0 +1,320 @@
+import os
+import time
+import uuid
+import threading
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from core.database import BASE_DIR, MeetingSessionLocal
+from models.meeting_tables import MeetingRecord, ReapJob
+from services.meeting_writer import meeting_writer
+from services.meeting_repository import delete_meeting_record
+from services.search_index import remove_meeting_from_index
+from services.content_store import collect_garbage
+
+UPLOAD_ROOT = os.path.join(BASE_DIR, "uploaded_files")
+TRASH_ROOT = os.path.join(UPLOAD_ROOT, ".trash")
+
+# 디스크를 독차지하지 않도록 초당 지우는 양과 파일 수를 제한합니다.
+REAPER_BYTES_PER_SEC = int(os.getenv("REAPER_BYTES_PER_SEC", str(64 * 1024 * 1024)))
+REAPER_FILES_PER_SEC = int(os.getenv("REAPER_FILES_PER_SEC", "200"))
+# 큰 파일은 한 번에 unlink하지 않고 이 크기씩 잘라 가며 지웁니다.
+REAPER_TRUNCATE_STEP = 16 * 1024 * 1024
+REAPER_POLL_SEC = 5.0
+REAPER_MAX_ATTEMPTS = 3
+# 작업 도중 종료/장애로 놓친 녹음 저장소 정리를 한가할 때 이 간격으로 한 번씩 전체 확인합니다.
+REAPER_GC_INTERVAL_SEC = float(os.getenv("REAPER_GC_INTERVAL_SEC", "3600"))
+
+
+# --- 삭제 요청 (API에서 호출) ---
+def _tombstone_meetings(db: Session, directories: list) -> list:
+    results = []
+    for directory in directories:
+        record = delete_meeting_record(db, directory)
+        if record:
+            remove_meeting_from_index(db, directory)
+            results.append({"directory": directory, "ok": True, "seq": record.seq})
+        else:
+            results.append({"directory": directory, "ok": False, "error": "not_found"})
+    return results
+
+
+def _enqueue_jobs(db: Session, moved: list):
+    for directory, path in moved:
+        db.add(ReapJob(directory=directory, path=path, status="pending"))
+
+
+def move_to_trash(directory: str) -> Optional[str]:
+    """회의 폴더를 .trash 아래로 옮깁니다. (같은 디스크 안의 이름 변경이라 바로 끝납니다)"""
+    folder = os.path.join(UPLOAD_ROOT, directory)
+    # .cas(녹음 저장소)와 .trash는 회의 폴더가 아니므로 절대 옮기지 않습니다.
+    if directory.startswith(".") or os.sep in directory or not os.path.isdir(folder):
+        return None
+    os.makedirs(TRASH_ROOT, exist_ok=True)
+    trash_path = os.path.join(TRASH_ROOT, f"{directory}.{uuid.uuid4().hex[:8]}")
+    os.rename(folder, trash_path)
+    return trash_path
+
+
+def delete_meetings(directories: list, remove_orphan_folders: bool = False) -> list:
+    """회의를 tombstone으로 표시하고 폴더는 .trash로 옮긴 뒤 삭제 작업을 예약합니다.
+
+    실제 파일 삭제는 reaper 스레드가 나중에 천천히 합니다.
+    remove_orphan_folders: 저장소에 없는 회의라도 폴더가 있으면 지웁니다. (단건 삭제의 기존 동작)
+    """
+    results = meeting_writer.run(_tombstone_meetings, directories)
+    moved = []
+    for result in results:
+        if result["ok"] or remove_orphan_folders:
+            trash_path = move_to_trash(result["directory"])
+            if trash_path:
+                moved.append((result["directory"], trash_path))
+            else:
+                print("❗ 폴더가 존재하지 않음:", os.path.join(UPLOAD_ROOT, result["directory"]))
+    if moved:
+        meeting_writer.run(_enqueue_jobs, moved)
+        reaper.wake()
+    return results
+
+
+# --- 작업 상태 기록 (쓰기 스레드에서 실행) ---
+def _finish_job(db: Session, job_id: int, reclaimed: int, files: int, error: Optional[str]):
+    job = db.get(ReapJob, job_id)
+    if job is None:
+        return
+    job.reclaimed_bytes += reclaimed
+    job.files += files
+    if error is None:
+        job.status = "done"
+        job.error = None
+        job.finished_at = datetime.now()
+    else:
+        job.attempts += 1
+        job.error = error
+        if job.attempts >= REAPER_MAX_ATTEMPTS:
+            job.status = "failed"
+            job.finished_at = datetime.now()
+
+
+class DirectoryReaper:
+    """.trash로 옮겨진 회의 폴더를 속도 제한을 두고 지우는 백그라운드 스레드입니다."""
+
+    def __init__(
+        self,
+        bytes_per_sec: int = REAPER_BYTES_PER_SEC,
+        files_per_sec: int = REAPER_FILES_PER_SEC,
+        poll_sec: float = REAPER_POLL_SEC,
+    ):
+        self.bytes_per_sec = bytes_per_sec
+        self.files_per_sec = files_per_sec
+        self.poll_sec = poll_sec
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        self._dropped_links = set()     # 이번 작업에서 링크만 지운 녹음 (st_dev, st_ino)
+        self.store_reclaimed_bytes = 0  # 작업과 상관없이 주기적인 정리로 해제한 바이트
+        self.current = None     # 지우는 중인 작업 {"job_id", "directory", "reclaimed_bytes", "files"}
+
+    def start(self):
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="directory-reaper", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        with self._lock:
+            if not self._thread:
+                return
+            self._stop.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+
+    def wake(self):
+        self._wake.set()
+
+    # --- 재시작 복구 ---
+    def recover(self):
+        """작업이 빠진 .trash 폴더와, tombstone인데 아직 남아 있는 회의 폴더를 다시 예약합니다."""
+        db = MeetingSessionLocal()
+        try:
+            queued = {path for (path,) in db.query(ReapJob.path).filter(ReapJob.status == "pending")}
+            deleted = {d for (d,) in db.query(MeetingRecord.directory).filter(MeetingRecord.deleted == True)}
+        finally:
+            db.close()
+
+        moved = []
+        if os.path.isdir(TRASH_ROOT):
+            for name in os.listdir(TRASH_ROOT):
+                path = os.path.join(TRASH_ROOT, name)
+                if path not in queued:
+                    moved.append((name.rsplit(".", 1)[0], path))
+        if os.path.isdir(UPLOAD_ROOT):
+            for directory in os.listdir(UPLOAD_ROOT):
+                if directory in deleted:
+                    trash_path = move_to_trash(directory)
+                    if trash_path:
+                        moved.append((directory, trash_path))
+        if moved:
+            meeting_writer.run(_enqueue_jobs, moved)
+            print(f"♻️ 삭제 대기 폴더 {len(moved)}개를 다시 예약했습니다.")
+
+    # --- 삭제 루프 ---
+    def _next_job(self):
+        db = MeetingSessionLocal()
+        try:
+            job = (
+                db.query(ReapJob.id, ReapJob.directory, ReapJob.path)
+                .filter(ReapJob.status == "pending")
+                .order_by(ReapJob.attempts, ReapJob.id)
+                .first()
+            )
+            return job
+        finally:
+            db.close()
+
+    def _loop(self):
+        try:
+            self.recover()
+        except Exception as e:
+            print(f"❌ 삭제 대기열 복구 실패: {e}")
+        next_gc = time.monotonic()
+        while not self._stop.is_set():
+            job = self._next_job()
+            if job is None:
+                if time.monotonic() >= next_gc:
+                    self._collect_store_garbage()
+                    next_gc = time.monotonic() + REAPER_GC_INTERVAL_SEC
+                    continue
+                self._wake.wait(self.poll_sec)
+                self._wake.clear()
+                continue
+            if not self._reap(*job):
+                # 실패한 작업은 잠시 뒤에 다시 시도합니다.
+                self._stop.wait(self.poll_sec)
+
+    def _collect_store_garbage(self):
+        try:
+            removed, freed = collect_garbage(remove_file=self._remove_file)
+        except Exception as e:
+            print(f"❌ 녹음 저장소 정리 실패: {e}")
+            return
+        self.store_reclaimed_bytes += freed
+        if removed:
+            print(f"🗑️ 더 이상 쓰지 않는 녹음 {removed}개를 정리했습니다. ({freed / 1024 / 1024:.1f} MB)")
+
+    def _throttle(self, nbytes: int):
+        """파일 하나/바이트 수만큼 시간 예산을 쓰고, 예산보다 빠르면 잠시 쉽니다."""
+        cost = max(1.0 / self.files_per_sec, nbytes / self.bytes_per_sec)
+        now = time.monotonic()
+        self._next_slot = max(self._next_slot, now) + cost
+        delay = self._next_slot - now
+        if delay > 0:
+            self._stop.wait(delay)
+
+    def _remove_file(self, path: str) -> int:
+        """파일 하나를 지우고 실제로 해제한 바이트 수를 반환합니다.
+
+        링크가 여러 개인 파일(녹음 저장소와 공유하는 audio.*)은 다른 회의와 같은 데이터이므로
+        자르지 않고 이 링크만 지웁니다. 작업이 끝나면 _reap이 content_store.collect_garbage로
+        마지막 링크가 사라진 녹음을 지우고 그 바이트를 더합니다.
+        """
+        st = os.lstat(path)
+        size = st.st_size
+        if st.st_nlink > 1 or os.path.islink(path):
+            if st.st_nlink > 1:
+                self._dropped_links.add((st.st_dev, st.st_ino))
+            self._throttle(0)
+            os.unlink(path)
+            return 0
+        if size > REAPER_TRUNCATE_STEP:
+            # 큰 파일은 조금씩 잘라서 한 번에 많은 블록을 해제하지 않게 합니다.
+            with open(path, "r+b") as f:
+                remaining = size
+                while remaining > REAPER_TRUNCATE_STEP and not self._stop.is_set():
+                    remaining -= REAPER_TRUNCATE_STEP
+                    f.truncate(remaining)
+                    self._throttle(REAPER_TRUNCATE_STEP)
+            self._throttle(remaining)
+        else:
+            self._throttle(size)
+        os.unlink(path)
+        return size
+
+    def _reap(self, job_id: int, directory: str, path: str) -> bool:
+        progress = self.current = {"job_id": job_id, "directory": directory, "reclaimed_bytes": 0, "files": 0}
+        self._dropped_links = set()
+        error = None
+        try:
+            if os.path.isdir(path) and not os.path.islink(path):
+                for root, dirs, files in os.walk(path, topdown=False):
+                    for name in files:
+                        if self._stop.is_set():
+                            break
+                        progress["reclaimed_bytes"] += self._remove_file(os.path.join(root, name))
+                        progress["files"] += 1
+                    for name in dirs:
+                        sub = os.path.join(root, name)
+                        if os.path.islink(sub):
+                            os.unlink(sub)
+                        elif not self._stop.is_set():
+                            os.rmdir(sub)
+                if not self._stop.is_set():
+                    os.rmdir(path)
+            elif os.path.lexists(path):
+                progress["reclaimed_bytes"] += self._remove_file(path)
+                progress["files"] += 1
+            if self._dropped_links and not self._stop.is_set():
+                # 이 회의가 녹음 저장소의 마지막 링크였다면 녹음과 캐시도 지웁니다.
+                dropped, self._dropped_links = self._dropped_links, set()
+                removed, freed = collect_garbage(dropped, self._remove_file)
+                progress["reclaimed_bytes"] += freed
+                if removed:
+                    print(f"🗑️ 더 이상 쓰지 않는 녹음 {removed}개를 정리했습니다.")
+        except Exception as e:
+            error = str(e)
+            print(f"❌ 폴더 삭제 실패 ({directory}): {e}")
+        finally:
+            self.current = None
+
+        if self._stop.is_set() and error is None:
+            # 종료 중이면 작업을 pending으로 남겨 두고, 지금까지 지운 양만 기록합니다.
+            meeting_writer.run(_record_progress, job_id, progress["reclaimed_bytes"], progress["files"])
+            return True
+        meeting_writer.run(_finish_job, job_id, progress["reclaimed_bytes"], progress["files"], error)
+        if error is None:
+            print(f"🗑️ {directory} 삭제 완료 ({progress['reclaimed_bytes'] / 1024 / 1024:.1f} MB)")
+        return error is None
+
+    def stats(self) -> dict:
+        db = MeetingSessionLocal()
+        try:
+            counts = dict(db.query(ReapJob.status, func.count(ReapJob.id)).group_by(ReapJob.status).all())
+            reclaimed = db.query(func.coalesce(func.sum(ReapJob.reclaimed_bytes), 0)).scalar()
+        finally:
+            db.close()
+        return {
+            "pending": counts.get("pending", 0),
+            "done": counts.get("done", 0),
+            "failed": counts.get("failed", 0),
+            "reclaimed_bytes": reclaimed + self.store_reclaimed_bytes,
+            "current": self.current,
+            "bytes_per_sec": self.bytes_per_sec,
+            "files_per_sec": self.files_per_sec,
+        }
+
+
+def _record_progress(db: Session, job_id: int, reclaimed: int, files: int):
+    job = db.get(ReapJob, job_id)
+    if job is not None:
+        job.reclaimed_bytes += reclaimed
+        job.files += files
+
+
+# 앱 전체에서 공유하는 폴더 삭제 스레드
+reaper = DirectoryReaper()
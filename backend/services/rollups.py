@@ -0,0 +1,171 @@
+import os
+from datetime import date as date_cls, timedelta
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from core.database import BASE_DIR, MeetingSessionLocal
+from models.meeting_tables import MeetingRecord, RollupContribution, Rollup
+
+UPLOAD_ROOT = os.path.join(BASE_DIR, "uploaded_files")
+
+GRAINS = ("day", "week")
+NO_GROUP = 0        # group_id가 없는 회의의 group_key
+MEETING_ROW = ""    # 회의 전체 합계 행의 speaker 값
+UNKNOWN_SPEAKER = "unknown"     # 화자 라벨이 비었거나 None인 구간 (합계 행과 겹치지 않도록)
+_VALUES = ("meetings", "talk_time_ms", "segments", "turns")
+
+
+def _periods(day: str) -> Optional[dict]:
+    """'2025-08-26' -> {"day": "2025-08-26", "week": "2025-08-25"} (주는 월요일 기준)"""
+    try:
+        d = date_cls.fromisoformat(day)
+    except ValueError:
+        return None
+    return {"day": day, "week": (d - timedelta(days=d.weekday())).isoformat()}
+
+
+def _add(db: Session, day: str, group_key: int, speaker: str, values: dict, sign: int):
+    periods = _periods(day)
+    if periods is None:
+        return
+    for grain in GRAINS:
+        key = (grain, group_key, periods[grain], speaker)
+        row = db.get(Rollup, key)
+        if row is None:
+            row = Rollup(grain=grain, group_key=group_key, period=periods[grain], speaker=speaker,
+                         meetings=0, talk_time_ms=0, segments=0, turns=0)
+            db.add(row)
+        for name in _VALUES:
+            setattr(row, name, getattr(row, name) + sign * values[name])
+        if row.meetings <= 0:
+            db.delete(row)
+
+
+# --- 쓰기 (meeting_writer 스레드에서, 회의 쓰기와 같은 트랜잭션으로 실행) ---
+def set_meeting_contribution(db: Session, record: MeetingRecord, speakers: Optional[dict] = None):
+    """회의 하나의 기존 기여분을 빼고 현재 상태로 다시 더합니다.
+
+    speakers: speaker_stats의 {"화자": {"talk_time", "turns", "segments"}}.
+    None이면 기존 화자 값을 그대로 두고 날짜/그룹/삭제 변경만 반영합니다.
+    """
+    old_rows = db.query(RollupContribution).filter(RollupContribution.meeting_id == record.id).all()
+    if speakers is None:
+        speakers = {
+            row.speaker: {"talk_time": row.talk_time_ms, "segments": row.segments, "turns": row.turns}
+            for row in old_rows if row.speaker != MEETING_ROW
+        }
+    for row in old_rows:
+        _add(db, row.day, row.group_key, row.speaker, {"meetings": 1, **_row_values(row)}, -1)
+        db.delete(row)
+    db.flush()
+    if record.deleted:
+        return
+
+    day = (record.date or "").split("T")[0]
+    group_key = record.group_id or NO_GROUP
+    rows = {}
+    for speaker, entry in speakers.items():
+        values = rows.setdefault(_speaker_key(speaker), {"talk_time_ms": 0, "segments": 0, "turns": 0})
+        values["talk_time_ms"] += int(round(entry.get("talk_time", 0) or 0))
+        values["segments"] += int(entry.get("segments", 0) or 0)
+        values["turns"] += int(entry.get("turns", 0) or 0)
+    rows[MEETING_ROW] = {name: sum(v[name] for v in rows.values()) for name in ("talk_time_ms", "segments", "turns")}
+    for speaker, values in rows.items():
+        db.add(RollupContribution(meeting_id=record.id, speaker=speaker, day=day, group_key=group_key, **values))
+        _add(db, day, group_key, speaker, {"meetings": 1, **values}, 1)
+    db.flush()
+
+
+def _speaker_key(speaker) -> str:
+    """화자 라벨을 집계 키로 바꿉니다. 비었거나 None(JSON의 "null" 포함)이면 UNKNOWN_SPEAKER"""
+    label = "" if speaker is None else str(speaker).strip()
+    return UNKNOWN_SPEAKER if label in ("", "None", "null") else label
+
+
+def _row_values(row) -> dict:
+    return {"talk_time_ms": row.talk_time_ms, "segments": row.segments, "turns": row.turns}
+
+
+def set_meeting_speakers(db: Session, directory: str, speakers: dict) -> bool:
+    """전사본이 새로 만들어지거나 바뀌었을 때 호출합니다."""
+    record = (
+        db.query(MeetingRecord)
+        .filter(MeetingRecord.directory == directory, MeetingRecord.deleted == False)
+        .first()
+    )
+    if record is None:
+        return False
+    set_meeting_contribution(db, record, speakers)
+    return True
+
+
+def rebuild_rollups(db: Session, speakers_by_directory: dict) -> int:
+    """집계를 처음부터 다시 만듭니다. (테이블이 새로 생긴 기존 저장소용)"""
+    db.query(Rollup).delete(synchronize_session=False)
+    db.query(RollupContribution).delete(synchronize_session=False)
+    db.flush()
+    count = 0
+    for record in db.query(MeetingRecord).filter(MeetingRecord.deleted == False).all():
+        set_meeting_contribution(db, record, speakers_by_directory.get(record.directory) or {})
+        count += 1
+    return count
+
+
+# --- 조회 (원본 전사 파일은 읽지 않습니다) ---
+def query_rollups(
+    db: Session,
+    grain: str = "week",
+    date_from: Optional[str] = None,
+    date_to: Optional[str] = None,
+    group_id: Optional[int] = None,
+) -> dict:
+    """기간별 회의 수/발언 시간과 화자별 합계를 반환합니다."""
+    query = db.query(
+        Rollup.period,
+        Rollup.speaker,
+        func.sum(Rollup.meetings),
+        func.sum(Rollup.talk_time_ms),
+        func.sum(Rollup.segments),
+        func.sum(Rollup.turns),
+    ).filter(Rollup.grain == grain)
+    if group_id is not None:
+        query = query.filter(Rollup.group_key == group_id)
+    if date_from:
+        # 주 단위는 시작일이 속한 주의 월요일부터 포함합니다.
+        periods = _periods(date_from)
+        query = query.filter(Rollup.period >= (periods[grain] if periods else date_from))
+    if date_to:
+        query = query.filter(Rollup.period <= date_to)
+    query = query.group_by(Rollup.period, Rollup.speaker).order_by(Rollup.period)
+
+    periods = {}
+    totals = {}
+    for period, speaker, meetings, talk, segments, turns in query:
+        entry = periods.setdefault(period, {"period": period, "meetings": 0, "talk_time_ms": 0, "speakers": {}})
+        values = {"meetings": meetings, "talk_time_ms": talk, "segments": segments, "turns": turns}
+        if speaker == MEETING_ROW:
+            entry["meetings"] = meetings
+            entry["talk_time_ms"] = talk
+            continue
+        entry["speakers"][speaker] = values
+        total = totals.setdefault(speaker, dict.fromkeys(_VALUES, 0))
+        for name in _VALUES:
+            total[name] += values[name]
+
+    return {"grain": grain, "periods": list(periods.values()), "speakers": totals}
+
+
+if __name__ == "__main__":
+    # 기존 회의 전체로 집계 다시 만들기: python -m services.rollups
+    from services.meeting_repository import init_meeting_store
+    from services.meeting_writer import meeting_writer
+    from services.speaker_stats import speakers_from_result_files
+    init_meeting_store()
+    db = MeetingSessionLocal()
+    try:
+        directories = [d for (d,) in db.query(MeetingRecord.directory).filter(MeetingRecord.deleted == False)]
+    finally:
+        db.close()
+    count = meeting_writer.run(rebuild_rollups, speakers_from_result_files(UPLOAD_ROOT, directories))
+    print(f"✅ 회의 {count}개로 집계를 다시 만들었습니다.")
+    meeting_writer.stop()
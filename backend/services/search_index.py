@@ -0,0 +1,283 @@
+import os
+import re
+import math
+import heapq
+import unicodedata
+from collections import Counter
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from core.database import BASE_DIR, MeetingSessionLocal
+from models.meeting_tables import MeetingRecord, SearchDocument, SearchPosting, SearchTerm, SearchStat
+from services.meeting_writer import meeting_writer
+from services.storage import run_io
+from services.artifacts import read_json_artifact
+
+UPLOAD_ROOT = os.path.join(BASE_DIR, "uploaded_files")
+
+# BM25 파라미터와 검색 후보 상한
+BM25_K1 = 1.2
+BM25_B = 0.75
+SEARCH_MAX_CANDIDATES = 20000
+_CHUNK = 500
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list:
+    """문자 bigram으로 나눕니다. 형태소 분석기 없이도 한국어 부분 일치 검색이 됩니다.
+
+    예) "회의록 정리" -> ["회의", "의록", "정리"], 한 글자 단어는 그대로 사용합니다.
+    """
+    terms = []
+    for word in _WORD_RE.findall(unicodedata.normalize("NFKC", text or "").lower()):
+        if len(word) == 1:
+            terms.append(word)
+        else:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+def _chunks(items: list, size: int = _CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def build_documents(segments: Optional[list], summary: Optional[str]) -> list:
+    """색인할 문서 목록을 만듭니다. (토큰화는 쓰기 스레드 밖에서 미리 해 둡니다)"""
+    docs = []
+    for i, seg in enumerate(segments or []):
+        text = (seg.get("text") or "").strip()
+        if not text:
+            continue
+        docs.append({
+            "kind": "segment",
+            "seg_index": i,
+            "start": seg.get("start"),
+            "end": seg.get("end"),
+            "speaker": seg.get("speaker"),
+            "text": text,
+            "terms": Counter(tokenize(text)),
+        })
+    if summary:
+        docs.append({
+            "kind": "summary",
+            "seg_index": None,
+            "start": None,
+            "end": None,
+            "speaker": None,
+            "text": summary,
+            "terms": Counter(tokenize(summary)),
+        })
+    return docs
+
+
+# --- 쓰기 (meeting_writer 스레드에서 실행) ---
+def _stats_row(db: Session) -> SearchStat:
+    stat = db.get(SearchStat, 1)
+    if stat is None:
+        stat = SearchStat(id=1, doc_count=0, total_length=0)
+        db.add(stat)
+        db.flush()
+    return stat
+
+
+def _apply_df_delta(db: Session, delta: Counter):
+    terms = [t for t, d in delta.items() if d]
+    for chunk in _chunks(terms):
+        existing = {row.term: row for row in db.query(SearchTerm).filter(SearchTerm.term.in_(chunk))}
+        for term in chunk:
+            row = existing.get(term)
+            if row is None:
+                if delta[term] > 0:
+                    db.add(SearchTerm(term=term, df=delta[term]))
+            else:
+                row.df += delta[term]
+                if row.df <= 0:
+                    db.delete(row)
+    db.flush()
+
+
+def remove_meeting_from_index(db: Session, directory: str) -> int:
+    docs = db.query(SearchDocument.id, SearchDocument.length).filter(SearchDocument.directory == directory).all()
+    if not docs:
+        return 0
+    doc_ids = [doc_id for doc_id, _ in docs]
+    df_delta = Counter()
+    for chunk in _chunks(doc_ids):
+        for (term,) in db.query(SearchPosting.term).filter(SearchPosting.doc_id.in_(chunk)):
+            df_delta[term] -= 1
+        db.query(SearchPosting).filter(SearchPosting.doc_id.in_(chunk)).delete(synchronize_session=False)
+    db.query(SearchDocument).filter(SearchDocument.directory == directory).delete(synchronize_session=False)
+    _apply_df_delta(db, df_delta)
+
+    stat = _stats_row(db)
+    stat.doc_count -= len(docs)
+    stat.total_length -= sum(length for _, length in docs)
+    db.flush()
+    return len(docs)
+
+
+def replace_meeting_in_index(db: Session, directory: str, docs: list) -> int:
+    """한 회의의 기존 문서를 지우고 새 문서로 다시 색인합니다."""
+    remove_meeting_from_index(db, directory)
+    if not docs:
+        return 0
+
+    records = []
+    for doc in docs:
+        record = SearchDocument(
+            directory=directory,
+            kind=doc["kind"],
+            seg_index=doc["seg_index"],
+            start=doc["start"],
+            end=doc["end"],
+            speaker=doc["speaker"],
+            text=doc["text"],
+            length=sum(doc["terms"].values()),
+        )
+        records.append(record)
+    db.add_all(records)
+    db.flush()
+
+    postings = []
+    df_delta = Counter()
+    for record, doc in zip(records, docs):
+        for term, tf in doc["terms"].items():
+            postings.append({"term": term, "doc_id": record.id, "tf": tf})
+            df_delta[term] += 1
+    if postings:
+        db.execute(SearchPosting.__table__.insert(), postings)
+    _apply_df_delta(db, df_delta)
+
+    stat = _stats_row(db)
+    stat.doc_count += len(records)
+    stat.total_length += sum(r.length for r in records)
+    db.flush()
+    return len(records)
+
+
+# --- 색인 갱신 진입점 ---
+def _load_meeting_artifacts(directory: str):
+    folder = os.path.join(UPLOAD_ROOT, directory)
+    result = read_json_artifact(folder, "result.json") or {}
+    summary = read_json_artifact(folder, "summary.json") or {}
+    return result.get("segments", []), summary.get("summary")
+
+
+def index_meeting(directory: str, segments: Optional[list] = None, summary: Optional[str] = None) -> int:
+    """result.json/summary.json이 새로 만들어졌을 때 호출합니다. (인자가 없으면 파일에서 읽음)"""
+    if segments is None or summary is None:
+        file_segments, file_summary = _load_meeting_artifacts(directory)
+        segments = file_segments if segments is None else segments
+        summary = file_summary if summary is None else summary
+    docs = build_documents(segments, summary)
+    return meeting_writer.run(replace_meeting_in_index, directory, docs)
+
+
+async def index_meeting_async(directory: str, segments: Optional[list] = None, summary: Optional[str] = None) -> int:
+    return await run_io(index_meeting, directory, segments, summary)
+
+
+# --- 검색 ---
+def search(db: Session, query: str, limit: int = 20) -> tuple:
+    """모든 bigram을 포함하는 문서를 BM25 점수순으로 반환합니다. -> (결과 목록, 후보가 잘렸는지)
+
+    가장 드문 bigram도 SEARCH_MAX_CANDIDATES보다 많은 문서에 있으면, 그 bigram이 많이 나오는(tf가 큰)
+    문서부터 상한까지만 후보로 보고 truncated=True를 함께 반환합니다.
+    """
+    terms = list(dict.fromkeys(tokenize(query)))
+    if not terms:
+        return [], False
+
+    df = {row.term: row.df for row in db.query(SearchTerm).filter(SearchTerm.term.in_(terms))}
+    if len(df) < len(terms):
+        return [], False  # 어느 문서에도 없는 bigram이 있으면 결과 없음
+    stat = db.get(SearchStat, 1)
+    if stat is None or stat.doc_count <= 0:
+        return [], False
+    n_docs = stat.doc_count
+    avg_len = stat.total_length / n_docs
+
+    # 가장 드문 bigram의 문서들을 후보로 잡고, 나머지 bigram으로 좁혀 나갑니다.
+    terms.sort(key=lambda t: df[t])
+    first = select(SearchPosting.doc_id, SearchPosting.tf).where(SearchPosting.term == terms[0])
+    truncated = df[terms[0]] > SEARCH_MAX_CANDIDATES
+    if truncated:
+        first = first.order_by(SearchPosting.tf.desc(), SearchPosting.doc_id).limit(SEARCH_MAX_CANDIDATES)
+    candidates = {doc_id: {terms[0]: tf} for doc_id, tf in db.execute(first)}
+    for term in terms[1:]:
+        if not candidates:
+            return [], truncated
+        matched = {}
+        if df[term] <= len(candidates) * 4:
+            # 목록이 짧으면 기본 키 범위로 통째로 읽어 교집합을 구하는 편이 빠릅니다.
+            for doc_id, tf in db.execute(select(SearchPosting.doc_id, SearchPosting.tf).where(SearchPosting.term == term)):
+                if doc_id in candidates:
+                    matched[doc_id] = tf
+        else:
+            for chunk in _chunks(list(candidates)):
+                for doc_id, tf in db.execute(
+                    select(SearchPosting.doc_id, SearchPosting.tf)
+                    .where(SearchPosting.term == term, SearchPosting.doc_id.in_(chunk))
+                ):
+                    matched[doc_id] = tf
+        for doc_id, tf in matched.items():
+            candidates[doc_id][term] = tf
+        candidates = {doc_id: candidates[doc_id] for doc_id in matched}
+    if not candidates:
+        return [], truncated
+
+    lengths = {}
+    for chunk in _chunks(list(candidates)):
+        lengths.update(db.execute(select(SearchDocument.id, SearchDocument.length).where(SearchDocument.id.in_(chunk))).all())
+
+    idf = {term: math.log(1 + (n_docs - df[term] + 0.5) / (df[term] + 0.5)) for term in terms}
+
+    def bm25(doc_id):
+        score = 0.0
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths.get(doc_id, avg_len) / avg_len)
+        for term, tf in candidates[doc_id].items():
+            score += idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+        return score
+
+    # 점수 상위 문서만 본문과 회의 정보를 한 번에 읽습니다. (삭제된 회의는 제외)
+    ranked = heapq.nlargest(limit * 2, ((bm25(doc_id), doc_id) for doc_id in candidates))
+    scores = {doc_id: score for score, doc_id in ranked}
+    rows = (
+        db.query(SearchDocument, MeetingRecord.name, MeetingRecord.date)
+        .join(MeetingRecord, MeetingRecord.directory == SearchDocument.directory)
+        .filter(SearchDocument.id.in_(list(scores)), MeetingRecord.deleted == False)
+        .all()
+    )
+    rows.sort(key=lambda row: scores[row[0].id], reverse=True)
+    hits = []
+    for doc, name, date in rows[:limit]:
+        hits.append({
+            "directory": doc.directory,
+            "name": name,
+            "date": date,
+            "kind": doc.kind,
+            "seg_index": doc.seg_index,
+            "start": doc.start,
+            "end": doc.end,
+            "speaker": doc.speaker,
+            "text": doc.text,
+            "score": round(scores[doc.id], 4),
+        })
+    return hits, truncated
+
+
+if __name__ == "__main__":
+    # 기존 회의 전체 색인: python -m services.search_index
+    from services.meeting_repository import init_meeting_store
+    init_meeting_store()
+    db = MeetingSessionLocal()
+    try:
+        directories = [d for (d,) in db.query(MeetingRecord.directory).filter(MeetingRecord.deleted == False)]
+    finally:
+        db.close()
+    for directory in directories:
+        count = index_meeting(directory)
+        print(f"✅ {directory}: 문서 {count}개 색인")
+    meeting_writer.stop()
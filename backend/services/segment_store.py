@@ -0,0 +1,248 @@
+import os
+import json
+import mmap
+import struct
+import bisect
+import re
+import threading
+from array import array
+from collections import OrderedDict
+from services import json_codec
+from services.storage import atomic_write_bytes
+from services.artifacts import read_artifact_bytes
+
+# segments.col: result.json(.gz) 옆에 두는 열(column) 단위 바이너리 사본
+#   헤더: magic, 세그먼트 수, 원본 크기/mtime_ns, 플래그, 메타(JSON: 화자 사전, blob 길이) 길이
+#   열: start/end/max_end(int64), 텍스트 offsets(int64, n+1), 원본 객체 offsets(int64, n+1),
+#       화자 id(int32), 단어 수(int32), 텍스트 blob(UTF-8), 원본 객체 blob(EXACT가 아닐 때만)
+# 원본이 압축되어 있어도 이 파일만으로 읽을 수 있습니다.
+# mmap으로 열어 필요한 열만 복사 없이(memoryview/np.frombuffer) 읽습니다.
+STORE_NAME = "segments.col"
+_MAGIC = b"TSEGCOL2"
+_HEADER = struct.Struct("<8sQqqQQ")
+_FLAG_SORTED = 1    # start 순으로 정렬되어 있음 (시간 구간 조회에 이진 탐색 사용)
+_FLAG_COMPACT = 2   # 원본 객체 안에 줄바꿈이 없음 (NDJSON으로 그대로 내보낼 수 있음)
+_FLAG_EXACT = 4     # 모든 세그먼트가 start/end/speaker/text 네 키뿐 (열만으로 원본과 같은 객체를 만들 수 있음)
+_EXACT_KEYS = ("start", "end", "speaker", "text")
+_INT64_COLUMNS = ("start", "end", "max_end")
+_INT32_COLUMNS = ("speaker", "words")
+
+# 열어 둔 mmap을 보관할 개수
+STORE_CACHE_SIZE = 64
+
+_SEGMENTS_KEY_RE = re.compile(r'(?<!\\)"segments"\s*:\s*\[')
+_WS = " \t\r\n"
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+class SegmentColumns:
+    """segments.col을 mmap으로 연 읽기 전용 뷰. 각 열은 memoryview입니다."""
+
+    def __init__(self, buf, count: int, flags: int, speakers: list, layout: dict):
+        self.buf = buf
+        self.count = count
+        self.sorted = bool(flags & _FLAG_SORTED)
+        self.compact = bool(flags & _FLAG_COMPACT)
+        self.exact = bool(flags & _FLAG_EXACT)
+        self.speakers = speakers
+        self.layout = layout    # 열 이름 -> (바이트 위치, 원소 수, 형식)
+        view = memoryview(buf)
+        for name, (offset, length, fmt) in layout.items():
+            size = length * (1 if fmt == "B" else struct.calcsize(fmt))
+            setattr(self, name, view[offset:offset + size].cast(fmt))
+
+    def __len__(self):
+        return self.count
+
+    def numpy(self, name: str):
+        """열 하나를 복사 없이 NumPy 배열로 봅니다. (분석 코드용)"""
+        import numpy as np
+        offset, length, fmt = self.layout[name]
+        dtype = {"q": np.int64, "i": np.int32, "B": np.uint8}[fmt]
+        return np.frombuffer(self.buf, dtype=dtype, count=length, offset=offset)
+
+    def speaker(self, i: int):
+        return self.speakers[self.speaker_ids[i]]
+
+    def text(self, i: int) -> str:
+        return bytes(self.text_blob[self.text_offsets[i]:self.text_offsets[i + 1]]).decode("utf-8")
+
+    def select(self, from_ms=None, to_ms=None):
+        """[from_ms, to_ms) 구간과 겹치는 세그먼트 번호들을 반환합니다."""
+        if from_ms is None and to_ms is None:
+            return range(self.count)
+        lo_time = from_ms if from_ms is not None else float("-inf")
+        hi_time = to_ms if to_ms is not None else float("inf")
+        if not self.sorted:
+            return [i for i in range(self.count) if self.start[i] < hi_time and self.end[i] > lo_time]
+
+        # 여기까지의 최대 end가 from_ms를 넘는 첫 세그먼트부터, start가 to_ms 이전인 세그먼트까지
+        first = bisect.bisect_right(self.max_end, lo_time)
+        last = bisect.bisect_left(self.start, hi_time)
+        return [i for i in range(first, last) if self.end[i] > lo_time]
+
+    def read_raw(self, indices) -> list:
+        """세그먼트 객체들의 원본 JSON 바이트 (EXACT가 아닐 때 저장됨)"""
+        return [bytes(self.raw_blob[self.raw_offsets[i]:self.raw_offsets[i + 1]]) for i in indices]
+
+    def read(self, indices) -> list:
+        if self.exact:
+            # 열에서 바로 객체를 만듭니다. (원본을 열지도, 파싱하지도 않음)
+            return [
+                {"start": self.start[i], "end": self.end[i], "speaker": self.speaker(i), "text": self.text(i)}
+                for i in indices
+            ]
+        return [json_codec.loads(raw) for raw in self.read_raw(indices)]
+
+    def read_ndjson(self, indices) -> bytes:
+        if self.exact:
+            lines = [json_codec.dumps(seg) for seg in self.read(indices)]
+        else:
+            lines = self.read_raw(indices)
+            if not self.compact:
+                lines = [json_codec.dumps(json_codec.loads(raw)) for raw in lines]
+        return b"".join(line + b"\n" for line in lines)
+
+
+def _scan_segments(text: str):
+    """result.json 문자열에서 "segments" 배열 안 객체들의 (문자 시작, 문자 끝, 객체)를 차례로 돌려줍니다."""
+    match = _SEGMENTS_KEY_RE.search(text)
+    if match is None:
+        return
+    decoder = json.JSONDecoder()
+    pos = match.end()
+    while True:
+        while pos < len(text) and text[pos] in _WS:
+            pos += 1
+        if pos >= len(text) or text[pos] == "]":
+            return
+        obj, end = decoder.raw_decode(text, pos)
+        yield pos, end, obj
+        pos = end
+        while pos < len(text) and text[pos] in _WS:
+            pos += 1
+        if pos < len(text) and text[pos] == ",":
+            pos += 1
+
+
+def build_segment_store(result_path: str) -> SegmentColumns:
+    """result.json(.gz)을 한 번 훑어 segments.col을 만듭니다. (전사본을 새로 쓴 직후 호출)"""
+    st = os.stat(result_path)
+    text = read_artifact_bytes(result_path).decode("utf-8")
+
+    ints = {name: array("q") for name in _INT64_COLUMNS}
+    small = {name: array("i") for name in _INT32_COLUMNS}
+    text_offsets = array("q", [0])
+    blob = bytearray()
+    raw_chunks = []
+    speaker_ids = {}
+    flags = _FLAG_SORTED | _FLAG_COMPACT | _FLAG_EXACT
+    running_max = None
+    for begin, end, seg in _scan_segments(text):
+        chunk = text[begin:end]
+        raw_chunks.append(chunk.encode("utf-8"))
+        if "\n" in chunk:
+            flags &= ~_FLAG_COMPACT
+
+        raw_start, raw_end = seg.get("start"), seg.get("end")
+        if (
+            tuple(seg) != _EXACT_KEYS
+            or type(raw_start) is not int or type(raw_end) is not int
+            or raw_end < raw_start or not isinstance(seg["text"], str)
+        ):
+            flags &= ~_FLAG_EXACT
+        start_ms = int(raw_start or 0)
+        end_ms = max(int(raw_end or 0), start_ms)
+        if ints["start"] and start_ms < ints["start"][-1]:
+            flags &= ~_FLAG_SORTED
+        running_max = end_ms if running_max is None else max(running_max, end_ms)
+        ints["start"].append(start_ms)
+        ints["end"].append(end_ms)
+        ints["max_end"].append(running_max)
+
+        sp = seg.get("speaker")
+        small["speaker"].append(speaker_ids.setdefault(sp, len(speaker_ids)))
+        seg_text = seg.get("text") or ""
+        small["words"].append(len(seg_text.split()))
+        blob += seg_text.encode("utf-8")
+        text_offsets.append(len(blob))
+
+    # 열만으로 원본과 같은 객체를 만들 수 없을 때만 원본 객체 바이트를 함께 저장합니다.
+    if flags & _FLAG_EXACT:
+        raw_chunks = [b""] * len(raw_chunks)
+    raw_offsets = array("q", [0])
+    for chunk in raw_chunks:
+        raw_offsets.append(raw_offsets[-1] + len(chunk))
+
+    count = len(ints["start"])
+    meta = json.dumps({"speakers": list(speaker_ids), "text_blob": len(blob)}, ensure_ascii=False).encode("utf-8")
+    parts = [_HEADER.pack(_MAGIC, count, st.st_size, st.st_mtime_ns, flags, len(meta)), meta]
+    columns = [*(ints[name] for name in _INT64_COLUMNS), text_offsets, raw_offsets, *(small[name] for name in _INT32_COLUMNS)]
+    for column in columns:
+        parts.append(b"\0" * (_align(sum(map(len, parts))) - sum(map(len, parts))))
+        parts.append(column.tobytes())
+    parts.append(bytes(blob))
+    parts.extend(raw_chunks)
+    folder = os.path.dirname(result_path)
+    atomic_write_bytes(os.path.join(folder, STORE_NAME), b"".join(parts))
+
+    # 예전 형식의 위치 색인은 더 이상 쓰지 않습니다.
+    old_index = os.path.join(folder, "segments.idx")
+    if os.path.exists(old_index):
+        os.remove(old_index)
+    return _open_store_file(result_path, st)
+
+
+def _open_store_file(result_path: str, st):
+    """segments.col을 mmap으로 엽니다. 원본과 크기/mtime이 다르면 None"""
+    store_path = os.path.join(os.path.dirname(result_path), STORE_NAME)
+    if not os.path.exists(store_path):
+        return None
+    with open(store_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            return None
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, count, size, mtime_ns, flags, meta_len = _HEADER.unpack_from(buf)
+    if magic != _MAGIC or size != st.st_size or mtime_ns != st.st_mtime_ns:
+        return None
+
+    offset = _HEADER.size
+    meta = json.loads(bytes(buf[offset:offset + meta_len]).decode("utf-8"))
+    offset += meta_len
+    layout = {}
+    columns = [*((name, count, "q") for name in _INT64_COLUMNS), ("text_offsets", count + 1, "q"), ("raw_offsets", count + 1, "q")]
+    columns += [("speaker_ids" if name == "speaker" else name, count, "i") for name in _INT32_COLUMNS]
+    for name, length, fmt in columns:
+        offset = _align(offset)
+        layout[name] = (offset, length, fmt)
+        offset += length * struct.calcsize(fmt)
+    layout["text_blob"] = (offset, meta["text_blob"], "B")
+    offset += meta["text_blob"]
+    layout["raw_blob"] = (offset, len(buf) - offset, "B")
+    return SegmentColumns(buf, count, flags, meta["speakers"], layout)
+
+
+_store_cache = OrderedDict()  # 원본 경로 -> ((size, mtime_ns), SegmentColumns)
+_store_cache_lock = threading.Lock()
+
+
+def open_segment_store(result_path: str) -> SegmentColumns:
+    """segments.col을 엽니다. 없거나 원본(result.json 또는 result.json.gz)이 바뀌었으면 다시 만듭니다."""
+    st = os.stat(result_path)
+    key = (st.st_size, st.st_mtime_ns)
+    with _store_cache_lock:
+        cached = _store_cache.get(result_path)
+        if cached is not None and cached[0] == key:
+            _store_cache.move_to_end(result_path)
+            return cached[1]
+
+    store = _open_store_file(result_path, st) or build_segment_store(result_path)
+    with _store_cache_lock:
+        _store_cache[result_path] = (key, store)
+        _store_cache.move_to_end(result_path)
+        while len(_store_cache) > STORE_CACHE_SIZE:
+            _store_cache.popitem(last=False)
+    return store
@@ -0,0 +1,100 @@
+import os
+from services.storage import atomic_write_json, read_json
+from services.meeting_writer import meeting_writer
+from services.rollups import set_meeting_speakers
+from services.segment_store import SegmentColumns, open_segment_store
+from services.artifacts import artifact_path
+
+STATS_VERSION = 1
+
+
+def compute_speaker_stats(segments: list) -> dict:
+    """화자별 발언 시간, 발언 횟수(연속 구간은 한 번), 비율을 계산합니다."""
+    return _speaker_stats(
+        (seg.get("speaker"), seg.get("start", 0) or 0, seg.get("end", 0) or 0) for seg in segments or []
+    )
+
+
+def compute_speaker_stats_from_store(store: SegmentColumns) -> dict:
+    """segments.col의 화자/시작/끝 열만 읽어 계산합니다. (텍스트는 읽지 않음)"""
+    labels = store.speakers
+    return _speaker_stats((labels[sp], start, end) for sp, start, end in zip(store.speaker_ids, store.start, store.end))
+
+
+def _speaker_stats(rows) -> dict:
+    speakers = {}
+    last_speaker = object()
+    for sp, start_time, end_time in rows:
+        entry = speakers.get(sp)
+        if entry is None:
+            entry = speakers[sp] = {"talk_time": 0, "turns": 0, "segments": 0}
+        entry["talk_time"] += end_time - start_time
+        entry["segments"] += 1
+        if sp != last_speaker:
+            entry["turns"] += 1
+            last_speaker = sp
+
+    total = sum(entry["talk_time"] for entry in speakers.values())
+    for entry in speakers.values():
+        entry["ratio"] = round((entry["talk_time"] / total) * 100, 1) if total else 0
+
+    return {
+        "version": STATS_VERSION,
+        "total_talk_time": total,
+        "speakers": speakers,
+        # /ratio 응답 형식 그대로 ({화자: 비율})
+        "ratios": {sp: entry["ratio"] for sp, entry in speakers.items()},
+    }
+
+
+def write_speaker_stats(folder: str, segments: list) -> dict:
+    """result.json을 쓴 직후 호출해 stats.json을 함께 저장합니다."""
+    return _save_stats(folder, compute_speaker_stats(segments))
+
+
+def _save_stats(folder: str, stats: dict) -> dict:
+    result_path = artifact_path(folder, "result.json")
+    if result_path is not None:
+        stats["source_mtime_ns"] = os.stat(result_path).st_mtime_ns
+    atomic_write_json(os.path.join(folder, "stats.json"), stats)
+
+    # 회의 통계 집계(rollups)에도 이 회의의 화자별 값을 반영합니다.
+    try:
+        meeting_writer.run(set_meeting_speakers, os.path.basename(folder), stats["speakers"])
+    except Exception as e:
+        print(f"❌ 통계 집계 갱신 실패: {e}")
+    return stats
+
+
+def speakers_from_result_files(upload_root: str, directories: list) -> dict:
+    """집계를 다시 만들 때 사용: 회의별 화자 통계를 result.json에서 계산합니다."""
+    speakers = {}
+    for directory in directories:
+        result_path = artifact_path(os.path.join(upload_root, directory), "result.json")
+        if result_path is not None:
+            speakers[directory] = compute_speaker_stats_from_store(open_segment_store(result_path))["speakers"]
+    return speakers
+
+
+def load_speaker_stats(folder: str):
+    """stats.json을 반환합니다. 없거나 result.json보다 오래됐으면 메모리에서만 다시 계산합니다.
+
+    조회 요청에서 부르므로 파일도 쓰지 않고 집계(rollups)도 건드리지 않습니다.
+    (stats.json과 집계 기여분은 전사 파이프라인의 write_speaker_stats와 init_meeting_store의 일회성 집계가 만듦)
+    result.json이 없으면 None을 반환합니다.
+    """
+    result_path = artifact_path(folder, "result.json")
+    stats_path = os.path.join(folder, "stats.json")
+    if result_path is None:
+        return None
+
+    if os.path.exists(stats_path):
+        stats = read_json(stats_path)
+        if (
+            stats.get("version") == STATS_VERSION
+            and stats.get("source_mtime_ns") == os.stat(result_path).st_mtime_ns
+        ):
+            return stats
+
+    # 예전에 만들어진 회의이거나 전사본이 바뀐 경우
+    return compute_speaker_stats_from_store(open_segment_store(result_path))
@@ -0,0 +1,63 @@
+import os
+import asyncio
+import tempfile
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from services import json_codec
+
+# 파일/JSON 작업 전용 스레드 풀 (이벤트 루프를 막지 않기 위해 async 코드는 여기서 실행)
+STORAGE_IO_WORKERS = int(os.getenv("STORAGE_IO_WORKERS", "8"))
+
+_io_executor = ThreadPoolExecutor(max_workers=STORAGE_IO_WORKERS, thread_name_prefix="storage-io")
+
+
+def atomic_write_bytes(path: str, content: bytes):
+    """임시 파일에 먼저 쓰고 fsync 한 뒤 os.replace로 바꿔치기합니다.
+
+    쓰는 도중 프로세스가 죽어도 기존 파일이 잘린 채로 남지 않습니다.
+    """
+    folder = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix=".tmp_", suffix=os.path.splitext(path)[1])
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(path: str, data):
+    """compact JSON(UTF-8)으로 원자적으로 저장합니다."""
+    atomic_write_bytes(path, json_codec.dumps(data))
+
+
+def atomic_output_path(path: str) -> str:
+    """PDF처럼 라이브러리가 직접 파일을 쓰는 경우에 사용할 임시 경로입니다.
+
+    임시 경로에 다 쓴 뒤 os.replace(tmp, path)로 옮기면 됩니다.
+    """
+    folder, name = os.path.split(path)
+    return os.path.join(folder, f".tmp_{name}")
+
+
+def read_json(path: str):
+    with open(path, "rb") as f:
+        return json_codec.loads(f.read())
+
+
+# --- async 코드용 (전용 스레드 풀에서 실행) ---
+async def run_io(fn, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_executor, partial(fn, *args, **kwargs))
+
+
+async def makedirs_async(path: str):
+    await run_io(os.makedirs, path, exist_ok=True)
+
+
+def shutdown_io_executor():
+    _io_executor.shutdown(wait=True)
@@ -1,12 +1,15 @@
 import os
-import openai
 from dotenv import load_dotenv
+from services.http_clients import openai_chat_completion
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 dotenv_path = os.path.join(BASE_DIR, ".env")
 load_dotenv(dotenv_path)
 
-openai.api_key = os.getenv("OPENAI_API_KEY")
+
+class SummaryError(Exception):
+    """OpenAI 요약 요청 실패 (실패 문구가 요약으로 저장되지 않도록 예외로 알립니다)"""
+
 
 #json 요약 함수
 def summarize_text(text: str, mode="기본", custom_prompt=None) -> str:
@@ -38,7 +41,7 @@ def summarize_text(text: str, mode="기본", custom_prompt=None) -> str:
             user_prompt = text
 
         # 3. GPT 호출
-        response = openai.ChatCompletion.create(
+        return openai_chat_completion(
             model="gpt-4-turbo",  # 또는 gpt-3.5-turbo
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -48,7 +51,5 @@ def summarize_text(text: str, mode="기본", custom_prompt=None) -> str:
             max_tokens=1500
         )
 
-        return response.choices[0].message["content"].strip()
-
     except Exception as e:
-        return f"요약 실패: {e}"
+        raise SummaryError(f"요약 실패: {e}") from e
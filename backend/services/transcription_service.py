@@ -1,11 +1,35 @@
 import os
 import json
-import requests
-import openai
 import warnings
 import asyncio
 from fpdf import FPDF
 from dotenv import load_dotenv
+from services.storage import atomic_output_path
+from services.artifacts import write_json_artifact, read_json_artifact
+from services.meeting_writer import meeting_writer
+from services.search_index import index_meeting
+from services.speaker_stats import write_speaker_stats
+from services.segment_store import build_segment_store
+from services.job_queue import job_handler
+from services.audio_chunking import transcribe_in_chunks
+from services.http_clients import http_clients
+from services.summarize_text import summarize_text, SummaryError
+from services.content_store import (
+    file_sha256,
+    content_lock,
+    load_cached_transcript,
+    cache_transcript,
+    load_cached_summary,
+    cache_summary,
+)
+from services.checkpoints import (
+    text_hash,
+    transcript_hash,
+    summary_input_hash,
+    record_checkpoint,
+    load_checkpoints,
+    stage_is_fresh,
+)
 
 # .env 파일 로드를 위해 BASE_DIR를 정의합니다.
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -17,9 +41,6 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 CLOVA_SECRET = os.getenv("CLOVA_SECRET")
 CLOVA_INVOKE_URL = os.getenv("CLOVA_INVOKE_URL")
 
-# OpenAI API 키를 설정합니다.
-openai.api_key = OPENAI_API_KEY
-
 # 진행률 추적을 위한 딕셔너리
 progress_map = {}
 
@@ -46,11 +67,14 @@ class ClovaSpeechClient:
             'Accept': 'application/json;UTF-8',
             'X-CLOVASPEECH-API-KEY': self.secret
         }
+        # 녹음 파일은 공용 HTTP 클라이언트가 열어서 조각씩 보내고 바로 닫습니다. (연결은 풀에서 재사용)
         files = {
-            'media': open(file, 'rb'),
             'params': (None, json.dumps(request_body, ensure_ascii=False).encode('UTF-8'), 'application/json')
         }
-        return requests.post(headers=headers, url=f'{self.invoke_url}/recognizer/upload', files=files)
+        return http_clients.request(
+            "clova", "POST", f'{self.invoke_url}/recognizer/upload',
+            headers=headers, files=files, files_from={'media': file},
+        )
 
 # PDF 생성을 위한 클래스
 class PrettyPDF(FPDF):
@@ -79,56 +103,65 @@ def save_summary_as_pdf(summary_text: str, output_path: str):
     effective_width = pdf.w - pdf.l_margin - pdf.r_margin
     pdf.multi_cell(effective_width, 8, summary_text)
 
-    pdf.output(output_path)
+    # 다 만든 뒤에 교체해서 읽는 쪽이 반쯤 쓰인 PDF를 보지 않도록 합니다.
+    tmp_path = atomic_output_path(output_path)
+    pdf.output(tmp_path)
+    os.replace(tmp_path, output_path)
     print(f"✅ PDF 생성 완료: {output_path}")
 
-def summarize_text(text: str, mode="기본", custom_prompt=None) -> str:
+def _request_transcript(client: "ClovaSpeechClient", audio_path: str) -> dict:
+    print("🗣️  Clova STT 요청 중...")
+    res = client.req_upload(
+        file=audio_path,
+        completion='sync',
+        wordAlignment=True,
+        fullText=True
+    )
+    res.raise_for_status()
+    result = res.json()
+
+    raw_segments = result.get('segments', [])
+    segments = [{'start': s.get('start'), 'end': s.get('end'), 'speaker': s.get('speaker', {}).get('label', 'unknown'), 'text': s.get('text', '').strip()} for s in raw_segments]
+    combined_text = " ".join([s['text'] for s in segments])
+    return {"segments": segments, "text": combined_text}
+
+def _transcribe_audio(client: "ClovaSpeechClient", audio_path: str, output_dir: str) -> dict:
+    # 긴 녹음은 침묵 구간에서 잘라 병렬로 요청합니다. (ffmpeg가 없으면 한 번에 요청)
+    work_dir = os.path.join(output_dir, ".chunks")
     try:
-        if mode == "기본":
-            system_prompt = (
-                "너는 전문 회의록 요약가야. 반드시 아래 양식으로 항목별로 요약해.\n"
-                "양식을 생략하거나 문단으로 바꾸지 마. 항목 제목도 반드시 포함할 것.\n\n"
-                "양식:\n"
-                "1. 회의 제목:\n"
-                "2. 회의 일시:\n"
-                "3. 참석자:\n"
-                "4. 회의 목적:\n"
-                "5. 주요 발언 요약:\n"
-                "6. 결정 사항:\n"
-                "7. 다음 일정/후속 조치:\n"
-            )
-            user_prompt = (
-                "다음 회의록을 위 양식대로 항목별로 요약해줘. 각 항목 제목은 그대로 유지하고, "
-                "항목 누락 없이 써야 해. 문장은 간결하게.\n\n"
-                f"{text}"
-            )
-        else:
-            system_prompt = custom_prompt or "회의 내용을 요약해줘."
-            user_prompt = text
-
-        response = openai.ChatCompletion.create(
-            model="gpt-4-turbo",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.3,
-            max_tokens=1500
-        )
-        return response.choices[0].message["content"].strip()
-    except Exception as e:
-        return f"요약 실패: {e}"
+        payload = transcribe_in_chunks(audio_path, work_dir, lambda path: _request_transcript(client, path))
+    except RuntimeError as e:
+        print(f"❗ 조각 나누기 실패, 한 번에 요청합니다: {e}")
+        payload = None
+    return payload if payload is not None else _request_transcript(client, audio_path)
 
 # 메인 처리 함수
-def transcribe_and_save_to_json(audio_path: str, output_dir: str, summary_mode: str, custom_prompt: str | None):
+# audio_sha256: 업로드하면서 계산한 녹음의 해시. 같은 녹음의 전사/요약 결과가 캐시에 있으면 재사용합니다.
+# 단계(전사 -> 요약 -> PDF)마다 체크포인트(services/checkpoints.py)를 남기고, 입력이 그대로인 단계는 건너뜁니다.
+# force: 최신이어도 다시 실행할 단계 이름 목록 (예: ["summary"])
+def transcribe_and_save_to_json(
+    audio_path: str,
+    output_dir: str,
+    summary_mode: str,
+    custom_prompt: str | None,
+    audio_sha256: str | None = None,
+    raise_errors: bool = False,
+    force: list | None = None,
+):
     directory_key = os.path.basename(output_dir)
     progress_map[directory_key] = 0
     # ClovaSpeechClient 인스턴스를 생성합니다.
     client = ClovaSpeechClient()
+    force = set(force or ())
 
     try:
         progress_map[directory_key] = 10
-        print("🗣️  Clova STT 요청 중...")
+        checkpoints = load_checkpoints(directory_key)
+        if audio_sha256 is None and os.path.exists(audio_path):
+            audio_sha256 = file_sha256(audio_path)
+        previous = checkpoints.get("transcript")
+        # 녹음 파일이 없으면(실시간 회의 등) 기록된 입력을 그대로 믿습니다.
+        transcript_input = audio_sha256 or (previous["input_hash"] if previous else None)
         
         
         # #===========================================================
@@ -153,12 +186,12 @@ def transcribe_and_save_to_json(audio_path: str, output_dir: str, summary_mode:
         # # 가상의 결과 파일들을 저장할 경로를 설정합니다.
         # json_path = os.path.join(output_dir, "result.json")
         # with open(json_path, "w", encoding="utf-8") as f:
-        #     json.dump({"segments": [], "text": "테스트용 음성 인식 텍스트"}, f, ensure_ascii=False, indent=2)
+        #     json.dump({"segments": [], "text": "테스트용 음성 인식 텍스트"}, f, ensure_ascii=False)
         # progress_map[directory_key] = 70
 
         # summary_path = os.path.join(output_dir, "summary.json")
         # with open(summary_path, "w", encoding="utf-8") as f:
-        #     json.dump({"summary": test_summary_text}, f, ensure_ascii=False, indent=2)
+        #     json.dump({"summary": test_summary_text}, f, ensure_ascii=False)
         # progress_map[directory_key] = 90
         
         # # PDF 생성 함수를 호출합니다.
@@ -167,45 +200,105 @@ def transcribe_and_save_to_json(audio_path: str, output_dir: str, summary_mode:
         # progress_map[directory_key] = 100
         # #===========================================================
         
-        res = client.req_upload(
-            file=audio_path,
-            completion='sync',
-            wordAlignment=True,
-            fullText=True
-        )
-        res.raise_for_status()
-        result = res.json()
-        progress_map[directory_key] = 30
-        
-        raw_segments = result.get('segments', [])
-        segments = [{'start': s.get('start'), 'end': s.get('end'), 'speaker': s.get('speaker', {}).get('label', 'unknown'), 'text': s.get('text', '').strip()} for s in raw_segments]
+        # 1) 전사: 같은 녹음이 동시에 올라오면 하나만 STT를 부르고 나머지는 그 결과를 기다렸다가 씁니다.
+        transcribed = "transcript" in force or not stage_is_fresh(checkpoints, "transcript", transcript_input, output_dir)
+        if not transcribed:
+            print(f"⏭️ 전사 단계는 최신이라 건너뜁니다. ({directory_key})")
+            payload = read_json_artifact(output_dir, "result.json")
+        else:
+            if not audio_sha256:
+                raise FileNotFoundError(f"녹음 파일이 없어 전사할 수 없습니다: {audio_path or directory_key}")
+            with content_lock(audio_sha256):
+                payload = None if "transcript" in force else load_cached_transcript(audio_sha256)
+                if payload is not None:
+                    print(f"♻️ 같은 녹음의 전사 결과를 재사용합니다. (sha256 {audio_sha256[:12]})")
+                else:
+                    payload = _transcribe_audio(client, audio_path, output_dir)
+                    cache_transcript(audio_sha256, payload)
         progress_map[directory_key] = 40
 
-        combined_text = " ".join([s['text'] for s in segments])
-        payload = {"segments": segments, "text": combined_text}
-        json_path = os.path.join(output_dir, "result.json")
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        segments = payload["segments"]
+        combined_text = " ".join(s["text"] for s in segments)
+        transcript_sha = transcript_hash(segments)
+        if transcribed:
+            # result.json / summary.json은 압축본(.gz)으로 저장됩니다.
+            json_path = write_json_artifact(output_dir, "result.json", payload)
+            # 화자 통계와 열 단위 사본(segments.col)은 전사본이 바뀔 때만 만들어 둡니다.
+            write_speaker_stats(output_dir, segments)
+            build_segment_store(json_path)
+        if transcribed or previous is None or previous["output_hash"] != transcript_sha:
+            meeting_writer.run(record_checkpoint, directory_key, "transcript", "done", transcript_input, transcript_sha)
         progress_map[directory_key] = 70
 
-        # summarize_text 함수를 직접 호출합니다.
-        summary = summarize_text(combined_text, mode=summary_mode, custom_prompt=custom_prompt)
-        summary_path = os.path.join(output_dir, "summary.json")
-        with open(summary_path, "w", encoding="utf-8") as f:
-            json.dump({"summary": summary}, f, ensure_ascii=False, indent=2)
+        # 2) 요약: 같은 녹음을 같은 모드/프롬프트로 요약한 적이 있으면 GPT를 다시 부르지 않습니다.
+        summary_input = summary_input_hash(transcript_sha, summary_mode, custom_prompt)
+        summarized = "summary" in force or not stage_is_fresh(checkpoints, "summary", summary_input, output_dir)
+        if not summarized:
+            print(f"⏭️ 요약 단계는 최신이라 건너뜁니다. ({directory_key})")
+            summary = read_json_artifact(output_dir, "summary.json")["summary"]
+        else:
+            # 녹음이 없는 회의(실시간 회의 등)는 해시 저장소를 쓰지 않습니다.
+            use_cache = bool(audio_sha256) and "summary" not in force
+            summary = load_cached_summary(audio_sha256, summary_mode, custom_prompt) if use_cache else None
+            if summary is None:
+                try:
+                    summary = summarize_text(combined_text, mode=summary_mode, custom_prompt=custom_prompt)
+                except SummaryError as e:
+                    # summary.json/PDF는 그대로 두고, 체크포인트만 실패로 기록합니다.
+                    meeting_writer.run(
+                        record_checkpoint, directory_key, "summary", "failed", summary_input,
+                        params={"summary_mode": summary_mode, "custom_prompt": custom_prompt}, error=str(e),
+                    )
+                    raise
+                if audio_sha256:
+                    cache_summary(audio_sha256, summary_mode, custom_prompt, summary)
+            write_json_artifact(output_dir, "summary.json", {"summary": summary})
+            meeting_writer.run(
+                record_checkpoint, directory_key, "summary", "done", summary_input, text_hash(summary),
+                params={"summary_mode": summary_mode, "custom_prompt": custom_prompt},
+            )
         progress_map[directory_key] = 90
-        
-        # PDF 생성 함수를 호출합니다.
-        pdf_path = os.path.join(output_dir, "summary.pdf")
-        save_summary_as_pdf(summary, pdf_path)
+
+        # 전문 검색 색인 갱신 (실패해도 변환 결과에는 영향 없음)
+        if transcribed or summarized:
+            try:
+                index_meeting(directory_key, segments=segments, summary=summary)
+            except Exception as e:
+                print(f"❌ 검색 색인 실패: {e}")
+
+        # 3) PDF
+        pdf_input = text_hash(summary)
+        if "pdf" in force or not stage_is_fresh(checkpoints, "pdf", pdf_input, output_dir):
+            pdf_path = os.path.join(output_dir, "summary.pdf")
+            save_summary_as_pdf(summary, pdf_path)
+            if os.path.exists(pdf_path):
+                meeting_writer.run(record_checkpoint, directory_key, "pdf", "done", pdf_input)
+            else:
+                meeting_writer.run(record_checkpoint, directory_key, "pdf", "failed", pdf_input, error="PDF 생성 실패 (폰트 확인)")
         progress_map[directory_key] = 100
 
-        print(f"✅ 변환 완료! '{json_path}'에 저장됨")
+        print(f"✅ 변환 완료! '{output_dir}'에 저장됨")
         send_pdf_complete_notification_via_http()
             
     except Exception as e:
         print(f"❌ 변환 중 에러 발생: {e}")
         progress_map[directory_key] = -1
+        if raise_errors:
+            raise
+
+
+# 작업 대기열(services/job_queue.py)용: 실패하면 예외를 올려서 대기열이 다시 시도하게 합니다.
+# 다시 시도할 때는 체크포인트 덕분에 끝난 단계(예: STT)를 건너뜁니다.
+@job_handler("transcribe")
+def run_transcribe_job(
+    audio_path: str,
+    output_dir: str,
+    summary_mode: str,
+    custom_prompt: str | None = None,
+    audio_sha256: str | None = None,
+    force: list | None = None,
+):
+    transcribe_and_save_to_json(audio_path, output_dir, summary_mode, custom_prompt, audio_sha256, raise_errors=True, force=force)
 
 
 # 웹 소켓 통해 요약 완료 알림 보내기
@@ -218,7 +311,7 @@ def send_pdf_complete_notification_via_http():
             return
 
         # FastAPI 엔드포인트에 POST 요청을 보냅니다.
-        requests.post(f"{base_url}/api/notifications/pdf-complete")
+        http_clients.request("internal", "POST", f"{base_url}/api/notifications/pdf-complete")
         print("🎉 PDF 완료 알림 요청을 서버에 보냈습니다!")
 
     except Exception as e:
@@ -0,0 +1,168 @@
+import os
+import hashlib
+from fastapi import Request
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+from services.storage import atomic_output_path, run_io
+
+# 업로드(multipart) 본문을 임시 파일로 받아 두었다가 다시 복사하지 않고,
+# 받는 대로 최종 위치에 쓰면서 SHA-256과 크기를 함께 계산합니다.
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))
+UPLOAD_WRITE_CHUNK = 4 * 1024 * 1024    # 이만큼 모이면 디스크에 씁니다. (업로드당 메모리 상한)
+UPLOAD_FIELD_MAX = 64 * 1024            # 파일이 아닌 폼 필드 하나의 최대 크기
+
+
+class UploadError(Exception):
+    """잘못된 multipart 요청"""
+
+
+class UploadTooLarge(UploadError):
+    """파일이 UPLOAD_MAX_BYTES를 넘음"""
+
+
+class IngestedFile:
+    def __init__(self, path: str, filename: str, size: int, sha256: str):
+        self.path = path
+        self.filename = filename
+        self.size = size
+        self.sha256 = sha256
+
+
+class _Part:
+    def __init__(self):
+        self.headers = {}
+        self.name = None
+        self.filename = None
+
+
+def _write_chunk(f, digest, data: bytes):
+    # hashlib은 큰 버퍼를 처리할 때 GIL을 놓으므로 쓰기와 함께 스레드 풀에서 실행합니다.
+    digest.update(data)
+    f.write(data)
+
+
+def _finish_file(f, tmp_path: str, dest_path: str):
+    f.close()
+    os.replace(tmp_path, dest_path)
+
+
+def _discard_file(f, tmp_path: str):
+    f.close()
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+
+async def ingest_multipart(
+    request: Request,
+    folder: str,
+    file_field: str = "file",
+    basename: str = "audio",
+    max_bytes: int = UPLOAD_MAX_BYTES,
+):
+    """multipart 요청 본문을 스트리밍으로 읽어 file_field 파일을 folder/{basename}{확장자}에 저장합니다.
+
+    반환값: (폼 필드 dict, IngestedFile 또는 None)
+    파일은 한 번만 디스크에 쓰이고, 메모리는 UPLOAD_WRITE_CHUNK 정도만 사용합니다.
+    """
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise UploadError("multipart/form-data 요청이 아닙니다.")
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes + UPLOAD_FIELD_MAX * 16:
+        # 본문을 읽기 전에 거절합니다.
+        raise UploadTooLarge(f"파일이 너무 큽니다. (최대 {max_bytes} bytes)")
+
+    # 파서 콜백은 동기 함수라서 이벤트를 모아 두었다가 청크마다 처리합니다.
+    events = []
+    header = {"field": b"", "value": b""}
+
+    def on_header_field(data, start, end):
+        header["field"] += data[start:end]
+
+    def on_header_value(data, start, end):
+        header["value"] += data[start:end]
+
+    def on_header_end():
+        events.append(("header", header["field"].lower(), header["value"]))
+        header["field"] = header["value"] = b""
+
+    callbacks = {
+        "on_part_begin": lambda: events.append(("begin",)),
+        "on_part_data": lambda data, start, end: events.append(("data", data[start:end])),
+        "on_part_end": lambda: events.append(("end",)),
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": lambda: events.append(("headers_done",)),
+    }
+    parser = MultipartParser(boundary, callbacks)
+
+    fields = {}
+    result = None
+    part = None
+    field_value = bytearray()
+    out = None              # (파일 객체, 임시 경로, 최종 경로, sha256, 파일 이름)
+    pending = bytearray()
+    size = 0
+    try:
+        async for chunk in request.stream():
+            try:
+                parser.write(chunk)
+            except MultipartParseError as e:
+                raise UploadError(f"multipart 형식 오류: {e}")
+            for event in events:
+                kind = event[0]
+                if kind == "begin":
+                    part = _Part()
+                    field_value.clear()
+                elif kind == "header":
+                    part.headers[event[1]] = event[2]
+                elif kind == "headers_done":
+                    _, disposition = parse_options_header(part.headers.get(b"content-disposition", b""))
+                    part.name = disposition.get(b"name", b"").decode("utf-8")
+                    if b"filename" in disposition:
+                        part.filename = disposition[b"filename"].decode("utf-8")
+                    if part.name == file_field and part.filename is not None:
+                        if out is not None:
+                            raise UploadError(f"'{file_field}' 파일이 두 개 이상입니다.")
+                        extension = os.path.splitext(part.filename)[1]
+                        dest_path = os.path.join(folder, f"{basename}{extension}")
+                        tmp_path = atomic_output_path(dest_path)
+                        f = await run_io(open, tmp_path, "wb")
+                        out = (f, tmp_path, dest_path, hashlib.sha256(), part.filename)
+                elif kind == "data":
+                    if part.name == file_field and out is not None and result is None:
+                        size += len(event[1])
+                        if size > max_bytes:
+                            raise UploadTooLarge(f"파일이 너무 큽니다. (최대 {max_bytes} bytes)")
+                        pending += event[1]
+                        if len(pending) >= UPLOAD_WRITE_CHUNK:
+                            await run_io(_write_chunk, out[0], out[3], bytes(pending))
+                            pending.clear()
+                    elif part.filename is None:
+                        field_value += event[1]
+                        if len(field_value) > UPLOAD_FIELD_MAX:
+                            raise UploadError(f"'{part.name}' 필드가 너무 깁니다.")
+                elif kind == "end":
+                    if part.name == file_field and out is not None and result is None:
+                        f, tmp_path, dest_path, digest, filename = out
+                        if pending:
+                            await run_io(_write_chunk, f, digest, bytes(pending))
+                            pending.clear()
+                        await run_io(_finish_file, f, tmp_path, dest_path)
+                        result = IngestedFile(dest_path, filename, size, digest.hexdigest())
+                    elif part.filename is None:
+                        fields[part.name] = field_value.decode("utf-8")
+                    part = None
+            events.clear()
+        parser.finalize()
+    except BaseException:
+        if out is not None and result is None:
+            await run_io(_discard_file, out[0], out[1])
+        raise
+    if out is not None and result is None:
+        # 본문이 파일 중간에서 끝났습니다.
+        await run_io(_discard_file, out[0], out[1])
+        raise UploadError("업로드가 중간에 끊겼습니다.")
+    return fields, result
@@ -0,0 +1,130 @@
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+from core.database import BASE_DIR
+from models.meeting_tables import UploadSession
+from services.meeting_repository import insert_meeting
+from services.storage import atomic_output_path
+
+# 이어 올리기 업로드: 조각은 회의 폴더 안의 임시 파일(.tmp_audio<확장자>)에 바로 이어 쓰고,
+# finalize 때 audio<확장자>로 이름만 바꿉니다. 현재 offset은 임시 파일의 크기입니다.
+UPLOAD_ROOT = os.path.join(BASE_DIR, "uploaded_files")
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024     # 클라이언트에게 권하는 조각 크기
+UPLOAD_SESSION_TTL = timedelta(hours=int(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24")))
+# 조각을 받던 프로세스가 죽어 receiving으로 남은 세션은 이 시간이 지나면 다른 요청이 가져갑니다.
+UPLOAD_RECEIVE_TIMEOUT = timedelta(seconds=int(os.getenv("UPLOAD_RECEIVE_TIMEOUT_SEC", "600")))
+# 세션 상태: uploading -> (PUT 중) receiving -> uploading ... -> (finalize 중) finalizing -> finalized
+# receiving/finalizing으로 바꾸는 조건부 UPDATE가 세션 잠금입니다. (여러 API 프로세스에서도 한 요청만 성공)
+ACTIVE_STATUSES = ("uploading", "receiving", "finalizing")
+
+
+def audio_path(session: UploadSession) -> str:
+    extension = os.path.splitext(session.filename)[1]
+    return os.path.join(UPLOAD_ROOT, session.directory, f"audio{extension}")
+
+
+def part_path(session: UploadSession) -> str:
+    return atomic_output_path(audio_path(session))
+
+
+def current_offset(session: UploadSession) -> int:
+    """지금까지 받은 바이트 수"""
+    if session.status == "finalized":
+        path = audio_path(session)
+    else:
+        path = part_path(session)
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def session_info(session: UploadSession) -> dict:
+    return {
+        "upload_id": session.id,
+        "directory": session.directory,
+        "status": session.status,
+        "offset": current_offset(session),
+        "size": session.size,
+        "chunk_size": UPLOAD_CHUNK_SIZE,
+    }
+
+
+# --- 파일 작업 (저장소 스레드 풀에서 실행) ---
+def open_part_for_append(path: str, offset: int):
+    """offset 위치부터 이어 쓰도록 임시 파일을 엽니다. (offset 뒤에 남은 바이트는 버림)"""
+    f = open(path, "r+b" if os.path.exists(path) else "wb")
+    f.truncate(offset)
+    f.seek(offset)
+    return f
+
+
+# --- 저장소 작업 (쓰기 스레드에서 실행) ---
+def create_upload_session(db: Session, upload_id: str, directory: str, **fields):
+    db.add(UploadSession(id=upload_id, directory=directory, status="uploading", **fields))
+
+
+def claim_upload_session(db: Session, upload_id: str, status: str) -> bool:
+    """uploading 세션을 status(receiving/finalizing)로 바꿉니다. 다른 요청이 먼저 가져갔으면 False"""
+    now = datetime.now()
+    claimable = or_(
+        UploadSession.status == "uploading",
+        and_(UploadSession.status == "receiving", UploadSession.updated_at < now - UPLOAD_RECEIVE_TIMEOUT),
+    )
+    result = db.execute(
+        update(UploadSession)
+        .where(UploadSession.id == upload_id, claimable)
+        .values(status=status, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def release_upload_session(db: Session, upload_id: str, status: str) -> bool:
+    """claim_upload_session으로 가져간 세션을 다시 uploading으로 돌려놓습니다."""
+    result = db.execute(
+        update(UploadSession)
+        .where(UploadSession.id == upload_id, UploadSession.status == status)
+        .values(status="uploading")
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def finalize_upload_session(db: Session, upload_id: str, sha256: str) -> Optional[UploadSession]:
+    """finalizing으로 가져간 세션을 finalized로 바꾸고 회의 행을 같은 트랜잭션에서 추가합니다."""
+    session = db.get(UploadSession, upload_id)
+    if session is None or session.status != "finalizing":
+        return None
+    session.status = "finalized"
+    session.sha256 = sha256
+    insert_meeting(
+        db,
+        date=session.date,
+        name=session.name,
+        description=session.description,
+        directory=session.directory,
+        is_interested=False,
+        is_ended=True,
+        group_id=session.group_id,
+    )
+    return session
+
+
+def abort_upload_session(db: Session, upload_id: str, statuses: tuple = ("uploading",)) -> Optional[UploadSession]:
+    session = db.get(UploadSession, upload_id)
+    if session is None or session.status not in statuses:
+        return None
+    session.status = "aborted"
+    return session
+
+
+def stale_upload_sessions(db: Session) -> list:
+    """UPLOAD_SESSION_TTL 동안 조각이 들어오지 않은 세션 id 목록 (요청 도중 프로세스가 죽어 남은 세션 포함)"""
+    cutoff = datetime.now() - UPLOAD_SESSION_TTL
+    stale = []
+    for session in db.query(UploadSession).filter(UploadSession.status.in_(ACTIVE_STATUSES), UploadSession.updated_at < cutoff):
+        path = part_path(session)
+        last_write = datetime.fromtimestamp(os.path.getmtime(path)) if os.path.exists(path) else session.created_at
+        if last_write < cutoff:
+            stale.append(session.id)
+    return stale
@@ -0,0 +1,36 @@
+import os
+import sys
+import tempfile
+import pytest
+
+# backend 폴더에서 실행: python -m pytest -q
+# 회의 저장소는 테스트용 임시 SQLite 파일을 씁니다. (core.database를 불러오기 전에 정해야 함)
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+_DB_DIR = tempfile.mkdtemp(prefix="tino-test-")
+os.environ["MEETINGS_DB_URL"] = f"sqlite:///{os.path.join(_DB_DIR, 'meetings.db')}"
+
+from services import meeting_repository  # noqa: E402
+from services.meeting_writer import meeting_writer  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def meeting_store():
+    meeting_repository.MEETINGS_JSON_PATH = os.path.join(_DB_DIR, "meetings.json")
+    meeting_repository.init_meeting_store()
+    meeting_writer.start()
+    yield
+    meeting_writer.stop()
+
+
+@pytest.fixture
+def upload_root(tmp_path, monkeypatch):
+    """uploaded_files 경로를 쓰는 모듈들을 임시 폴더로 돌립니다."""
+    from services import reaper, content_store
+    root = tmp_path / "uploaded_files"
+    root.mkdir()
+    monkeypatch.setattr(meeting_repository, "UPLOAD_ROOT", str(root))
+    monkeypatch.setattr(reaper, "UPLOAD_ROOT", str(root))
+    monkeypatch.setattr(reaper, "TRASH_ROOT", str(root / ".trash"))
+    monkeypatch.setattr(content_store, "CAS_ROOT", str(root / ".cas"))
+    return root
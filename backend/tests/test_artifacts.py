@@ -0,0 +1,24 @@
+import pytest
+from starlette.requests import Request
+from services.artifacts import _accepts_gzip
+
+
+def _request(accept_encoding: str) -> Request:
+    return Request({"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]})
+
+
+@pytest.mark.parametrize("header, expected", [
+    ("gzip, deflate", True),
+    ("br;q=1.0, gzip;q=0.5", True),
+    ("*", True),
+    ("gzip;q=0", False),
+    ("gzip;q=", False),
+    ("gzip;q=abc", False),
+    ("identity", False),
+    ("*;q=0, gzip", True),
+    ("gzip;q=0, *", False),
+    ("*;q=0.5", True),
+    ("", False),
+])
+def test_accepts_gzip(header, expected):
+    assert _accepts_gzip(_request(header)) is expected
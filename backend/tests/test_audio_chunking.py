@@ -0,0 +1,81 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from services import audio_chunking  # noqa: E402
+from services.audio_chunking import find_split_points, stitch_chunks, transcribe_in_chunks  # noqa: E402
+
+
+def _energy(seconds: float, frame_sec: float = 0.1) -> "np.ndarray":
+    """말소리(60dB) 사이사이에 한 프레임짜리 짧은 쉼(20dB)이 있는 에너지 배열"""
+    energy = np.full(int(seconds / frame_sec), 60.0, dtype=np.float32)
+    energy[::10] = 20.0
+    return energy
+
+
+def test_short_recording_is_not_split():
+    assert find_split_points(_energy(140), frame_sec=0.1, target_sec=100, search_sec=20) == []
+
+
+def test_splits_at_long_silence_near_target():
+    energy = _energy(300)
+    energy[971:990] = 20.0      # 97.1~99초
+    energy[2011:2030] = 20.0    # 201.1~203초
+    points = find_split_points(energy, frame_sec=0.1, target_sec=100, search_sec=20)
+    assert points == pytest.approx([98.05, 202.05], abs=0.1)
+
+
+def test_falls_back_to_quietest_frame_without_silence():
+    energy = _energy(300)
+    energy[1035] = 10.0         # 한 프레임뿐이라 침묵 구간은 아니지만 가장 조용한 곳
+    points = find_split_points(energy, frame_sec=0.1, target_sec=100, search_sec=20)
+    assert points[0] == pytest.approx(103.5)
+
+
+def _segment(speaker, start, end):
+    return {"speaker": speaker, "start": start, "end": end, "text": f"{speaker}@{start}"}
+
+
+def test_stitch_matches_speakers_in_overlap():
+    chunks = [
+        (0, 0, 100_000, [_segment("1", 0, 50_000), _segment("2", 50_000, 110_000)]),
+        # 70초부터 자른 두 번째 조각: 앞 30초는 첫 조각과 겹치고, 화자 번호가 다르게 붙음
+        (70_000, 100_000, None, [
+            _segment("1", 0, 35_000),
+            _segment("1", 35_000, 45_000),
+            _segment("2", 45_000, 60_000),
+        ]),
+    ]
+    stitched = stitch_chunks(chunks)
+    assert [(s["speaker"], s["start"], s["end"]) for s in stitched] == [
+        ("1", 0, 50_000),
+        ("2", 50_000, 110_000),
+        ("2", 105_000, 115_000),
+        ("3", 115_000, 130_000),
+    ]
+
+
+def test_retries_chunk_and_ignores_truncated_result(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_chunking, "probe_duration", lambda path: 2000.0)
+    monkeypatch.setattr(audio_chunking, "frame_energies", lambda path: np.zeros(1))
+    monkeypatch.setattr(audio_chunking, "find_split_points", lambda energy: [1000.0])
+    monkeypatch.setattr(audio_chunking, "cut_chunk", lambda src, start, end, out: open(out, "wb").close())
+    monkeypatch.setattr(audio_chunking, "CHUNK_RETRY_BASE_SEC", 0.0)
+
+    work_dir = tmp_path / "chunks"
+    work_dir.mkdir()
+    # 예전 버전이 쓰다 만 첫 조각 결과
+    (work_dir / "chunk_000_0_1000000.json").write_text('{"segments": [{"spea')
+
+    calls = []
+
+    def transcribe(chunk_path):
+        calls.append(chunk_path)
+        if len(calls) == 1:
+            raise RuntimeError("일시적인 STT 오류")
+        return {"segments": [_segment("1", 40_000, 41_000)], "text": ""}
+
+    payload = transcribe_in_chunks("audio.mp3", str(work_dir), transcribe, parallelism=1)
+    assert len(calls) == 3
+    assert [s["start"] for s in payload["segments"]] == [40_000, 1_010_000]
+    assert not work_dir.exists()
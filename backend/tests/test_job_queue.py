@@ -0,0 +1,86 @@
+import sqlite3
+import uuid
+from datetime import datetime, timedelta
+import pytest
+from core.database import MEETINGS_DB_URL
+from models.meeting_tables import Job
+from services.job_queue import _claim_job, get_job
+from services.meeting_writer import meeting_writer
+from services import json_codec
+from core.database import MeetingSessionLocal
+
+WORKER = "testhost:1:aaaaaaaa"
+
+
+def _add_running_job(db, kind: str, attempts: int, lease_sec: float) -> int:
+    job = Job(
+        kind=kind, payload="{}", status="running", attempts=attempts, max_attempts=3,
+        locked_until=datetime.now() + timedelta(seconds=lease_sec), worker_id="otherhost:42:bbbbbbbb",
+    )
+    db.add(job)
+    db.flush()
+    return job.id
+
+
+def _job(job_id: int) -> dict:
+    db = MeetingSessionLocal()
+    try:
+        return get_job(db, job_id)
+    finally:
+        db.close()
+
+
+def test_expired_lease_is_reclaimed_while_attempts_remain():
+    job_id = meeting_writer.run(_add_running_job, "lease-retry", 1, -1)
+    claimed = meeting_writer.run(_claim_job, WORKER, ["lease-retry"], 60)
+    assert claimed[0] == job_id and claimed[3] == 2
+
+
+def test_expired_lease_without_attempts_left_fails():
+    job_id = meeting_writer.run(_add_running_job, "lease-exhausted", 3, -1)
+    live_id = meeting_writer.run(_add_running_job, "lease-exhausted", 3, 600)
+    assert meeting_writer.run(_claim_job, WORKER, ["lease-exhausted"], 60) is None
+    assert _job(job_id)["status"] == "failed"
+    assert _job(job_id)["finished_at"] is not None
+    # 하트비트가 살아 있는 작업은 그대로 둡니다.
+    assert _job(live_id)["status"] == "running"
+
+
+@pytest.mark.skipif(not MEETINGS_DB_URL.startswith("sqlite"), reason="SQLite 전용")
+def test_writer_holds_write_lock_from_first_read():
+    """다른 프로세스의 쓰기가 쓰기 스레드의 읽기와 쓰기 사이에 끼어들지 못해야 합니다."""
+    path = MEETINGS_DB_URL[len("sqlite:///"):]
+
+    def read_then_write(db):
+        db.query(Job.id).first()
+        other = sqlite3.connect(path, timeout=0.1)
+        try:
+            with pytest.raises(sqlite3.OperationalError):
+                other.execute("INSERT INTO jobs (kind, payload, status, attempts, max_attempts, run_after) "
+                              "VALUES ('other', '{}', 'done', 0, 1, CURRENT_TIMESTAMP)")
+                other.commit()
+        finally:
+            other.close()
+        db.add(Job(kind="writer", payload="{}", status="done", max_attempts=1))
+
+    meeting_writer.run(read_then_write)
+
+
+def test_job_status_serializes_without_orjson(monkeypatch):
+    monkeypatch.setattr(json_codec, "orjson", None)
+    job_id = meeting_writer.run(_add_running_job, "lease-json", 1, 600)
+    job = json_codec.loads(json_codec.dumps(_job(job_id)))
+    assert job["status"] == "running"
+    assert datetime.fromisoformat(job["created_at"]) <= datetime.now()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_codec_rejects_unknown_types(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_codec, "orjson", None)
+    value = uuid.UUID("12345678-1234-5678-1234-567812345678")
+    assert json_codec.loads(json_codec.dumps({"id": value})) == {"id": str(value)}
+    with pytest.raises(TypeError):
+        json_codec.dumps({"value": object()})
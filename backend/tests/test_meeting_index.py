@@ -0,0 +1,84 @@
+import json
+import threading
+from services.meeting_index import MeetingIndex
+from services.meeting_repository import insert_meeting, update_meeting
+from services.meeting_writer import meeting_writer
+
+
+def _names(payload: bytes, date: str) -> dict:
+    return {m["directory"]: m["name"] for m in json.loads(payload).get(date, [])}
+
+
+def test_payload_follows_writes_and_is_reused_between_them():
+    index = MeetingIndex()
+    date = "2031-05-01"
+    meeting_writer.run(insert_meeting, date, "첫 회의", "설명", "20310501_000000_idx01")
+    assert _names(index.get_payload(), date) == {"20310501_000000_idx01": "첫 회의"}
+
+    first = index.get_payload()
+    assert index.get_payload() is first     # 바뀐 게 없으면 만들어 둔 바이트를 그대로
+
+    meeting_writer.run(update_meeting, "20310501_000000_idx01", name="이름 변경")
+    meeting_writer.run(insert_meeting, date, "둘째 회의", "설명", "20310501_000000_idx02")
+    assert _names(index.get_payload(), date) == {
+        "20310501_000000_idx01": "이름 변경",
+        "20310501_000000_idx02": "둘째 회의",
+    }
+    assert index.reloads == 1
+
+
+def test_concurrent_readers_see_every_committed_write():
+    index = MeetingIndex()
+    date = "2031-05-02"
+    index.get_payload()
+    stop = threading.Event()
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            try:
+                json.loads(index.get_payload())
+            except Exception as e:
+                errors.append(e)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for t in readers:
+        t.start()
+    try:
+        for i in range(20):
+            directory = f"20310502_000000_c{i:03d}"
+            meeting_writer.run(insert_meeting, date, f"회의 {i}", "설명", directory)
+            assert directory in _names(index.get_payload(), date)
+    finally:
+        stop.set()
+        for t in readers:
+            t.join()
+    assert errors == []
+    assert index.reloads == 1
+
+
+def test_missing_group_view_takes_the_lock():
+    index = MeetingIndex()
+    index.get_payload()
+    group_id = 987654
+    # 잠금 없는 경로는 없는 묶음을 빈 목록으로 단정하지 않습니다.
+    assert index._cached_payload(group_id, index._seq) is None
+    assert index.get_payload(group_id) == b"{}"
+
+
+def test_hit_and_miss_counts_add_up_under_concurrency():
+    index = MeetingIndex()
+    index.get_payload()
+    calls = 200
+
+    def read():
+        for _ in range(calls):
+            index.get_payload()
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for t in readers:
+        t.start()
+    for t in readers:
+        t.join()
+    stats = index.stats()
+    assert stats["hits"] + stats["misses"] == 1 + 4 * calls
@@ -0,0 +1,73 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import api.meetings as meetings_api
+from core.database import MeetingSessionLocal
+from services.meeting_repository import get_meeting_by_directory, insert_meeting
+from services.meeting_writer import meeting_writer
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(meetings_api.router, prefix="/api")
+    return TestClient(app)
+
+
+def _meeting(directory: str) -> str:
+    meeting_writer.run(insert_meeting, "2025-01-01", "회의", "설명", directory)
+    return directory
+
+
+def _record(directory: str):
+    db = MeetingSessionLocal()
+    try:
+        return get_meeting_by_directory(db, directory)
+    finally:
+        db.close()
+
+
+def test_bulk_update_renames_without_moving_folder(client):
+    directory = _meeting("20250101_000000_bulk01")
+    response = client.patch("/api/meetings/bulk", json={"items": [{"directory": directory, "name": "새 이름"}]})
+    assert response.status_code == 200
+    assert response.json()["updated"] == 1
+    record = _record(directory)
+    assert record.name == "새 이름"
+    assert record.description == "설명"
+
+
+def test_bulk_update_rejects_empty_name(client):
+    directory = _meeting("20250101_000000_bulk02")
+    response = client.patch("/api/meetings/bulk", json={"items": [{"directory": directory, "name": ""}]})
+    assert response.status_code == 422
+    assert _record(directory).name == "회의"
+
+
+def test_update_interested(client):
+    directory = _meeting("20250101_000000_fav01")
+    response = client.patch("/api/meetings/interested", json={"directory": directory, "is_interested": True})
+    assert response.status_code == 200
+    assert _record(directory).is_interested is True
+
+
+@pytest.mark.parametrize("suffix, fields", [
+    ("fav02", {}),
+    ("fav03", {"is_interested": None}),
+    ("fav04", {"is_interested": "maybe"}),
+])
+def test_update_interested_rejects_invalid_status(client, suffix, fields):
+    directory = _meeting(f"20250101_000000_{suffix}")
+    response = client.patch("/api/meetings/interested", json={"directory": directory, **fields})
+    assert response.status_code == 422
+    assert _record(directory).is_interested is False
+
+
+def test_update_interested_requires_directory(client):
+    response = client.patch("/api/meetings/interested", json={"is_interested": True})
+    assert response.status_code == 422
+
+
+def test_update_interested_unknown_meeting(client):
+    response = client.patch("/api/meetings/interested", json={"directory": "20250101_000000_none00", "is_interested": True})
+    assert response.status_code == 404
@@ -0,0 +1,94 @@
+import os
+import pytest
+import services.reaper as reaper_module
+from services import content_store
+from services.reaper import DirectoryReaper, move_to_trash
+from services.content_store import store_audio, collect_garbage, content_lock, blob_dir, file_sha256
+
+SIZE = 40 * 1024 * 1024     # REAPER_TRUNCATE_STEP보다 커서 잘라 가며 지우는 경로를 탐
+
+
+def _meeting_with_audio(root, directory: str, data: bytes) -> str:
+    folder = root / directory
+    folder.mkdir()
+    path = folder / "audio.mp3"
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_reaping_one_meeting_keeps_shared_audio(upload_root):
+    data = os.urandom(1024) * (SIZE // 1024)
+    first = _meeting_with_audio(upload_root, "m1", data)
+    second = _meeting_with_audio(upload_root, "m2", data)
+    sha256 = file_sha256(first)
+    assert store_audio(first, sha256) is False
+    assert store_audio(second, sha256) is True
+    blob = os.path.join(blob_dir(sha256), "audio")
+    assert os.stat(blob).st_nlink == 3
+
+    trash_path = move_to_trash("m1")
+    reclaimed = DirectoryReaper(bytes_per_sec=1 << 40, files_per_sec=1 << 20)._remove_file(
+        os.path.join(trash_path, "audio.mp3")
+    )
+
+    assert reclaimed == 0
+    assert os.path.getsize(second) == SIZE
+    assert os.path.getsize(blob) == SIZE
+    assert file_sha256(second) == sha256
+    assert os.stat(blob).st_nlink == 2
+
+
+def test_reaping_last_meeting_frees_shared_audio(upload_root, monkeypatch):
+    data = os.urandom(1024) * (SIZE // 1024)
+    first = _meeting_with_audio(upload_root, "m1", data)
+    second = _meeting_with_audio(upload_root, "m2", data)
+    sha256 = file_sha256(first)
+    store_audio(first, sha256)
+    store_audio(second, sha256)
+    finished = []
+    monkeypatch.setattr(reaper_module, "_finish_job", lambda db, job_id, reclaimed, files, error: finished.append((job_id, reclaimed, error)))
+    reaper = DirectoryReaper(bytes_per_sec=1 << 40, files_per_sec=1 << 20)
+
+    reaper._reap(1, "m1", move_to_trash("m1"))
+    assert os.path.getsize(os.path.join(blob_dir(sha256), "audio")) == SIZE
+    reaper._reap(2, "m2", move_to_trash("m2"))
+
+    # 두 번째 회의가 마지막 링크였으므로 녹음 바이트가 그 작업의 해제량에 들어갑니다.
+    assert finished == [(1, 0, None), (2, SIZE, None)]
+    assert not os.path.exists(blob_dir(sha256))
+
+
+def test_garbage_collected_only_after_last_meeting_link(upload_root):
+    path = _meeting_with_audio(upload_root, "m1", b"audio bytes")
+    sha256 = file_sha256(path)
+    store_audio(path, sha256)
+
+    assert collect_garbage() == (0, 0)
+    # .trash에서 삭제를 기다리는 회의도 링크를 가지고 있으므로 남겨 둡니다.
+    trash_path = move_to_trash("m1")
+    assert collect_garbage() == (0, 0)
+    os.unlink(os.path.join(trash_path, "audio.mp3"))
+    assert collect_garbage() == (1, len(b"audio bytes"))
+    assert not os.path.exists(blob_dir(sha256))
+    assert os.listdir(os.path.dirname(blob_dir(sha256))) == []
+
+
+def test_store_directories_are_never_trashed(upload_root):
+    path = _meeting_with_audio(upload_root, "m1", b"audio bytes")
+    store_audio(path, file_sha256(path))
+    assert move_to_trash(".cas") is None
+    assert move_to_trash(".trash") is None
+    assert os.path.isdir(upload_root / ".cas")
+
+
+@pytest.mark.parametrize("use_flock", [True, False])
+def test_content_lock_is_exclusive_and_leaves_nothing_behind(upload_root, monkeypatch, use_flock):
+    if not use_flock:
+        monkeypatch.setattr(content_store, "fcntl", None)
+    sha256 = "ab" * 32
+    with content_lock(sha256):
+        with content_store._file_lock(content_store._lock_path(sha256, "stt.lock"), blocking=False) as acquired:
+            assert acquired is False
+    with content_store._file_lock(content_store._lock_path(sha256, "stt.lock"), blocking=False) as acquired:
+        assert acquired is True
+    assert content_store._local_locks == {}
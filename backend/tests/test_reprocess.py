@@ -0,0 +1,96 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import api.meetings as meetings_api
+import services.transcription_service as transcription
+from services.artifacts import read_json_artifact, write_json_artifact
+from services.checkpoints import load_checkpoints, record_checkpoint, transcript_hash
+from services.meeting_writer import meeting_writer
+from services.summarize_text import SummaryError
+
+SEGMENTS = [{"text": "안녕하세요"}, {"text": "회의를 시작합니다"}]
+
+
+@pytest.fixture
+def client(upload_root, monkeypatch):
+    monkeypatch.setattr(meetings_api, "BASE_DIR", str(upload_root.parent))
+    jobs = []
+
+    async def submit_job_async(kind, payload):
+        jobs.append(payload)
+        return len(jobs)
+
+    monkeypatch.setattr(meetings_api, "submit_job_async", submit_job_async)
+    monkeypatch.setattr(transcription, "save_summary_as_pdf", lambda summary, path: open(path, "w").write(summary))
+    monkeypatch.setattr(transcription, "send_pdf_complete_notification_via_http", lambda: None)
+    app = FastAPI()
+    app.include_router(meetings_api.router, prefix="/api")
+    test_client = TestClient(app)
+    test_client.jobs = jobs
+    return test_client
+
+
+def _live_meeting(upload_root, directory: str):
+    """녹음 파일 없이 실시간 전사본만 있는 회의"""
+    folder = upload_root / directory
+    folder.mkdir()
+    write_json_artifact(str(folder), "result.json", {"segments": SEGMENTS})
+    meeting_writer.run(record_checkpoint, directory, "transcript", "done", None, transcript_hash(SEGMENTS))
+    return folder
+
+
+def test_resummarize_meeting_without_audio(client, upload_root, monkeypatch):
+    directory = "20250101_000000_live01"
+    _live_meeting(upload_root, directory)
+    summaries = []
+
+    def summarize_text(text, mode="기본", custom_prompt=None):
+        summaries.append(mode)
+        return f"요약({mode})"
+
+    def no_stt(*args):
+        raise AssertionError("STT를 다시 부르면 안 됩니다.")
+
+    monkeypatch.setattr(transcription, "summarize_text", summarize_text)
+    monkeypatch.setattr(transcription, "_transcribe_audio", no_stt)
+
+    response = client.post(f"/api/reprocess/{directory}", json={"summary_mode": "사용자 지정", "custom_prompt": "짧게"})
+    assert response.status_code == 200
+    assert response.json()["stages"] == ["summary", "pdf"]
+    payload = client.jobs[-1]
+    assert payload["audio_sha256"] is None
+
+    transcription.run_transcribe_job(**payload)
+
+    assert summaries == ["사용자 지정"]
+    checkpoints = load_checkpoints(directory)
+    assert {stage: cp["status"] for stage, cp in checkpoints.items()} == {"transcript": "done", "summary": "done", "pdf": "done"}
+    assert client.post(f"/api/reprocess/{directory}").json()["stages"] == []
+
+
+def test_transcript_rerun_without_audio_is_rejected(client, upload_root):
+    directory = "20250101_000000_live02"
+    _live_meeting(upload_root, directory)
+    response = client.post(f"/api/reprocess/{directory}", json={"force": ["transcript"]})
+    assert response.status_code == 409
+    assert client.jobs == []
+
+
+def test_failed_summary_keeps_previous_summary(client, upload_root, monkeypatch):
+    directory = "20250101_000000_live03"
+    folder = _live_meeting(upload_root, directory)
+    write_json_artifact(str(folder), "summary.json", {"summary": "이전 요약"})
+
+    def summarize_text(text, mode="기본", custom_prompt=None):
+        raise SummaryError("요약 실패: 시간 초과")
+
+    monkeypatch.setattr(transcription, "summarize_text", summarize_text)
+    client.post(f"/api/reprocess/{directory}", json={"force": ["summary"]})
+
+    with pytest.raises(SummaryError):
+        transcription.run_transcribe_job(**client.jobs[-1])
+
+    assert read_json_artifact(str(folder), "summary.json") == {"summary": "이전 요약"}
+    summary = load_checkpoints(directory)["summary"]
+    assert summary["status"] == "failed"
+    assert summary["error"] == "요약 실패: 시간 초과"
@@ -0,0 +1,31 @@
+from core.database import MeetingSessionLocal
+from services.meeting_repository import insert_meeting
+from services.meeting_writer import meeting_writer
+from services.rollups import UNKNOWN_SPEAKER, query_rollups, set_meeting_speakers
+
+
+def _rollups(**kwargs) -> dict:
+    db = MeetingSessionLocal()
+    try:
+        return query_rollups(db, **kwargs)
+    finally:
+        db.close()
+
+
+def test_empty_speaker_labels_do_not_collide_with_meeting_total():
+    directory = "20320105_000000_roll01"
+    meeting_writer.run(insert_meeting, "2032-01-05", "회의", "설명", directory)
+    speakers = {
+        "A": {"talk_time": 3000, "segments": 2, "turns": 1},
+        None: {"talk_time": 1000, "segments": 1, "turns": 1},
+        "": {"talk_time": 500, "segments": 1, "turns": 1},
+    }
+    assert meeting_writer.run(set_meeting_speakers, directory, speakers)
+
+    result = _rollups(grain="day", date_from="2032-01-05", date_to="2032-01-05")
+    (period,) = result["periods"]
+    assert period["meetings"] == 1
+    assert period["talk_time_ms"] == 4500
+    assert set(period["speakers"]) == {"A", UNKNOWN_SPEAKER}
+    assert period["speakers"][UNKNOWN_SPEAKER]["talk_time_ms"] == 1500
+    assert period["speakers"][UNKNOWN_SPEAKER]["meetings"] == 1
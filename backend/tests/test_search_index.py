@@ -0,0 +1,37 @@
+from core.database import MeetingSessionLocal
+from services import search_index
+from services.meeting_repository import insert_meeting
+from services.meeting_writer import meeting_writer
+from services.search_index import build_documents, replace_meeting_in_index, search
+
+
+def _search(query: str):
+    db = MeetingSessionLocal()
+    try:
+        return search(db, query, limit=10)
+    finally:
+        db.close()
+
+
+def _index(directory: str, texts: list):
+    meeting_writer.run(insert_meeting, "2033-01-01", "검색 회의", "설명", directory)
+    segments = [{"text": text, "start": i * 1000, "end": i * 1000 + 500, "speaker": 1} for i, text in enumerate(texts)]
+    meeting_writer.run(replace_meeting_in_index, directory, build_documents(segments, None))
+
+
+def test_common_term_keeps_highest_tf_candidates_and_reports_truncation(monkeypatch):
+    # 같은 bigram이 1~4번 나오는 세그먼트 (tf가 클수록 먼저 후보가 됨)
+    _index("20330101_000000_srch01", ["퀘퉤 " * n for n in range(1, 5)])
+    monkeypatch.setattr(search_index, "SEARCH_MAX_CANDIDATES", 2)
+
+    hits, truncated = _search("퀘퉤")
+
+    assert truncated is True
+    assert sorted(hit["seg_index"] for hit in hits) == [2, 3]
+
+
+def test_rare_term_is_not_truncated():
+    _index("20330101_000000_srch02", ["뛟뛟 회의", "다른 이야기"])
+    hits, truncated = _search("뛟뛟")
+    assert truncated is False
+    assert [hit["seg_index"] for hit in hits] == [0]
@@ -0,0 +1,32 @@
+import os
+from services import speaker_stats
+from services.artifacts import write_json_artifact
+from services.speaker_stats import load_speaker_stats, write_speaker_stats
+
+SEGMENTS = [
+    {"speaker": 1, "start": 0, "end": 3000, "text": "안녕하세요"},
+    {"speaker": 2, "start": 3000, "end": 4000, "text": "네"},
+]
+
+
+def test_stale_stats_are_computed_without_writing(tmp_path, monkeypatch):
+    def no_writes(*args, **kwargs):
+        raise AssertionError("조회에서 저장소에 쓰면 안 됩니다.")
+
+    monkeypatch.setattr(speaker_stats.meeting_writer, "run", no_writes)
+    folder = str(tmp_path)
+    write_json_artifact(folder, "result.json", {"segments": SEGMENTS})
+
+    stats = load_speaker_stats(folder)
+
+    assert stats["ratios"] == {1: 75.0, 2: 25.0}
+    assert not os.path.exists(os.path.join(folder, "stats.json"))
+
+
+def test_pipeline_stats_are_served_from_file(tmp_path):
+    folder = str(tmp_path)
+    write_json_artifact(folder, "result.json", {"segments": SEGMENTS})
+    write_speaker_stats(folder, SEGMENTS)
+    assert os.path.exists(os.path.join(folder, "stats.json"))
+    # 파일에서 읽은 값은 JSON이라 화자 키가 문자열입니다.
+    assert load_speaker_stats(folder)["ratios"] == {"1": 75.0, "2": 25.0}
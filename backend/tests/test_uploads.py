@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+import api.uploads as uploads_api
+from core.database import MeetingSessionLocal
+from models.meeting_tables import UploadSession
+from services import upload_sessions
+from services.meeting_writer import meeting_writer
+from services.upload_sessions import claim_upload_session, release_upload_session
+
+
+@pytest.fixture
+def client(upload_root, monkeypatch):
+    monkeypatch.setattr(uploads_api, "UPLOAD_ROOT", str(upload_root))
+    monkeypatch.setattr(upload_sessions, "UPLOAD_ROOT", str(upload_root))
+    app = FastAPI()
+    app.include_router(uploads_api.router, prefix="/api")
+    return TestClient(app)
+
+
+def _create(client, data: bytes) -> str:
+    response = client.post("/api/uploads", json={
+        "filename": "meeting.mp3",
+        "size": len(data),
+        "name": "회의",
+        "description": "",
+        "date": "2025-01-01",
+        "summary_mode": "default",
+    })
+    assert response.status_code == 200
+    upload_id = response.json()["upload_id"]
+    assert client.put(f"/api/uploads/{upload_id}?offset=0", content=data).status_code == 200
+    return upload_id
+
+
+def _status(upload_id: str) -> str:
+    db = MeetingSessionLocal()
+    try:
+        return db.get(UploadSession, upload_id).status
+    finally:
+        db.close()
+
+
+def test_finalize_waits_for_db_claim(client, upload_root):
+    upload_id = _create(client, b"abc" * 100)
+    # 다른 프로세스가 조각을 받는 중인 것처럼 세션을 가져갑니다.
+    assert meeting_writer.run(claim_upload_session, upload_id, "receiving")
+    assert not meeting_writer.run(claim_upload_session, upload_id, "finalizing")
+
+    response = client.post(f"/api/uploads/{upload_id}/finalize")
+    assert response.status_code == 409
+    assert _status(upload_id) == "receiving"
+    assert not list(upload_root.glob("*/audio.mp3"))
+
+    assert meeting_writer.run(release_upload_session, upload_id, "receiving")
+    response = client.post(f"/api/uploads/{upload_id}/finalize")
+    assert response.status_code == 200
+    assert response.json()["size"] == 300
+    assert _status(upload_id) == "finalized"
+    assert list(upload_root.glob("*/audio.mp3"))
+
+
+def test_incomplete_finalize_releases_claim(client):
+    upload_id = _create(client, b"abc")
+    # 선언한 크기보다 적게 받은 세션
+    meeting_writer.run(lambda db: db.execute(update(UploadSession).where(UploadSession.id == upload_id).values(size=10)))
+    response = client.post(f"/api/uploads/{upload_id}/finalize")
+    assert response.status_code == 409
+    assert response.json()["detail"]["offset"] == 3
+    assert _status(upload_id) == "uploading"
+
+
+def test_stale_receiving_claim_can_be_taken_over(client):
+    upload_id = _create(client, b"abc")
+    assert meeting_writer.run(claim_upload_session, upload_id, "receiving")
+    assert not meeting_writer.run(claim_upload_session, upload_id, "receiving")
+
+    expired = datetime.now() - upload_sessions.UPLOAD_RECEIVE_TIMEOUT - timedelta(seconds=1)
+    meeting_writer.run(lambda db: db.execute(update(UploadSession).where(UploadSession.id == upload_id).values(updated_at=expired)))
+    assert meeting_writer.run(claim_upload_session, upload_id, "receiving")
@@ -0,0 +1,35 @@
+"""전사/요약 작업 전용 워커 프로세스
+
+사용법 (backend 폴더에서): JOB_WORKERS=4 python worker.py
+API 서버를 JOB_EMBEDDED_WORKERS=0 으로 띄우면 API는 작업을 대기열에 넣기만 하고 실행은 이 프로세스가 맡습니다.
+"""
+import signal
+import threading
+from services.meeting_repository import init_meeting_store
+from services.meeting_writer import meeting_writer
+from services.job_queue import job_workers
+from services.http_clients import http_clients
+import services.transcription_service  # "transcribe" 작업 핸들러 등록
+
+
+def main():
+    init_meeting_store()
+    meeting_writer.start()
+    http_clients.start()
+    job_workers.start()
+    print(f"🛠️ 작업 워커 시작: {job_workers.worker_id} (동시 실행 {job_workers.concurrency}개)")
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+    while not stop.wait(1):
+        pass
+
+    print("🛑 작업 워커 종료 중...")
+    job_workers.stop()
+    http_clients.stop()
+    meeting_writer.stop()
+
+
+if __name__ == "__main__":
+    main()